@@ -0,0 +1,133 @@
+"""
+In-process buffer that batches LogEntry writes to the analytics database.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from analytics import rollups
+from analytics.models import LogEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    """
+    Queue of unsaved LogEntry rows, written with one bulk INSERT once the buffer
+    holds max_size entries or its oldest entry is flush_interval seconds old.
+
+    A max_size of 1 writes every add synchronously; a flush_interval of 0 starts
+    no timer. Limits left as None follow the ANALYTICS_LOG_BUFFER_SIZE and
+    ANALYTICS_LOG_FLUSH_INTERVAL settings at the time of each add.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, flush_interval: Optional[float] = None):
+        self._max_size = max_size
+        self._flush_interval = flush_interval
+        self.reset()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return getattr(settings, 'ANALYTICS_LOG_BUFFER_SIZE', 100)
+
+    @property
+    def flush_interval(self) -> float:
+        if self._flush_interval is not None:
+            return self._flush_interval
+        return getattr(settings, 'ANALYTICS_LOG_FLUSH_INTERVAL', 5.0)
+
+    def reset(self) -> None:
+        """
+        Drop queued entries and start with a fresh lock and no pending timer.
+
+        Runs in forked children: the parent still owns and flushes the entries it queued.
+        """
+        self._entries: List[LogEntry] = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def add(self, entries: Iterable[LogEntry]) -> None:
+        with self._lock:
+            self._entries.extend(entries)
+            full = len(self._entries) >= self.max_size
+
+            if not full and self._timer is None and self.flush_interval:
+                self._timer = threading.Timer(self.flush_interval, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all queued entries.
+
+        Returns:
+            int: Number of entries written.
+        """
+        with self._lock:
+            entries, self._entries = self._entries, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not entries:
+            return 0
+
+        try:
+            LogEntry.objects.bulk_create(entries, batch_size=500)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(entries)} log entries: {str(e)}")
+            return 0
+
+        # Rollups are derived data and can be rebuilt from the log, so never fail the flush over them
+        try:
+            rollups.record_entries(entries)
+        except Exception as e:
+            logger.error(f"Failed to update log rollups for {len(entries)} entries: {str(e)}")
+
+        logger.debug(f"Flushed {len(entries)} log entries")
+        return len(entries)
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # Timer threads are short-lived; don't leave their connections open
+            connections.close_all()
+
+
+log_buffer = LogBuffer()
+
+
+def flush_log_buffer(**kwargs) -> int:
+    """
+    Flush the process-wide buffer. Accepts signal keyword arguments.
+    """
+    return log_buffer.flush()
+
+
+def register_flush_hooks() -> None:
+    """
+    Make sure queued entries are written before the process goes away.
+
+    Celery pool children may exit without running atexit handlers, so the
+    worker shutdown signals flush as well.
+    """
+    from celery.signals import worker_process_shutdown, worker_shutdown
+
+    atexit.register(flush_log_buffer)
+    worker_process_shutdown.connect(flush_log_buffer, weak=False)
+    worker_shutdown.connect(flush_log_buffer, weak=False)
+
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=log_buffer.reset)
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from analytics import partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintain the monthly partitions of the analytics log on MySQL: create upcoming months "
+        "and archive or drop months past the retention period. Meant to run daily, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3,
+                            help="Number of future months to keep partitions for.")
+        parser.add_argument('--retention-months', type=int,
+                            default=getattr(settings, 'ANALYTICS_LOG_RETENTION_MONTHS', 12),
+                            help="Months of log entries to keep.")
+        parser.add_argument('--archive-dir', default=getattr(settings, 'ANALYTICS_LOG_ARCHIVE_DIR', None),
+                            help="Write expired partitions to gzipped JSON Lines files here before dropping them.")
+        parser.add_argument('--drop-expired', action='store_true',
+                            help="Drop expired partitions. Without this flag they are only listed.")
+
+    def handle(self, *args, **options):
+        if not partitions.is_supported():
+            raise CommandError("Log partitioning is only available on MySQL.")
+        if not any(partition.end is None for partition in partitions.list_partitions()):
+            raise CommandError("The log table is not partitioned; run the analytics migrations first.")
+
+        created = partitions.ensure_partitions(options['months_ahead'])
+        if created:
+            self.stdout.write(f"Created partitions: {', '.join(created)}")
+
+        for partition in partitions.expired_partitions(options['retention_months']):
+            if not options['drop_expired']:
+                self.stdout.write(f"Expired: {partition.name} (~{partition.rows} rows)")
+                continue
+
+            if options['archive_dir']:
+                path = partitions.archive_partition(partition, options['archive_dir'])
+                self.stdout.write(f"Archived {partition.name} to {path}")
+
+            partitions.drop_partition(partition)
+            self.stdout.write(f"Dropped {partition.name}")
+
+        self.stdout.write(self.style.SUCCESS("Log partitions are up to date"))
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from analytics import rollups
+
+
+def parse_day(value):
+    day = parse_date(value)
+    if day is None:
+        raise CommandError(f"Invalid date: {value} (expected YYYY-MM-DD)")
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+class Command(BaseCommand):
+    help = "Recompute the hourly and daily log rollups from the raw log entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--since', help="First day to rebuild (YYYY-MM-DD). Defaults to the start of the log.")
+        parser.add_argument('--until', help="Day after the last one to rebuild (YYYY-MM-DD). Defaults to the end of the log.")
+
+    def handle(self, *args, **options):
+        since = parse_day(options['since']) if options['since'] else None
+        until = parse_day(options['until']) if options['until'] else None
+
+        written = rollups.rebuild(since, until)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} log rollup rows"))
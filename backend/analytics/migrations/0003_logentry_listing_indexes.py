@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_logentry_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['timestamp', 'id'], name='logentry_ts_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['user_id', 'timestamp', 'id'], name='logentry_user_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['action', 'timestamp', 'id'], name='logentry_action_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['object_type', 'timestamp', 'id'], name='logentry_objtype_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_logentry_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket', models.DateTimeField()),
+                ('action', models.CharField(choices=[('parse', 'Resume parsed'), ('analyze', 'Resume analyzed'), ('error', 'Error occurred'), ('upload', 'Resume uploaded'), ('register', 'User registered'), ('apply', 'Job application submitted'), ('create_job', 'Job created')], max_length=20)),
+                ('object_type', models.CharField(max_length=50)),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'analytics_logrollup',
+                'unique_together': {('period', 'bucket', 'action', 'object_type')},
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2 on 2026-10-17 12:00
+
+from datetime import datetime, timezone
+
+from django.db import migrations
+
+TABLE = 'analytics_logentry'
+MONTHS_AHEAD = 3
+
+
+def add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_logentry(apps, schema_editor):
+    """
+    Partition the log table by month on MySQL, from the oldest entry's month to a
+    few months ahead, plus an empty MAXVALUE catch-all that manage_log_partitions
+    keeps splitting. Other databases are left unpartitioned.
+    """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(timestamp) FROM {TABLE}")
+        oldest = cursor.fetchone()[0]
+
+    # Timestamps are stored as naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    month = (oldest or now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last = add_months(now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), MONTHS_AHEAD)
+
+    definitions = []
+    while month <= last:
+        definitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d %H:%M:%S}')"
+        )
+        month = add_months(month, 1)
+    definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+
+    # MySQL requires the partitioning column in every unique key, including the primary key.
+    # id stays unique on its own (UUID4) and remains the primary key as far as Django is concerned.
+    schema_editor.execute(f"ALTER TABLE {TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+    schema_editor.execute(f"ALTER TABLE {TABLE} PARTITION BY RANGE COLUMNS(timestamp) ({', '.join(definitions)})")
+
+
+def unpartition_logentry(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} REMOVE PARTITIONING")
+    schema_editor.execute(f"ALTER TABLE {TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_logrollup'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='logentry',
+            options={},
+        ),
+        migrations.RunPython(partition_logentry, unpartition_logentry),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 import uuid
 
 class LogEntry(models.Model):
@@ -12,7 +13,8 @@ class LogEntry(models.Model):
         CREATE_JOB = 'create_job', 'Job created'
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the entry is created, not when the log buffer writes it
+    timestamp = models.DateTimeField(default=timezone.now)
 
     user_id = models.IntegerField(null=True, blank=True)
     object_type = models.CharField(max_length=50)
@@ -22,7 +24,39 @@ class LogEntry(models.Model):
 
     class Meta:
         db_table = 'analytics_logentry'
-        ordering = ['-timestamp']
+        # No default ordering: queries say how they sort, so none pays for an unrequested table-wide sort.
+        # On MySQL the table is partitioned by month on timestamp (see analytics.partitions).
+        # Every listing is ordered by (timestamp, id); each filter gets an index that
+        # leads on the filtered column and then serves that order without a sort
+        indexes = [
+            models.Index(fields=['timestamp', 'id'], name='logentry_ts_id_idx'),
+            models.Index(fields=['user_id', 'timestamp', 'id'], name='logentry_user_ts_idx'),
+            models.Index(fields=['action', 'timestamp', 'id'], name='logentry_action_ts_idx'),
+            models.Index(fields=['object_type', 'timestamp', 'id'], name='logentry_objtype_ts_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.timestamp} [{self.action}] - {self.object_type} ({self.object_id})"
\ No newline at end of file
+        return f"{self.timestamp} [{self.action}] - {self.object_type} ({self.object_id})"
+
+class LogRollup(models.Model):
+    """
+    Number of log entries per action and object type in one hour or day.
+    Maintained incrementally as the log buffer flushes, so stats never scan LogEntry.
+    """
+    class Period(models.TextChoices):
+        HOUR = 'hour', 'Hour'
+        DAY = 'day', 'Day'
+
+    period = models.CharField(max_length=4, choices=Period.choices)
+    bucket = models.DateTimeField()  # Start of the hour or day, UTC
+    action = models.CharField(max_length=20, choices=LogEntry.ActionType.choices)
+    object_type = models.CharField(max_length=50)
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'analytics_logrollup'
+        # Leading on (period, bucket) so a time-range read is one index range scan
+        unique_together = ('period', 'bucket', 'action', 'object_type')
+
+    def __str__(self):
+        return f"{self.period} {self.bucket} [{self.action}] {self.object_type}: {self.count}"
@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class LogEntryCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the log, newest first.
+
+    Each page is an index range scan starting at the cursor position, so the
+    cost does not grow with how deep into the log the client has paged.
+    """
+    ordering = ('-timestamp', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
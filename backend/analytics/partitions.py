@@ -0,0 +1,184 @@
+"""
+Monthly RANGE partitioning of the analytics log table on MySQL.
+
+Each partition holds one calendar month (UTC) of log entries. Queries with a
+timestamp range only read the months they cover, and expired months are
+removed with DROP PARTITION, a metadata change, instead of a table-locking DELETE.
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timezone as dt_timezone
+from typing import List, NamedTuple, Optional
+
+from django.db import connections, router
+from django.db.models import Q
+from django.utils import timezone
+
+from analytics.models import LogEntry
+
+logger = logging.getLogger(__name__)
+
+TABLE = LogEntry._meta.db_table
+CATCH_ALL = 'pmax'
+ARCHIVE_FIELDS = ('id', 'timestamp', 'user_id', 'object_type', 'object_id', 'action', 'message')
+
+
+class Partition(NamedTuple):
+    """
+    A partition of the log table covering [start, end). start is None for the
+    oldest partition and end is None for the MAXVALUE catch-all.
+    """
+    name: str
+    start: Optional[datetime]
+    end: Optional[datetime]
+    rows: int
+
+
+def get_connection():
+    return connections[router.db_for_write(LogEntry)]
+
+
+def is_supported() -> bool:
+    return get_connection().vendor == 'mysql'
+
+
+def month_start(value: datetime) -> datetime:
+    value = value.astimezone(dt_timezone.utc) if timezone.is_aware(value) else value.replace(tzinfo=dt_timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_definition(month: datetime) -> str:
+    """
+    DDL for the partition holding the month starting at `month`.
+    """
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d %H:%M:%S}')"
+
+
+def list_partitions() -> List[Partition]:
+    """
+    Partitions of the log table in range order, as reported by information_schema.
+    """
+    with get_connection().cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION",
+            [TABLE]
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    start = None
+    for name, description, table_rows in rows:
+        end = None
+        if description != 'MAXVALUE':
+            end = datetime.strptime(description.strip("'"), '%Y-%m-%d %H:%M:%S').replace(tzinfo=dt_timezone.utc)
+        partitions.append(Partition(name, start, end, table_rows or 0))
+        start = end
+    return partitions
+
+
+def ensure_partitions(months_ahead: int = 3) -> List[str]:
+    """
+    Split monthly partitions off the catch-all up to `months_ahead` months from now.
+
+    The catch-all is meant to stay empty, so reorganizing it does not copy rows.
+    Months missed since the last run are created as well, keeping one partition per month.
+
+    Returns:
+        List[str]: Names of the partitions created.
+    """
+    bounded = [partition for partition in list_partitions() if partition.end is not None]
+    current = month_start(timezone.now())
+    month = bounded[-1].end if bounded else current
+    last = add_months(current, months_ahead)
+
+    months = []
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+
+    if not months:
+        return []
+
+    definitions = ", ".join(partition_definition(month) for month in months)
+    with get_connection().cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {TABLE} REORGANIZE PARTITION {CATCH_ALL} INTO "
+            f"({definitions}, PARTITION {CATCH_ALL} VALUES LESS THAN (MAXVALUE))"
+        )
+
+    names = [partition_name(month) for month in months]
+    logger.info(f"Created log partitions {', '.join(names)}")
+    return names
+
+
+def expired_partitions(retention_months: int) -> List[Partition]:
+    """
+    Partitions whose whole range is older than the retention period.
+    """
+    cutoff = add_months(month_start(timezone.now()), -retention_months)
+    return [
+        partition for partition in list_partitions()
+        if partition.end is not None and partition.end <= cutoff
+    ]
+
+
+def archive_partition(partition: Partition, directory: str, chunk_size: int = 5000) -> str:
+    """
+    Write the rows of a partition to a gzipped JSON Lines file.
+
+    Rows are read in (timestamp, id) keyset chunks bounded by the partition's
+    range, so each query is pruned to that partition and memory stays flat.
+
+    Returns:
+        str: Path of the archive file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{TABLE}-{partition.name}.jsonl.gz")
+    partial_path = f"{path}.partial"
+
+    queryset = LogEntry.objects.filter(timestamp__lt=partition.end).order_by('timestamp', 'id')
+    if partition.start is not None:
+        queryset = queryset.filter(timestamp__gte=partition.start)
+
+    written = 0
+    last = None
+    with gzip.open(partial_path, 'wt', encoding='utf-8') as archive:
+        while True:
+            chunk = queryset
+            if last is not None:
+                chunk = chunk.filter(
+                    Q(timestamp__gt=last['timestamp']) | Q(timestamp=last['timestamp'], id__gt=last['id'])
+                )
+            rows = list(chunk.values(*ARCHIVE_FIELDS)[:chunk_size])
+            if not rows:
+                break
+
+            for row in rows:
+                archive.write(json.dumps(row, default=str) + "\n")
+            written += len(rows)
+            last = rows[-1]
+
+    # Only a complete archive gets the final name, so a crash never leaves a truncated file behind
+    os.replace(partial_path, path)
+    logger.info(f"Archived {written} log entries of partition {partition.name} to {path}")
+    return path
+
+
+def drop_partition(partition: Partition) -> None:
+    with get_connection().cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} DROP PARTITION {partition.name}")
+    logger.info(f"Dropped log partition {partition.name}")
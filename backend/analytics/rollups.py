@@ -0,0 +1,113 @@
+"""
+Incremental hourly and daily counts of log entries.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from typing import Iterable, Optional
+
+from django.db import IntegrityError, router, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDay, TruncHour
+
+from analytics.models import LogEntry, LogRollup
+
+logger = logging.getLogger(__name__)
+
+TRUNCATE_FUNCTIONS = {
+    LogRollup.Period.HOUR: TruncHour,
+    LogRollup.Period.DAY: TruncDay,
+}
+
+
+def truncate(timestamp: datetime, period: str) -> datetime:
+    """
+    Start of the UTC hour or day containing the timestamp.
+    """
+    bucket = timestamp.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+    if period == LogRollup.Period.DAY:
+        bucket = bucket.replace(hour=0)
+    return bucket
+
+
+def count_entries(entries: Iterable[LogEntry]) -> Counter:
+    """
+    Count entries per (period, bucket, action, object_type) for every rollup period.
+    """
+    counts = Counter()
+    for entry in entries:
+        for period in LogRollup.Period.values:
+            counts[(period, truncate(entry.timestamp, period), entry.action, entry.object_type)] += 1
+    return counts
+
+
+def record_entries(entries: Iterable[LogEntry]) -> int:
+    """
+    Add freshly written log entries to the rollups.
+
+    Each affected row is incremented in the database with F(), so concurrent
+    flushes from different processes never overwrite each other's counts.
+
+    Returns:
+        int: Number of rollup rows touched.
+    """
+    counts = count_entries(entries)
+    db = router.db_for_write(LogRollup)
+
+    for (period, bucket, action, object_type), count in counts.items():
+        key = dict(period=period, bucket=bucket, action=action, object_type=object_type)
+
+        if LogRollup.objects.using(db).filter(**key).update(count=F('count') + count):
+            continue
+        try:
+            with transaction.atomic(using=db):
+                LogRollup.objects.using(db).create(count=count, **key)
+        except IntegrityError:
+            # Another process created the row first
+            LogRollup.objects.using(db).filter(**key).update(count=F('count') + count)
+
+    return len(counts)
+
+
+def rebuild(since: Optional[datetime] = None, until: Optional[datetime] = None) -> int:
+    """
+    Recompute the rollups from LogEntry for whole days in [since, until).
+
+    Meant for backfills and repairs; it scans the log in that range once per period.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    db = router.db_for_write(LogRollup)
+    entries = LogEntry.objects.using(db).order_by()
+    rollups = LogRollup.objects.using(db)
+
+    if since is not None:
+        since = truncate(since, LogRollup.Period.DAY)
+        entries = entries.filter(timestamp__gte=since)
+        rollups = rollups.filter(bucket__gte=since)
+    if until is not None:
+        until = truncate(until, LogRollup.Period.DAY)
+        entries = entries.filter(timestamp__lt=until)
+        rollups = rollups.filter(bucket__lt=until)
+
+    written = 0
+    with transaction.atomic(using=db):
+        rollups.delete()
+
+        for period, truncate_function in TRUNCATE_FUNCTIONS.items():
+            rows = (
+                entries
+                .annotate(bucket=truncate_function('timestamp', tzinfo=dt_timezone.utc))
+                .values('bucket', 'action', 'object_type')
+                .annotate(count=Count('id'))
+            )
+            created = LogRollup.objects.using(db).bulk_create(
+                [LogRollup(period=period, **row) for row in rows],
+                batch_size=1000,
+            )
+            written += len(created)
+
+    logger.info(f"Rebuilt {written} log rollup rows")
+    return written
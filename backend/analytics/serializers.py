@@ -1,5 +1,8 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
-from analytics.models import LogEntry
+from analytics.models import LogEntry, LogRollup
 
 
 class LogEntrySerializer(serializers.ModelSerializer):
@@ -13,4 +16,60 @@ class LogEntrySerializer(serializers.ModelSerializer):
             'object_id',
             'action',
             'message',
-        ]
\ No newline at end of file
+        ]
+
+
+class LogEntryFilterSerializer(serializers.Serializer):
+    """
+    Query parameters accepted by the log listing.
+    """
+    action = serializers.ChoiceField(choices=LogEntry.ActionType.choices, required=False)
+    object_type = serializers.CharField(max_length=50, required=False)
+    user_id = serializers.IntegerField(required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    days = serializers.IntegerField(min_value=1, required=False)
+
+    def validate(self, attrs):
+        # A relative window; bounded listings only read the partitions of recent months on MySQL
+        days = attrs.pop('days', None)
+        if days is not None and 'since' not in attrs:
+            attrs['since'] = attrs.get('until', timezone.now()) - timedelta(days=days)
+
+        if 'since' in attrs and 'until' in attrs and attrs['since'] > attrs['until']:
+            raise serializers.ValidationError("'since' must be earlier than 'until'.")
+        return attrs
+
+
+class LogStatsQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the stats endpoint. Fills in the default time window
+    and caps its length so a request reads a bounded number of rollup rows.
+    """
+    DEFAULT_WINDOWS = {
+        LogRollup.Period.HOUR: timedelta(hours=48),
+        LogRollup.Period.DAY: timedelta(days=30),
+    }
+    MAX_WINDOWS = {
+        LogRollup.Period.HOUR: timedelta(days=31),
+        LogRollup.Period.DAY: timedelta(days=366),
+    }
+
+    period = serializers.ChoiceField(choices=LogRollup.Period.choices, default=LogRollup.Period.DAY)
+    action = serializers.ChoiceField(choices=LogEntry.ActionType.choices, required=False)
+    object_type = serializers.CharField(max_length=50, required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        period = attrs['period']
+        attrs.setdefault('until', timezone.now())
+        attrs.setdefault('since', attrs['until'] - self.DEFAULT_WINDOWS[period])
+
+        if attrs['since'] > attrs['until']:
+            raise serializers.ValidationError("'since' must be earlier than 'until'.")
+        if attrs['until'] - attrs['since'] > self.MAX_WINDOWS[period]:
+            raise serializers.ValidationError(
+                f"The time range for {period} stats is limited to {self.MAX_WINDOWS[period].days} days."
+            )
+        return attrs
@@ -1,3 +1,177 @@
-from django.test import TestCase
+from datetime import datetime, timedelta, timezone as dt_timezone
 
-# Create your tests here.
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from analytics import partitions, rollups
+from analytics.buffer import LogBuffer
+from analytics.models import LogEntry, LogRollup
+from users.models import User
+
+
+class LogBufferTests(TestCase):
+    databases = {'default', 'mysql'}
+
+    def _entry(self, message):
+        return LogEntry(object_type='resume', action=LogEntry.ActionType.PARSE, message=message)
+
+    def test_entries_written_once_buffer_is_full(self):
+        """Test that entries are queued until the size threshold, then written in one batch"""
+        buffer = LogBuffer(max_size=3, flush_interval=0)
+
+        buffer.add([self._entry('one'), self._entry('two')])
+        self.assertEqual(LogEntry.objects.count(), 0)
+
+        with CaptureQueriesContext(connections['mysql']) as queries:
+            buffer.add([self._entry('three')])
+        self.assertEqual(LogEntry.objects.count(), 3)
+        inserts = [q for q in queries if q['sql'].startswith('INSERT') and 'analytics_logentry' in q['sql']]
+        self.assertEqual(len(inserts), 1)
+
+    def test_flush_writes_partial_buffer(self):
+        """Test that an explicit flush (as on worker shutdown) writes whatever is queued"""
+        buffer = LogBuffer(max_size=100, flush_interval=0)
+        buffer.add([self._entry('one')])
+
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(LogEntry.objects.get().message, 'one')
+
+    @override_settings(ANALYTICS_LOG_BUFFER_SIZE=1, ANALYTICS_LOG_FLUSH_INTERVAL=0)
+    def test_buffer_size_of_one_writes_synchronously(self):
+        """Test that the settings can turn buffering off, as the test runner does, without starting a timer"""
+        buffer = LogBuffer()
+        buffer.add([self._entry('one')])
+
+        self.assertIsNone(buffer._timer)
+        self.assertEqual(LogEntry.objects.get().message, 'one')
+
+
+class LogEntryListAPITests(APITestCase):
+    databases = {'default', 'mysql'}
+
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            password='password123',
+            role='admin',
+            is_email_verified=True
+        )
+        now = timezone.now()
+        LogEntry.objects.bulk_create([
+            LogEntry(
+                timestamp=now - timedelta(minutes=i), user_id=self.admin.id, object_type='resume',
+                action=LogEntry.ActionType.PARSE if i % 2 else LogEntry.ActionType.ERROR, message=f'entry {i}',
+            )
+            for i in range(6)
+        ])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_list_is_cursor_paginated_newest_first(self):
+        """Test that pages follow the cursor and never repeat or skip entries"""
+        messages = []
+        url = reverse('logs-list') + '?page_size=4'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            messages += [entry['message'] for entry in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(messages, [f'entry {i}' for i in range(6)])
+
+    def test_list_filters_by_action_and_time(self):
+        """Test that action and time range filters narrow the listing"""
+        since = (timezone.now() - timedelta(minutes=3, seconds=30)).isoformat()
+        response = self.client.get(reverse('logs-list'), {'action': LogEntry.ActionType.PARSE, 'since': since})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['message'] for entry in response.data['results']], ['entry 1', 'entry 3'])
+
+    def test_list_window_only_applies_when_requested(self):
+        """Test that old entries are listed unless the request asks for a recent window"""
+        old = LogEntry.objects.create(
+            timestamp=timezone.now() - timedelta(days=365), user_id=self.admin.id, object_type='resume',
+            action=LogEntry.ActionType.PARSE, message='last year',
+        )
+
+        response = self.client.get(reverse('logs-list'), {'page_size': 10})
+        self.assertIn(str(old.id), [entry['id'] for entry in response.data['results']])
+
+        response = self.client.get(reverse('logs-list'), {'days': 90, 'page_size': 10})
+        self.assertNotIn(str(old.id), [entry['id'] for entry in response.data['results']])
+        self.assertEqual(len(response.data['results']), 6)
+
+    def test_list_rejects_invalid_filters(self):
+        """Test that malformed filter values are a 400, not a full table scan"""
+        response = self.client.get(reverse('logs-list'), {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LogRollupTests(APITestCase):
+    databases = {'default', 'mysql'}
+
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            password='password123',
+            role='admin',
+            is_email_verified=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _flush(self, *actions):
+        buffer = LogBuffer(max_size=100, flush_interval=0)
+        buffer.add([LogEntry(object_type='resume', action=action, message='') for action in actions])
+        buffer.flush()
+
+    def test_flushes_increment_rollups(self):
+        """Test that each flush adds its entries to the hourly and daily counts"""
+        self._flush(LogEntry.ActionType.PARSE, LogEntry.ActionType.PARSE, LogEntry.ActionType.ERROR)
+        self._flush(LogEntry.ActionType.PARSE)
+
+        for period in LogRollup.Period.values:
+            counts = dict(LogRollup.objects.filter(period=period).values_list('action', 'count'))
+            self.assertEqual(counts, {LogEntry.ActionType.PARSE: 3, LogEntry.ActionType.ERROR: 1})
+
+    def test_rebuild_matches_incremental_counts(self):
+        """Test that rebuilding from the raw log reproduces the incremental rollups"""
+        self._flush(LogEntry.ActionType.PARSE, LogEntry.ActionType.ERROR, LogEntry.ActionType.PARSE)
+        incremental = set(LogRollup.objects.values_list('period', 'bucket', 'action', 'object_type', 'count'))
+
+        rollups.rebuild()
+        self.assertEqual(set(LogRollup.objects.values_list('period', 'bucket', 'action', 'object_type', 'count')),
+                         incremental)
+
+    def test_stats_reads_rollups(self):
+        """Test that the stats endpoint returns per-bucket counts and totals by action"""
+        self._flush(LogEntry.ActionType.PARSE, LogEntry.ActionType.PARSE, LogEntry.ActionType.ERROR)
+
+        response = self.client.get(reverse('log-stats'), {'period': 'hour'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['totals'], {'parse': 2, 'error': 1})
+        self.assertEqual(len(response.data['data']['buckets']), 2)
+
+
+class LogPartitionTests(TestCase):
+    def test_partition_definitions_cover_calendar_months(self):
+        """Test that monthly partitions roll over years and bound each month by the next one"""
+        december = datetime(2026, 12, 1, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(partitions.add_months(december, 1), datetime(2027, 1, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(partitions.add_months(december, -12), datetime(2025, 12, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual(
+            partitions.partition_definition(december),
+            "PARTITION p202612 VALUES LESS THAN ('2027-01-01 00:00:00')"
+        )
+        self.assertEqual(
+            partitions.month_start(datetime(2026, 10, 17, 13, 5, tzinfo=dt_timezone.utc)),
+            datetime(2026, 10, 1, tzinfo=dt_timezone.utc)
+        )
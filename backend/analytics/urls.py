@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from analytics.views import LogEntryViewSet
+from analytics.views import LogEntryViewSet, LogStatsView
 
 router = DefaultRouter()
 router.register(r'logs', LogEntryViewSet, basename='logs')
 
 urlpatterns = [
+    path('stats/', LogStatsView.as_view(), name='log-stats'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
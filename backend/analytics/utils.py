@@ -1,5 +1,6 @@
 import uuid
 import logging
+from analytics.buffer import log_buffer
 from analytics.models import LogEntry
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,10 @@ def log_action(
         message: str = ""
 ):
     """
-    Create a log entry for an action performed by a user on an object.
+    Queue a log entry for an action performed by a user on an object.
+
+    Entries are written in batches by the analytics log buffer, so a call only
+    reaches the analytics database when it fills the buffer.
 
     Args:
         user: Django User instance (optional).
@@ -30,14 +34,31 @@ def log_action(
             else:
                 logger.warning(f"User object passed to log_action without id: {user}")
 
-        LogEntry.objects.create(
+        log_buffer.add([LogEntry(
             user_id=user_id,
             object_type=object_type,
             object_id=object_id,
             action=action,
             message=message,
-        )
+        )])
         logger.info(f"Action logged: {action} for {object_type} {object_id} by user {user_id}")
 
     except Exception as e:
-        logger.error(f"Failed to log action: {str(e)}")
\ No newline at end of file
+        logger.error(f"Failed to log action: {str(e)}")
+
+
+def log_actions(entries):
+    """
+    Queue many log entries at once; they are written with batched INSERTs.
+
+    Args:
+        entries (Iterable[dict]): Keyword arguments for LogEntry
+            (user_id, object_type, object_id, action, message).
+    """
+    try:
+        log_entries = [LogEntry(**entry) for entry in entries]
+        log_buffer.add(log_entries)
+        logger.info(f"Logged {len(log_entries)} actions in bulk")
+
+    except Exception as e:
+        logger.error(f"Failed to log actions in bulk: {str(e)}")
@@ -1,10 +1,15 @@
+from collections import Counter
+
 from rest_framework import viewsets, permissions
+from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from analytics.models import LogEntry
-from analytics.serializers import LogEntrySerializer
-from core.permissions import IsLogOwnerOrAdmin
+from analytics.models import LogEntry, LogRollup
+from analytics.pagination import LogEntryCursorPagination
+from analytics.rollups import truncate
+from analytics.serializers import LogEntrySerializer, LogEntryFilterSerializer, LogStatsQuerySerializer
+from core.permissions import IsLogOwnerOrAdmin, IsAdminUser
 from core.mixins.response import BaseResponseMixin
 from core.serializers.response import SuccessResponseSerializer, ErrorResponseSerializer
 
@@ -14,6 +19,15 @@ common_tags = ['Logs']
 @extend_schema_view(
     list=extend_schema(
         tags=common_tags,
+        parameters=[
+            OpenApiParameter(name='action', type=OpenApiTypes.STR, enum=LogEntry.ActionType.values),
+            OpenApiParameter(name='object_type', type=OpenApiTypes.STR),
+            OpenApiParameter(name='user_id', type=OpenApiTypes.INT, description='Admins only'),
+            OpenApiParameter(name='since', type=OpenApiTypes.DATETIME, description='Inclusive lower bound'),
+            OpenApiParameter(name='until', type=OpenApiTypes.DATETIME, description='Exclusive upper bound'),
+            OpenApiParameter(name='days', type=OpenApiTypes.INT,
+                             description='Only the last N days before until (or now); ignored when since is given'),
+        ],
         responses={
             200: SuccessResponseSerializer,
             400: ErrorResponseSerializer,
@@ -42,11 +56,12 @@ class LogEntryViewSet(BaseResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for retrieving user log entries.
 
-    - List all logs: GET /api/logs/
+    - List all logs: GET /api/logs/ (cursor paginated, newest first)
     - Retrieve single log: GET /api/logs/{id}/
     """
     serializer_class = LogEntrySerializer
     permission_classes = [permissions.IsAuthenticated, IsLogOwnerOrAdmin]
+    pagination_class = LogEntryCursorPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -54,12 +69,92 @@ class LogEntryViewSet(BaseResponseMixin, viewsets.ReadOnlyModelViewSet):
             return LogEntry.objects.all()
         return LogEntry.objects.filter(user_id=user.id)
 
+    def filter_queryset(self, queryset):
+        if self.action != 'list':
+            return queryset
+
+        filters = LogEntryFilterSerializer(data=self.request.query_params)
+        filters.is_valid(raise_exception=True)
+        params = filters.validated_data
+
+        if 'action' in params:
+            queryset = queryset.filter(action=params['action'])
+        if 'object_type' in params:
+            queryset = queryset.filter(object_type=params['object_type'])
+        if 'user_id' in params and self.request.user.is_admin:
+            queryset = queryset.filter(user_id=params['user_id'])
+        if 'since' in params:
+            queryset = queryset.filter(timestamp__gte=params['since'])
+        if 'until' in params:
+            queryset = queryset.filter(timestamp__lt=params['until'])
+        return queryset
+
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return self.success(serializer.data)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        return self.success(serializer.data)
\ No newline at end of file
+        return self.success(serializer.data)
+
+
+@extend_schema(
+    tags=common_tags,
+    parameters=[
+        OpenApiParameter(name='period', type=OpenApiTypes.STR, enum=LogRollup.Period.values),
+        OpenApiParameter(name='action', type=OpenApiTypes.STR, enum=LogEntry.ActionType.values),
+        OpenApiParameter(name='object_type', type=OpenApiTypes.STR),
+        OpenApiParameter(name='since', type=OpenApiTypes.DATETIME, description='Defaults to 48 hours or 30 days ago'),
+        OpenApiParameter(name='until', type=OpenApiTypes.DATETIME, description='Defaults to now'),
+    ],
+    responses={
+        200: SuccessResponseSerializer,
+        400: ErrorResponseSerializer,
+        401: ErrorResponseSerializer,
+        403: ErrorResponseSerializer,
+        500: ErrorResponseSerializer,
+    }
+)
+class LogStatsView(BaseResponseMixin, APIView):
+    """
+    Log entry counts per hour or day, by action and object type.
+
+    - GET /api/analytics/stats/
+
+    Reads only the pre-aggregated rollups, never the raw log.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        query = LogStatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        period = params['period']
+
+        rollups = LogRollup.objects.filter(
+            period=period,
+            bucket__gte=truncate(params['since'], period),
+            bucket__lt=params['until'],
+        )
+        if 'action' in params:
+            rollups = rollups.filter(action=params['action'])
+        if 'object_type' in params:
+            rollups = rollups.filter(object_type=params['object_type'])
+
+        buckets = list(
+            rollups.order_by('bucket', 'action', 'object_type').values('bucket', 'action', 'object_type', 'count')
+        )
+        totals = Counter()
+        for row in buckets:
+            totals[row['action']] += row['count']
+
+        return self.success({
+            'period': period,
+            'since': params['since'],
+            'until': params['until'],
+            'totals': dict(totals),
+            'buckets': buckets,
+        })
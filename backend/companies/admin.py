@@ -1,4 +1,5 @@
 from django.contrib import admin
+from jobs.services.access_service import RecruiterAccessService
 from .models import Company
 
 
@@ -10,4 +11,21 @@ class CompanyAdmin(admin.ModelAdmin):
     filter_horizontal = ('recruiters',)
     ordering = ('name',)
 
-    readonly_fields = ('created_at', 'updated_at')
\ No newline at end of file
+    readonly_fields = ('created_at', 'updated_at')
+
+    def save_related(self, request, form, formsets, change):
+        # Recruiters added or removed here gain or lose access to the company's applied resumes
+        previous = set(form.instance.recruiters.values_list('id', flat=True)) if change else set()
+        super().save_related(request, form, formsets, change)
+        current = set(form.instance.recruiters.values_list('id', flat=True))
+        RecruiterAccessService.invalidate_for_recruiters(previous ^ current)
+
+    def delete_model(self, request, obj):
+        recruiter_ids = list(obj.recruiters.values_list('id', flat=True))
+        super().delete_model(request, obj)
+        RecruiterAccessService.invalidate_for_recruiters(recruiter_ids)
+
+    def delete_queryset(self, request, queryset):
+        recruiter_ids = list(queryset.values_list('recruiters', flat=True))
+        super().delete_queryset(request, queryset)
+        RecruiterAccessService.invalidate_for_recruiters(recruiter_ids)
@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
@@ -91,3 +91,53 @@ class CompanyAPITests(APITestCase):
         
         # Check response status is not found
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_membership_changes_invalidate_recruiter_resume_access(self):
+        """Test that joining or leaving a company drops the recruiter's cached resume access"""
+        from django.core.cache import cache
+        from core.cache import namespaced_key
+        from jobs.services.access_service import RecruiterAccessService
+
+        new_recruiter = User.objects.create_user(
+            email='recruiter2@example.com',
+            password='password123',
+            role='recruiter',
+            is_email_verified=True
+        )
+        admin = User.objects.create_superuser(email='admin@example.com', password='password123')
+        namespace = RecruiterAccessService.namespace(new_recruiter.id)
+
+        # Joining through the API
+        cache.set(namespaced_key(namespace, 'resume'), False)
+        self.client.force_authenticate(user=new_recruiter)
+        response = self.client.post(reverse('company-add-recruiter', args=[self.company.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(namespaced_key(namespace, 'resume')))
+
+        # Being removed in the admin
+        cache.set(namespaced_key(namespace, 'resume'), True)
+        self.client.force_login(admin)
+        response = self.client.post(reverse('admin:companies_company_change', args=[self.company.id]), {
+            'name': self.company.name,
+            'description': self.company.description,
+            'website': self.company.website,
+            'recruiters': [self.recruiter.id],
+        })
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertFalse(self.company.recruiters.filter(id=new_recruiter.id).exists())
+        self.assertIsNone(cache.get(namespaced_key(namespace, 'resume')))
+
+    @override_settings(ALLOWED_HOSTS=['a.example.com', 'b.example.com'])
+    def test_company_list_cached_per_host(self):
+        """Test that the cached pagination links point at the host the list was requested on"""
+        from django.core.cache import cache
+
+        cache.clear()
+        for i in range(10):
+            Company.objects.create(name=f'Company {i}')
+        self.client.force_authenticate(user=self.job_seeker)
+
+        for host in ('a.example.com', 'b.example.com'):
+            response = self.client.get(reverse('company-list'), HTTP_HOST=host)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data['next'].startswith(f'http://{host}/'))
@@ -3,8 +3,15 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema_view, extend_schema
 
+from django.conf import settings
+from django.db.models import Prefetch
+
 from companies.models import Company
+from jobs.services.access_service import RecruiterAccessService
+from core.cache import APPROVED_JOBS_NAMESPACE, COMPANIES_NAMESPACE, get_or_set, invalidate_namespace, namespaced_key
 from companies.serializers import CompanySerializer, CompanyCreateSerializer
+from users.models import User
+from users.serializers import UserSerializer
 
 common_tags = ['Companies']
 
@@ -29,15 +36,60 @@ class CompanyViewSet(viewsets.ModelViewSet):
     queryset = Company.objects.all()
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        queryset = Company.objects.all()
+        if self.get_serializer_class() is CompanySerializer:
+            # CompanySerializer nests every recruiter; load them for the whole page in one query
+            queryset = queryset.prefetch_related(Prefetch(
+                'recruiters', queryset=User.objects.only(*UserSerializer.Meta.fields)
+            ))
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return CompanyCreateSerializer
         return CompanySerializer
 
+    def cached_response(self, request, view, *args, **kwargs):
+        """
+        Company pages are the same for every user, so list and detail responses are cached per URL.
+        The host is part of the key because the pagination links are absolute.
+        """
+        data = get_or_set(
+            namespaced_key(COMPANIES_NAMESPACE, request.build_absolute_uri()),
+            lambda: view(request, *args, **kwargs).data,
+            settings.COMPANY_CACHE_TIMEOUT,
+        )
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    @staticmethod
+    def invalidate_cache():
+        invalidate_namespace(COMPANIES_NAMESPACE)
+        # Job listings nest the company
+        invalidate_namespace(APPROVED_JOBS_NAMESPACE)
+
     def perform_create(self, serializer):
         company = serializer.save()
         # Automatically add the creator as a recruiter
         company.recruiters.add(self.request.user)
+        self.invalidate_cache()
+
+    def perform_update(self, serializer):
+        serializer.save()
+        self.invalidate_cache()
+
+    def perform_destroy(self, instance):
+        # The company's jobs and applications go with it; read the recruiters before they are unlinked
+        recruiter_ids = list(instance.recruiters.values_list('id', flat=True))
+        instance.delete()
+        RecruiterAccessService.invalidate_for_recruiters(recruiter_ids)
+        self.invalidate_cache()
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def add_recruiter(self, request, pk=None):
@@ -47,6 +99,9 @@ class CompanyViewSet(viewsets.ModelViewSet):
         company = self.get_object()
         recruiter = request.user
         company.recruiters.add(recruiter)
+        # The recruiter can now see resumes applied to this company's jobs
+        RecruiterAccessService.invalidate_for_recruiters([recruiter.id])
+        self.invalidate_cache()
         return Response({'detail': 'Recruiter added successfully.'}, status=status.HTTP_200_OK)
         
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated], url_path='my-company')
@@ -60,7 +115,7 @@ class CompanyViewSet(viewsets.ModelViewSet):
         
         try:
             # Get the first company the recruiter is associated with
-            company = request.user.companies.first()
+            company = self.get_queryset().filter(recruiters=request.user).first()
             
             if not company:
                 return Response({'detail': 'No company found for this recruiter.'}, 
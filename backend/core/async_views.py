@@ -0,0 +1,56 @@
+"""
+Async dispatch for DRF views served under ASGI.
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db import connections, transaction
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers may be coroutines; DRF's own dispatch is sync only.
+
+    The request goes through APIView's pipeline unchanged: initial() (content
+    negotiation, authentication, permissions, throttling), handle_exception()
+    with the configured EXCEPTION_HANDLER, and finalize_response() with the
+    configured renderers. The steps that may touch the database run through
+    sync_to_async; only the handler itself is awaited on the event loop.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Django can't wrap async views in ATOMIC_REQUESTS transactions and refuses to serve them
+        for alias in connections:
+            view = transaction.non_atomic_requests(using=alias)(view)
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def acheck_object_permissions(self, request, obj):
+        await sync_to_async(self.check_object_permissions)(request, obj)
@@ -0,0 +1,61 @@
+"""
+Helpers for the Redis-backed response cache.
+
+Responses that vary by query string (pages, filters) are grouped in a namespace.
+Every key embeds the namespace's current version, so bumping the version
+invalidates the whole namespace at once; orphaned entries expire with their TTL.
+"""
+
+import hashlib
+import time
+from typing import Callable
+
+from django.core.cache import cache
+
+# Namespaces of cached API responses
+APPROVED_JOBS_NAMESPACE = 'jobs:approved'
+COMPANIES_NAMESPACE = 'companies'
+
+# Version keys are never expired; a fresh timestamp can't collide with an older version if one is evicted
+VERSION_TIMEOUT = None
+
+
+def version_key(namespace: str) -> str:
+    return f"{namespace}:version"
+
+
+def get_namespace_version(namespace: str) -> int:
+    version = cache.get(version_key(namespace))
+    if version is None:
+        version = time.time_ns()
+        # add() keeps the version another process may have set in the meantime
+        if not cache.add(version_key(namespace), version, VERSION_TIMEOUT):
+            version = cache.get(version_key(namespace)) or version
+    return version
+
+
+def invalidate_namespace(namespace: str) -> None:
+    """
+    Orphan every response cached under the namespace.
+    """
+    cache.set(version_key(namespace), time.time_ns(), VERSION_TIMEOUT)
+
+
+def namespaced_key(namespace: str, *parts) -> str:
+    """
+    Cache key for the current version of a namespace; long parts such as full paths are hashed.
+    """
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f"{namespace}:{get_namespace_version(namespace)}:{digest}"
+
+
+def get_or_set(key: str, compute: Callable, timeout: int):
+    """
+    Return the cached value of key, computing and caching it on a miss. None results are not cached.
+    """
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        if value is not None:
+            cache.set(key, value, timeout)
+    return value
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone as dt_timezone
+from typing import Optional, Tuple
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    Mixin adding ETag / Last-Modified validators to views serving MongoDB documents
+    stamped with updated_at, so clients revalidate with a 304 instead of re-downloading.
+    """
+
+    @staticmethod
+    def document_validators(document: Optional[dict]) -> Tuple[Optional[str], Optional[datetime]]:
+        """
+        ETag and last modification time of a document; (None, None) if it was never stamped.
+        """
+        updated_at = document.get('updated_at') if document else None
+        if updated_at is None:
+            return None, None
+
+        # pymongo returns naive UTC datetimes
+        if timezone.is_naive(updated_at):
+            updated_at = updated_at.replace(tzinfo=dt_timezone.utc)
+        return f'"{document["_id"]}-{int(updated_at.timestamp() * 1000)}"', updated_at
+
+    def not_modified(self, request, document: Optional[dict]):
+        """
+        A 304 response if the client's copy of the document is current, otherwise None.
+
+        Only the _id and updated_at fields of the document are read, so a projection is enough.
+        """
+        etag, last_modified = self.document_validators(document)
+        if etag is None:
+            return None
+
+        response = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+        if response is not None:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def add_validators(self, response, document: dict):
+        etag, last_modified = self.document_validators(document)
+        if etag is not None:
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        # Clients may store the document, but must revalidate it before every use
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -3,38 +3,76 @@ MongoDB connection utility for centralized and efficient access using pymongo.
 Production-ready version.
 """
 
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
 from bson.codec_options import UuidRepresentation
 from django.conf import settings
+import asyncio
+import logging
 import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def get_client_options() -> dict:
+    """
+    Connection options shared by the sync and async clients.
+    """
+    return {
+        'host': getattr(settings, 'MONGODB_URI', os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/')),
+        'ssl': getattr(settings, 'MONGODB_SSL', False),
+        'uuidRepresentation': 'standard',
+        'serverSelectionTimeoutMS': 5000,  # Fail fast if server not reachable
+        'maxPoolSize': getattr(settings, 'MONGODB_MAX_POOL_SIZE', 100),
+        'minPoolSize': getattr(settings, 'MONGODB_MIN_POOL_SIZE', 0),
+        'maxIdleTimeMS': getattr(settings, 'MONGODB_MAX_IDLE_TIME_MS', None),
+        'compressors': getattr(settings, 'MONGODB_COMPRESSORS', None) or None,
+        'connect': False,
+    }
+
+
+def get_db_name() -> str:
+    return getattr(settings, 'MONGODB_DB', os.environ.get('MONGODB_DB', 'resume_ai_mongodb'))
 
 
 class MongoDBClient:
     """
-    Singleton class for managing MongoDB client and database connections.
+    Per-process singleton managing the MongoDB client and database handles.
+
+    The client is created on first use rather than at import time, and is created
+    again when the PID changes, so a process forked from a gunicorn master or Celery
+    parent never shares sockets with it. Creating the client does not connect;
+    connections are opened by the first operation.
     """
 
     _client = None
     _db = None
+    _pid = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The parent's client and its sockets belong to the parent; a lock held
+        # by another parent thread at fork time would never be released here
+        cls._client = None
+        cls._db = None
+        cls._pid = None
+        cls._lock = threading.Lock()
 
     @classmethod
     def get_client(cls) -> MongoClient:
         """
-        Get or create a MongoClient instance.
+        Get or create the MongoClient of the current process.
 
         Returns:
             MongoClient: Active MongoDB client.
         """
-        if cls._client is None:
-            uri = getattr(settings, 'MONGODB_URI', os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/'))
-            ssl = getattr(settings, 'MONGODB_SSL', False)
-
-            cls._client = MongoClient(
-                uri,
-                ssl=ssl,
-                uuidRepresentation='standard',
-                serverSelectionTimeoutMS=5000  # Fail fast if server not reachable
-            )
+        if cls._client is None or cls._pid != os.getpid():
+            with cls._lock:
+                if cls._client is None or cls._pid != os.getpid():
+                    cls._db = None
+                    cls._client = MongoClient(**get_client_options())
+                    cls._pid = os.getpid()
         return cls._client
 
     @classmethod
@@ -45,9 +83,9 @@ class MongoDBClient:
         Returns:
             Database: MongoDB database object.
         """
+        client = cls.get_client()
         if cls._db is None:
-            db_name = getattr(settings, 'MONGODB_DB', os.environ.get('MONGODB_DB', 'resume_ai_mongodb'))
-            cls._db = cls.get_client()[db_name]
+            cls._db = client[get_db_name()]
         return cls._db
 
     @classmethod
@@ -62,4 +100,76 @@ class MongoDBClient:
             Collection: MongoDB collection object.
         """
         db = cls.get_db()
-        return db[collection_name]
\ No newline at end of file
+        return db[collection_name]
+
+
+class AsyncMongoDBClient:
+    """
+    Per-process AsyncMongoClient for async views served under ASGI.
+
+    An async client belongs to the event loop it is used on, so the client is bound
+    to the first loop that asks for it: the ASGI server's loop, which lives as long
+    as the worker. resume_ai.asgi closes it when the server shuts down. Code running
+    its own loop (scripts, tests) must await close() before that loop ends; a client
+    whose loop has already closed is replaced, and using the client from a second
+    loop while the first one is alive is an error.
+    """
+
+    _client = None
+    _loop = None
+    _pid = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # The parent's client, loop and sockets belong to the parent, so the child
+        # forgets them instead of closing them
+        cls._client = None
+        cls._loop = None
+        cls._pid = None
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls) -> AsyncMongoClient:
+        """
+        Get or create the AsyncMongoClient of the current process and event loop.
+
+        Raises:
+            RuntimeError: If the client is bound to another loop that is still open.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._client is not None and cls._loop is loop and cls._pid == os.getpid():
+            return cls._client
+
+        with cls._lock:
+            if cls._client is not None and cls._pid == os.getpid() and cls._loop.is_closed():
+                logger.warning("Async MongoDB client was not closed before its event loop ended, replacing it")
+            if cls._client is None or cls._pid != os.getpid() or cls._loop.is_closed():
+                cls._client = AsyncMongoClient(**get_client_options())
+                cls._loop = loop
+                cls._pid = os.getpid()
+            elif cls._loop is not loop:
+                raise RuntimeError("The async MongoDB client is bound to another event loop that is still open.")
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the client and its connection pools; the next use creates a new one.
+        """
+        with cls._lock:
+            client, cls._client, cls._loop, cls._pid = cls._client, None, None, None
+        if client is not None:
+            await client.close()
+
+    @classmethod
+    def get_db(cls):
+        return cls.get_client()[get_db_name()]
+
+    @classmethod
+    def get_collection(cls, collection_name: str):
+        return cls.get_db()[collection_name]
+
+
+os.register_at_fork(after_in_child=MongoDBClient._reset_after_fork)
+os.register_at_fork(after_in_child=AsyncMongoDBClient._reset_after_fork)
@@ -4,7 +4,7 @@ Centralized permissions for the application.
 
 from rest_framework import permissions
 
-from jobs.models import Job, Application
+from jobs.services.access_service import RecruiterAccessService
 from resumes.models import Resume
 from analytics.models import LogEntry
 
@@ -57,38 +57,22 @@ class IsResumeOwnerOrRecruiterOrAdmin(permissions.BasePermission):
             if user.is_admin:
                 return True
 
-            if obj.user == user:
+            if obj.user_id == user.id:
                 return True
 
             if user.is_recruiter:
                 if obj.visibility == Resume.Visibility.PUBLIC:
                     return True
 
-                return self.has_application_between(user, obj)
+                return self.has_application_between(user, obj, request)
 
         return False
 
-    def has_application_between(self, recruiter, resume):
+    def has_application_between(self, recruiter, resume, request=None):
         """
-        Check if a resume owner (job seeker) applied to any jobs of recruiter's companies
+        Check if the resume was submitted to any job of the recruiter's companies
         """
-        # Get all companies where recruiter works
-        companies = recruiter.companies.all()
-
-        if not companies.exists():
-            return False
-
-        # Get all jobs in these companies
-        jobs = Job.objects.filter(company__in=companies)
-
-        if not jobs.exists():
-            return False
-
-        # Check if resume owner applied to any of these jobs
-        return Application.objects.filter(
-            job__in=jobs,
-            resume=resume
-        ).exists()
+        return RecruiterAccessService.has_applied(recruiter, resume, request)
 
 
 class IsLogOwnerOrAdmin(permissions.BasePermission):
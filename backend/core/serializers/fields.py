@@ -0,0 +1,21 @@
+class SparseFieldsSerializerMixin:
+    """
+    Serializer mixin that lets clients pick a subset of fields with ?fields=a,b,c.
+
+    Unknown names are ignored; if none of the requested names exist, all fields are kept.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        requested = request.query_params.get('fields') if request is not None else None
+        if not requested:
+            return
+
+        wanted = {name.strip() for name in requested.split(',')} & set(self.fields)
+        if not wanted:
+            return
+
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
@@ -0,0 +1,26 @@
+"""
+Test runner for the project's test suite.
+"""
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner as BaseDiscoverRunner
+
+
+class DiscoverRunner(BaseDiscoverRunner):
+    """
+    Django's runner, with analytics log entries written as soon as they are logged.
+
+    The buffer's background timer flushes from its own thread, which can't use the
+    connection a test runs its transaction on, so entries it writes would be lost
+    with only an error logged. Synchronous writes make them checkable in the test.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._log_buffer_settings = (settings.ANALYTICS_LOG_BUFFER_SIZE, settings.ANALYTICS_LOG_FLUSH_INTERVAL)
+        settings.ANALYTICS_LOG_BUFFER_SIZE = 1
+        settings.ANALYTICS_LOG_FLUSH_INTERVAL = 0
+
+    def teardown_test_environment(self, **kwargs):
+        settings.ANALYTICS_LOG_BUFFER_SIZE, settings.ANALYTICS_LOG_FLUSH_INTERVAL = self._log_buffer_settings
+        super().teardown_test_environment(**kwargs)
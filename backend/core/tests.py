@@ -1,3 +1,98 @@
-from django.test import TestCase
+import asyncio
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from core.mongodb import AsyncMongoDBClient, MongoDBClient
+
+
+@override_settings(MONGODB_URI='mongodb://localhost:27017/', MONGODB_MAX_POOL_SIZE=7, MONGODB_COMPRESSORS='zlib')
+class MongoDBClientTests(SimpleTestCase):
+    def setUp(self):
+        MongoDBClient._reset_after_fork()
+        self.addCleanup(MongoDBClient._reset_after_fork)
+
+    def test_client_created_lazily_from_settings(self):
+        """Test that the client is built on first use, without connecting, and reused afterwards"""
+        with mock.patch('core.mongodb.MongoClient') as client_class:
+            self.assertIsNone(MongoDBClient._client)
+            client = MongoDBClient.get_client()
+            self.assertIs(MongoDBClient.get_client(), client)
+
+        client_class.assert_called_once()
+        kwargs = client_class.call_args.kwargs
+        self.assertEqual(kwargs['maxPoolSize'], 7)
+        self.assertEqual(kwargs['compressors'], 'zlib')
+        self.assertFalse(kwargs['connect'])
+
+    def test_client_recreated_in_forked_process(self):
+        """Test that a process with a different PID gets its own client and database handle"""
+        with mock.patch('core.mongodb.MongoClient', side_effect=lambda *args, **kwargs: mock.MagicMock()) as client_class:
+            parent_db = MongoDBClient.get_db()
+            with mock.patch('core.mongodb.os.getpid', return_value=MongoDBClient._pid + 1):
+                child_db = MongoDBClient.get_db()
+
+        self.assertEqual(client_class.call_count, 2)
+        self.assertIsNot(child_db, parent_db)
+
+
+class AsyncMongoDBClientTests(SimpleTestCase):
+    def setUp(self):
+        AsyncMongoDBClient._reset_after_fork()
+        self.addCleanup(AsyncMongoDBClient._reset_after_fork)
+        patcher = mock.patch(
+            'core.mongodb.AsyncMongoClient', side_effect=lambda *args, **kwargs: mock.MagicMock(close=mock.AsyncMock())
+        )
+        self.client_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_reused_on_its_loop_and_closed(self):
+        """Test that one loop shares one client and close() releases it"""
+        async def scenario():
+            client = AsyncMongoDBClient.get_client()
+            self.assertIs(AsyncMongoDBClient.get_client(), client)
+            await AsyncMongoDBClient.close()
+            return client
+
+        client = asyncio.run(scenario())
+
+        self.client_class.assert_called_once()
+        client.close.assert_awaited_once()
+        self.assertIsNone(AsyncMongoDBClient._client)
+
+    def test_client_bound_to_open_loop(self):
+        """Test that a second live loop can't share the client, and a closed loop's client is replaced"""
+        first_loop = asyncio.new_event_loop()
+        try:
+            first_loop.run_until_complete(self._get_client())
+            with self.assertRaises(RuntimeError):
+                asyncio.run(self._get_client())
+        finally:
+            first_loop.close()
+
+        with self.assertLogs('core.mongodb', 'WARNING'):
+            asyncio.run(self._get_client())
+        self.assertEqual(self.client_class.call_count, 2)
+
+    @staticmethod
+    async def _get_client():
+        return AsyncMongoDBClient.get_client()
+
+    def test_asgi_lifespan_shutdown_closes_client(self):
+        """Test that the ASGI application closes the async client when the server shuts down"""
+        from resume_ai.asgi import application
+
+        messages = iter([{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message['type'])
+
+        with mock.patch.object(AsyncMongoDBClient, 'close', mock.AsyncMock()) as close:
+            asyncio.run(application({'type': 'lifespan'}, receive, send))
+
+        close.assert_awaited_once()
+        self.assertEqual(sent, ['lifespan.startup.complete', 'lifespan.shutdown.complete'])
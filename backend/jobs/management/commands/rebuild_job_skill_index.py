@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import Job, JobSkill
+from jobs.services.skill_index_service import JobSkillIndexService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the skill -> job index from the skills required by approved jobs."
+
+    def handle(self, *args, **options):
+        JobSkill.objects.exclude(job__status=Job.Status.APPROVED).delete()
+
+        indexed = 0
+        for job in Job.objects.filter(status=Job.Status.APPROVED).iterator():
+            JobSkillIndexService.index_job(job)
+            indexed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt skill index for {indexed} approved jobs"))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-17 13:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_jobskill'),
+        ('resumes', '0005_resume_extraction_limits'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['created_at', 'id'], name='application_created_id_idx'),
+        ),
+    ]
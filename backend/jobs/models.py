@@ -41,6 +41,26 @@ class Job(models.Model):
         return f"{self.title} at {self.company.name}"
 
 
+class JobSkill(models.Model):
+    """
+    Inverted index entry mapping a normalized required skill to an approved job.
+    Refreshed when a job is approved or edited; used to recommend jobs for a resume.
+    """
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name='skill_index'
+    )
+    skill = models.CharField(max_length=100)
+
+    class Meta:
+        # Leading on skill so posting-list lookups are served by the index
+        unique_together = ('skill', 'job')
+
+    def __str__(self):
+        return f"{self.skill} -> {self.job_id}"
+
+
 class Application(models.Model):
     """
     A job application submitted by a job seeker.
@@ -67,6 +87,10 @@ class Application(models.Model):
     class Meta:
         unique_together = ('applicant', 'job')
         ordering = ['-created_at']
+        indexes = [
+            # Serves the (created_at, id) keyset of the lean application listing
+            models.Index(fields=['created_at', 'id'], name='application_created_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.applicant.email} applied to {self.job.title}"
\ No newline at end of file
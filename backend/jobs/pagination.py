@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ApplicationCursorPagination(CursorPagination):
+    """
+    Keyset pagination over applications, newest first. Used by the lean listing,
+    whose clients page through thousands of rows.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from jobs.models import Job, Application
 from companies.models import Company
 from resumes.serializers import ResumeSerializer
+from core.serializers.fields import SparseFieldsSerializerMixin
 
 class CompanySerializer(serializers.ModelSerializer):
     """
@@ -68,6 +69,38 @@ class ApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ApplicationListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Flat application row for recruiter dashboards, without nested job, company or resume objects.
+    Supports ?fields= to return only some of the columns.
+    """
+    job_title = serializers.CharField(source='job.title', read_only=True)
+    company_name = serializers.CharField(source='job.company.name', read_only=True)
+    applicant_email = serializers.EmailField(source='applicant.email', read_only=True)
+    resume_title = serializers.CharField(source='resume.title', read_only=True)
+
+    # Columns ApplicationViewSet loads for this serializer
+    QUERYSET_FIELDS = (
+        'id', 'job', 'resume', 'applicant', 'is_approved', 'created_at',
+        'job__title', 'job__company', 'job__company__name', 'applicant__email', 'resume__title',
+    )
+
+    class Meta:
+        model = Application
+        fields = [
+            'id',
+            'job',
+            'job_title',
+            'company_name',
+            'applicant_email',
+            'resume',
+            'resume_title',
+            'is_approved',
+            'created_at',
+        ]
+        read_only_fields = fields
+
+
 class ApplicationShortSerializer(serializers.ModelSerializer):
     """
     Short serializer for applications inside job detail.
@@ -0,0 +1,82 @@
+"""
+Service answering which resumes a recruiter can see through job applications.
+"""
+
+import logging
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.cache import invalidate_namespace, namespaced_key
+from jobs.models import Application, Job
+
+logger = logging.getLogger(__name__)
+
+
+class RecruiterAccessService:
+    """
+    Caches, per recruiter and resume, whether the resume was submitted to the recruiter's companies' jobs.
+
+    Each answer is one EXISTS query joining application -> job -> company ->
+    recruiters, memoized on the request and kept in the Django cache for
+    RECRUITER_ACCESS_CACHE_TIMEOUT seconds. The answers of a recruiter share a
+    cache namespace, so applying, rejecting, deleting a job and changes to
+    company membership invalidate them at once.
+    """
+
+    @staticmethod
+    def namespace(recruiter_id) -> str:
+        return f"recruiter:{recruiter_id}:resume_access"
+
+    @classmethod
+    def has_applied(cls, recruiter, resume, request=None) -> bool:
+        """
+        Whether the resume was submitted to any job of the recruiter's companies.
+
+        Args:
+            recruiter: The recruiter user.
+            resume: The resume being accessed.
+            request: Current request; when given, the answer is memoized on it.
+        """
+        pair = (recruiter.id, str(resume.pk))
+        memo = None
+        if request is not None:
+            memo = getattr(request, '_resume_access', None)
+            if memo is None:
+                memo = request._resume_access = {}
+            if pair in memo:
+                return memo[pair]
+
+        key = namespaced_key(cls.namespace(recruiter.id), resume.pk)
+        applied = cache.get(key)
+        if applied is None:
+            applied = Application.objects.filter(resume_id=resume.pk, job__company__recruiters=recruiter).exists()
+            cache.set(key, applied, getattr(settings, 'RECRUITER_ACCESS_CACHE_TIMEOUT', 60))
+
+        if memo is not None:
+            memo[pair] = applied
+        return applied
+
+    @classmethod
+    def invalidate_for_recruiters(cls, recruiter_ids: Iterable) -> None:
+        """
+        Drop the cached answers of the given recruiters, e.g. after they joined or left a company.
+        """
+        for recruiter_id in recruiter_ids:
+            if recruiter_id is not None:
+                invalidate_namespace(cls.namespace(recruiter_id))
+
+    @classmethod
+    def invalidate_for_company(cls, company) -> None:
+        """
+        Drop the cached answers of every recruiter of a company whose applications changed.
+        """
+        cls.invalidate_for_recruiters(company.recruiters.values_list('id', flat=True))
+
+    @classmethod
+    def invalidate_for_job(cls, job: Job) -> None:
+        """
+        Drop the cached answers of every recruiter of the job's company after its applications changed.
+        """
+        cls.invalidate_for_company(job.company)
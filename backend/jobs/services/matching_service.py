@@ -6,6 +6,10 @@ class MatchingService:
     Service to match a resume text against job skills using NLTK.
     """
 
+    @staticmethod
+    def normalize_skill(skill: str) -> str:
+        return skill.strip().lower()
+
     @staticmethod
     def extract_skills(text: str) -> set:
         tokens = word_tokenize(text.lower())
@@ -14,7 +18,7 @@ class MatchingService:
     @staticmethod
     def match_resume_to_job(resume_text: str, job_skills: list) -> float:
         resume_skills = MatchingService.extract_skills(resume_text)
-        job_skills_set = set(skill.lower() for skill in job_skills)
+        job_skills_set = set(MatchingService.normalize_skill(skill) for skill in job_skills)
 
         matches = resume_skills & job_skills_set
         if not job_skills_set:
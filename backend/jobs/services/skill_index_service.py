@@ -0,0 +1,83 @@
+import logging
+from typing import Dict, List
+
+from django.db import transaction
+from django.db.models import Count, F, FloatField, OuterRef, Subquery
+from django.db.models.functions import Cast
+
+from jobs.models import Job, JobSkill
+from jobs.services.matching_service import MatchingService
+from resumes.models import ResumeSkill
+
+logger = logging.getLogger(__name__)
+
+MAX_SKILL_LENGTH = JobSkill._meta.get_field('skill').max_length
+
+
+class JobSkillIndexService:
+    """
+    Service maintaining the skill -> job index used to recommend jobs for a resume.
+    """
+
+    @staticmethod
+    def normalize_skills(job_skills: list) -> set:
+        skills = {MatchingService.normalize_skill(skill) for skill in job_skills if isinstance(skill, str)}
+        return {skill for skill in skills if skill and len(skill) <= MAX_SKILL_LENGTH}
+
+    @classmethod
+    @transaction.atomic
+    def index_job(cls, job: Job) -> int:
+        """
+        Replace the index entries of a job. Only approved jobs are indexed.
+
+        Returns:
+            int: Number of skills indexed.
+        """
+        JobSkill.objects.filter(job=job).delete()
+
+        if job.status != Job.Status.APPROVED:
+            return 0
+
+        skills = cls.normalize_skills(job.skills_required)
+        JobSkill.objects.bulk_create([JobSkill(job=job, skill=skill) for skill in sorted(skills)])
+
+        logger.info(f"Indexed {len(skills)} skills for job {job.id}")
+        return len(skills)
+
+    @staticmethod
+    def recommend_jobs(resume_id, limit: int = 20) -> List[Dict]:
+        """
+        Rank approved jobs by the share of their required skills found in a resume.
+
+        Both sides come from the precomputed indexes, so only the posting lists
+        of the resume's skills are read and no text is tokenized.
+
+        Returns:
+            List[dict]: job_id, matched_skills and match_score (0-100), best first.
+        """
+        resume_skills = ResumeSkill.objects.filter(resume_id=resume_id).values('skill')
+        job_skill_totals = (
+            JobSkill.objects
+            .filter(job=OuterRef('job'))
+            .values('job')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+
+        rows = (
+            JobSkill.objects
+            .filter(skill__in=Subquery(resume_skills), job__status=Job.Status.APPROVED)
+            .values('job_id')
+            .annotate(matched_skills=Count('id'), total_skills=Subquery(job_skill_totals))
+            .annotate(match_score=Cast(F('matched_skills'), FloatField()) * 100 / F('total_skills'))
+            .order_by('-match_score', '-matched_skills', 'job_id')[:limit]
+        )
+
+        return [
+            {
+                'job_id': row['job_id'],
+                'matched_skills': row['matched_skills'],
+                'match_score': round(row['match_score'], 2),
+            }
+            for row in rows
+        ]
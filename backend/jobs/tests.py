@@ -1,3 +1,313 @@
-from django.test import TestCase
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from companies.models import Company
+from core.permissions import IsResumeOwnerOrRecruiterOrAdmin
+from jobs.models import Job, Application
+from jobs.services.skill_index_service import JobSkillIndexService
+from resumes.models import Resume
+from resumes.services.document import ResumeDocument
+from resumes.services.skill_index import ResumeSkillIndexService
+from users.models import User
+
+
+class JobRecommendationAPITests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            password='password123',
+            role=User.Role.ADMIN,
+            is_email_verified=True
+        )
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.company = Company.objects.create(name='Test Company')
+
+        self.resume = Resume.objects.create(
+            user=self.job_seeker, title='My Resume', file='cv.pdf', file_type='pdf',
+            status=Resume.Status.COMPLETED,
+        )
+        ResumeSkillIndexService.index_resume(
+            self.resume.id, ResumeDocument('Python developer with Django and React experience.')
+        )
+        self.client = APIClient()
+
+    def _job(self, title, skills, job_status=Job.Status.PENDING_APPROVAL):
+        return Job.objects.create(
+            company=self.company, title=title, description=title,
+            skills_required=skills, status=job_status,
+        )
+
+    def test_approve_job_indexes_skills(self):
+        """Test that approving a job makes it eligible for recommendations"""
+        job = self._job('Backend', ['Python', 'Django'])
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(reverse('job-approve-job', args=[job.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(job.skill_index.values_list('skill', flat=True)), {'python', 'django'})
+
+    def test_recommendations_ranked_by_match_score(self):
+        """Test that recommendations only include approved jobs, best match first"""
+        full = self._job('Backend', ['Python', 'Django'], Job.Status.APPROVED)
+        half = self._job('Fullstack', ['React', 'TypeScript'], Job.Status.APPROVED)
+        self._job('Data', ['Spark', 'Scala'], Job.Status.APPROVED)
+        pending = self._job('Pending', ['Python'])
+        for job in (full, half, pending):
+            JobSkillIndexService.index_job(job)
+
+        self.client.force_authenticate(user=self.job_seeker)
+        response = self.client.get(reverse('job-recommendations'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        jobs = response.data['data']['jobs']
+        self.assertEqual([job['id'] for job in jobs], [str(full.id), str(half.id)])
+        self.assertEqual([job['match_score'] for job in jobs], [100.0, 50.0])
+
+
+class RecruiterResumeAccessTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.recruiter = User.objects.create_user(
+            email='recruiter@example.com',
+            password='password123',
+            role='recruiter',
+            is_email_verified=True
+        )
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        company = Company.objects.create(name='Test Company')
+        company.recruiters.add(self.recruiter)
+        self.job = Job.objects.create(
+            company=company, title='Backend', description='Backend', status=Job.Status.APPROVED,
+        )
+        self.resume = Resume.objects.create(
+            user=self.job_seeker, title='Private', file='cv.pdf', file_type='pdf',
+        )
+        self.application = Application.objects.create(applicant=self.job_seeker, job=self.job, resume=self.resume)
+        self.client = APIClient()
+
+    def _can_view(self, request):
+        return IsResumeOwnerOrRecruiterOrAdmin().has_object_permission(request, None, self.resume)
+
+    def test_applied_resume_visible_with_one_query_then_cached(self):
+        """Test that the recruiter check is a single query, reused across requests"""
+        with self.assertNumQueries(1):
+            self.assertTrue(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+    def test_unsubmitted_resume_hidden_and_memoized_on_request(self):
+        """Test that a resume never submitted to the recruiter's jobs stays hidden, answered once per request"""
+        other = Resume.objects.create(
+            user=self.job_seeker, title='Other', file='other.pdf', file_type='pdf',
+        )
+        request = SimpleNamespace(user=self.recruiter)
+        permission = IsResumeOwnerOrRecruiterOrAdmin()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(permission.has_object_permission(request, None, other))
+        cache.clear()
+        with self.assertNumQueries(0):
+            self.assertFalse(permission.has_object_permission(request, None, other))
+
+    def test_reject_revokes_access(self):
+        """Test that rejecting the application invalidates the cached access"""
+        self.assertTrue(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+        self.client.force_authenticate(user=self.recruiter)
+        response = self.client.post(reverse('application-reject-application', args=[self.application.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertFalse(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+    def test_job_deletion_revokes_access(self):
+        """Test that deleting the job, and with it the application, invalidates the cached access"""
+        self.assertTrue(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+        admin = User.objects.create_superuser(email='admin@example.com', password='password123')
+        self.client.force_authenticate(user=admin)
+        response = self.client.delete(reverse('job-detail', args=[self.job.id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(self._can_view(SimpleNamespace(user=self.recruiter)))
+
+class JobListQueryTests(APITestCase):
+    def setUp(self):
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.job_seeker)
+
+    def _create_jobs(self, count):
+        for i in range(count):
+            company = Company.objects.create(name=f'Company {Company.objects.count()}')
+            job = Job.objects.create(
+                company=company, title=f'Job {i}', description='Job', status=Job.Status.APPROVED,
+            )
+            resume = Resume.objects.create(user=self.job_seeker, title=f'CV {i}', file='cv.pdf', file_type='pdf')
+            Application.objects.create(applicant=self.job_seeker, job=job, resume=resume)
+
+    def _count_queries(self, url):
+        # Measure the queryset, not the response cache
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Ignore the savepoints ATOMIC_REQUESTS wraps around the view
+        return len([q for q in queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))])
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        """Test that a page of jobs costs the same number of queries for 2 or 10 rows"""
+        self._create_jobs(2)
+        small_page = self._count_queries(reverse('job-list'))
+
+        self._create_jobs(8)
+        full_page = self._count_queries(reverse('job-list'))
+
+        self.assertEqual(small_page, full_page)
+
+    def test_detail_loads_applications_in_one_query(self):
+        """Test that job detail prefetches applications with their applicant and resume"""
+        self._create_jobs(1)
+        job = Job.objects.get()
+        for i in range(4):
+            applicant = User.objects.create_user(email=f'applicant{i}@example.com', password='password123')
+            resume = Resume.objects.create(user=applicant, title=f'CV {i}', file='cv.pdf', file_type='pdf')
+            Application.objects.create(applicant=applicant, job=job, resume=resume)
+
+        self.assertEqual(self._count_queries(reverse('job-detail', args=[job.id])), 2)
+
+
+class ApprovedJobListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            password='password123',
+            role=User.Role.ADMIN,
+            is_email_verified=True
+        )
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.company = Company.objects.create(name='Test Company')
+        Job.objects.create(company=self.company, title='Approved', description='Job', status=Job.Status.APPROVED)
+        self.pending = Job.objects.create(
+            company=self.company, title='Pending', description='Job', status=Job.Status.PENDING_APPROVAL,
+        )
+        self.client = APIClient()
+
+    def _titles(self):
+        self.client.force_authenticate(user=self.job_seeker)
+        response = self.client.get(reverse('job-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(job['title'] for job in response.data['results'])
+
+    def test_listing_served_from_cache(self):
+        """Test that a repeated job seeker listing doesn't query the database"""
+        self.assertEqual(self._titles(), ['Approved'])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._titles(), ['Approved'])
+        # Only the savepoints ATOMIC_REQUESTS wraps around the view
+        self.assertFalse([q for q in queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))])
+
+    def test_approve_invalidates_listing(self):
+        """Test that approving a job makes it show up in the cached listing"""
+        self.assertEqual(self._titles(), ['Approved'])
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(reverse('job-approve-job', args=[self.pending.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self._titles(), ['Approved', 'Pending'])
+
+    @override_settings(ALLOWED_HOSTS=['a.example.com', 'b.example.com'])
+    def test_listing_cached_per_host(self):
+        """Test that the cached pagination links point at the host the listing was requested on"""
+        for i in range(10):
+            Job.objects.create(company=self.company, title=f'Job {i}', description='Job', status=Job.Status.APPROVED)
+        self.client.force_authenticate(user=self.job_seeker)
+
+        for host in ('a.example.com', 'b.example.com'):
+            response = self.client.get(reverse('job-list'), HTTP_HOST=host)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.data['next'].startswith(f'http://{host}/'))
+
+class ApplicationListQueryTests(APITestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create_user(
+            email='recruiter@example.com',
+            password='password123',
+            role='recruiter',
+            is_email_verified=True
+        )
+        company = Company.objects.create(name='Test Company')
+        company.recruiters.add(self.recruiter)
+        self.job = Job.objects.create(company=company, title='Backend', description='Backend')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.recruiter)
+
+    def _apply(self, count):
+        for _ in range(count):
+            applicant = User.objects.create_user(email=f'applicant{User.objects.count()}@example.com',
+                                                 password='password123')
+            resume = Resume.objects.create(user=applicant, title='CV', file='cv.pdf', file_type='pdf')
+            Application.objects.create(applicant=applicant, job=self.job, resume=resume)
+
+    def _get(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('application-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len([q for q in queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))])
+
+    def test_lean_listing_is_one_query_per_page(self):
+        """Test that the lean view returns flat rows with a cursor in a single query"""
+        self._apply(5)
+
+        response, query_count = self._get({'view': 'lean', 'page_size': 3})
+        self.assertEqual(query_count, 1)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['results'][0]['job_title'], 'Backend')
+        self.assertIsNotNone(response.data['next'])
+
+    def test_lean_listing_sparse_fields(self):
+        """Test that ?fields= trims the lean rows"""
+        self._apply(1)
+
+        response, _ = self._get({'view': 'lean', 'fields': 'id,applicant_email'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'applicant_email'})
+
+    def test_full_listing_query_count_does_not_grow(self):
+        """Test that the nested default view joins instead of querying per row"""
+        self._apply(2)
+        _, small_page = self._get({})
+
+        self._apply(6)
+        _, full_page = self._get({})
+
+        self.assertEqual(small_page, full_page)
@@ -1,21 +1,47 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
-from drf_spectacular.utils import extend_schema, OpenApiRequest
+from rest_framework.response import Response
+from django.conf import settings
+from django.db.models import Prefetch, Q
+from drf_spectacular.utils import extend_schema, OpenApiRequest, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 
 from jobs.models import Job, Application
 from resumes.models import Resume
 from resumes.mongo.storage import get_resume_content_by_resume_id
-from jobs.serializers import JobSerializer, ApplicationSerializer, JobDetailSerializer, ResumeMatchRequestSerializer
+from jobs.pagination import ApplicationCursorPagination
+from jobs.serializers import (
+    JobSerializer,
+    ApplicationSerializer,
+    ApplicationListSerializer,
+    JobDetailSerializer,
+    ResumeMatchRequestSerializer,
+)
+from jobs.services.access_service import RecruiterAccessService
 from jobs.services.matching_service import MatchingService
+from jobs.services.skill_index_service import JobSkillIndexService
+from resumes.services.skill_index import ResumeSkillIndexService
 
+from core.cache import APPROVED_JOBS_NAMESPACE, get_or_set, invalidate_namespace, namespaced_key
 from core.mixins.response import BaseResponseMixin
+from core.permissions import IsResumeOwnerOrRecruiterOrAdmin
 from core.serializers.response import SuccessResponseSerializer, ErrorResponseSerializer
 
 from uuid import UUID
 
 common_tags = ['Jobs']
 
+MAX_RANKING_LIMIT = 200
+
+
+def get_ranking_limit(request, default=50):
+    try:
+        limit = int(request.query_params.get('limit', default))
+    except (TypeError, ValueError):
+        limit = default
+    return min(max(limit, 1), MAX_RANKING_LIMIT)
+
 
 @extend_schema(
     tags=common_tags,
@@ -49,17 +75,54 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         user = self.request.user
         if user.is_admin:
-            return Job.objects.all()
+            queryset = Job.objects.all()
+        elif user.is_recruiter:
+            queryset = Job.objects.filter(company__recruiters=user)
+        else:
+            queryset = Job.objects.filter(status=Job.Status.APPROVED)
+
+        # Every job serializer nests the company
+        queryset = queryset.select_related('company')
 
-        if user.is_recruiter:
-            return Job.objects.filter(company__recruiters=user)
-        return Job.objects.filter(status=Job.Status.APPROVED)
+        if self.action == 'retrieve':
+            # JobDetailSerializer lists applications with the applicant email and resume title only
+            queryset = queryset.prefetch_related(Prefetch(
+                'applications',
+                queryset=Application.objects.select_related('applicant', 'resume').only(
+                    'id', 'job', 'is_approved', 'created_at', 'applicant__email', 'resume__title',
+                ),
+            ))
+        return queryset
 
     def perform_create(self, serializer):
         if not self.request.user.is_recruiter:
             raise PermissionDenied("Only recruiters can create jobs.")
         serializer.save(user=self.request.user, status=Job.Status.PENDING_APPROVAL)
 
+    def list(self, request, *args, **kwargs):
+        if request.user.is_admin or request.user.is_recruiter:
+            return super().list(request, *args, **kwargs)
+
+        # Job seekers all see the same approved listing, so its pages are cached per URL;
+        # the host is part of the key because the next/previous links are absolute
+        data = get_or_set(
+            namespaced_key(APPROVED_JOBS_NAMESPACE, request.build_absolute_uri()),
+            lambda: super(JobViewSet, self).list(request, *args, **kwargs).data,
+            settings.JOB_LIST_CACHE_TIMEOUT,
+        )
+        return Response(data)
+
+    def perform_update(self, serializer):
+        job = serializer.save()
+        JobSkillIndexService.index_job(job)
+        invalidate_namespace(APPROVED_JOBS_NAMESPACE)
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        invalidate_namespace(APPROVED_JOBS_NAMESPACE)
+        # Deleting the job cascades to its applications
+        RecruiterAccessService.invalidate_for_job(instance)
+
     @extend_schema(
         request=None,
         responses={200: SuccessResponseSerializer, 403: ErrorResponseSerializer},
@@ -73,6 +136,8 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
         job = self.get_object()
         job.status = Job.Status.APPROVED
         job.save()
+        JobSkillIndexService.index_job(job)
+        invalidate_namespace(APPROVED_JOBS_NAMESPACE)
         return self.success({"detail": "Job approved successfully."})
 
     @extend_schema(
@@ -81,11 +146,12 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
     )
     @action(detail=True, methods=['get'], url_path='applications')
     def list_applications(self, request, pk=None):
+        # Recruiters can only get jobs of their own companies here
+        if not request.user.is_admin and not request.user.is_recruiter:
+            return self.error("Permission denied.", status_code=status.HTTP_403_FORBIDDEN)
         job = self.get_object()
-        if request.user != job.user and not request.user.is_admin:
-            return self.error("Permission denied.", status.HTTP_403_FORBIDDEN)
 
-        applications = Application.objects.filter(job=job)
+        applications = Application.objects.filter(job=job).select_related('applicant', 'resume', 'job__company')
         serializer = ApplicationSerializer(applications, many=True)
         return self.success(serializer.data)
 
@@ -120,6 +186,7 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
             return self.error("Already applied to this job.", status.HTTP_400_BAD_REQUEST)
 
         Application.objects.create(applicant=request.user, job=job, resume=resume)
+        RecruiterAccessService.invalidate_for_job(job)
         return self.success({"detail": "Application submitted."}, status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -140,7 +207,7 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
         try:
             resume_id = str(resume_id)
 
-            resume_doc = get_resume_content_by_resume_id(resume_id)
+            resume_doc = get_resume_content_by_resume_id(resume_id, projection={"raw_text": 1})
         except ValueError:
             return self.error("Invalid resume_id format.", status.HTTP_400_BAD_REQUEST)
 
@@ -156,6 +223,90 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
             'match_score': round(score, 2)
         })
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='limit', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY,
+                             description=f"Number of candidates to return (default 50, max {MAX_RANKING_LIMIT})."),
+        ],
+        responses={200: SuccessResponseSerializer, 403: ErrorResponseSerializer, 404: ErrorResponseSerializer},
+        description="Recruiter or admin lists the best-matching resumes for a job, ranked by match score."
+    )
+    @action(detail=True, methods=['get'], url_path='candidates')
+    def candidates(self, request, pk=None):
+        if not (request.user.is_recruiter or request.user.is_admin):
+            return self.error("Only recruiters/admins can list candidates.", status_code=status.HTTP_403_FORBIDDEN)
+
+        job = self.get_object()
+
+        resumes = Resume.objects.filter(status=Resume.Status.COMPLETED)
+        if not request.user.is_admin:
+            resumes = resumes.filter(
+                Q(visibility=Resume.Visibility.PUBLIC) | Q(applications__job=job)
+            )
+
+        ranking = ResumeSkillIndexService.rank_resumes(
+            job.skills_required, resumes, limit=get_ranking_limit(request)
+        )
+        ranked_resumes = Resume.objects.only('id', 'title').in_bulk([row['resume_id'] for row in ranking])
+
+        return self.success({
+            'job_id': str(job.id),
+            'candidates': [
+                {
+                    'resume_id': str(row['resume_id']),
+                    'title': ranked_resumes[row['resume_id']].title,
+                    'match_score': row['match_score'],
+                    'matched_skills': row['matched_skills'],
+                }
+                for row in ranking
+                if row['resume_id'] in ranked_resumes
+            ]
+        })
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='resume_id', type=OpenApiTypes.UUID, location=OpenApiParameter.QUERY,
+                             description="Resume to match; defaults to the job seeker's latest resume."),
+            OpenApiParameter(name='limit', type=OpenApiTypes.INT, location=OpenApiParameter.QUERY,
+                             description=f"Number of jobs to return (default 20, max {MAX_RANKING_LIMIT})."),
+        ],
+        responses={200: SuccessResponseSerializer, 400: ErrorResponseSerializer, 403: ErrorResponseSerializer,
+                   404: ErrorResponseSerializer},
+        description="List the approved jobs that best match a resume, ranked by match score."
+    )
+    @action(detail=False, methods=['get'], url_path='recommendations')
+    def recommendations(self, request):
+        resume_id = request.query_params.get('resume_id')
+
+        if resume_id:
+            try:
+                resume = Resume.objects.get(id=UUID(resume_id))
+            except (ValueError, Resume.DoesNotExist):
+                return self.error("Resume not found.", status_code=status.HTTP_404_NOT_FOUND)
+
+            if not IsResumeOwnerOrRecruiterOrAdmin().has_object_permission(request, self, resume):
+                return self.error("Permission denied.", status_code=status.HTTP_403_FORBIDDEN)
+        else:
+            resume = Resume.objects.filter(user=request.user).order_by('-created_at').first()
+            if not resume:
+                return self.error("No resume found.", status_code=status.HTTP_404_NOT_FOUND)
+
+        ranking = JobSkillIndexService.recommend_jobs(resume.id, limit=get_ranking_limit(request, default=20))
+        jobs = Job.objects.select_related('company').in_bulk([row['job_id'] for row in ranking])
+
+        return self.success({
+            'resume_id': str(resume.id),
+            'jobs': [
+                {
+                    **JobSerializer(jobs[row['job_id']]).data,
+                    'match_score': row['match_score'],
+                    'matched_skills': row['matched_skills'],
+                }
+                for row in ranking
+                if row['job_id'] in jobs
+            ]
+        })
+
     @extend_schema(
         request=None,
         responses={200: SuccessResponseSerializer, 404: ErrorResponseSerializer},
@@ -172,7 +323,7 @@ class JobViewSet(BaseResponseMixin, viewsets.ModelViewSet):
         if not resume:
             return self.error("No resume found.", status.HTTP_404_NOT_FOUND)
 
-        resume_doc = get_resume_content_by_resume_id(str(resume.id))
+        resume_doc = get_resume_content_by_resume_id(str(resume.id), projection={"raw_text": 1})
         if not resume_doc:
             return self.error("Resume content not found.", status.HTTP_404_NOT_FOUND)
 
@@ -207,14 +358,58 @@ class ApplicationViewSet(BaseResponseMixin, viewsets.ModelViewSet):
     serializer_class = ApplicationSerializer
     queryset = Application.objects.all()
 
+    def is_lean_listing(self):
+        return self.action == 'list' and self.request.query_params.get('view') == 'lean'
+
+    @property
+    def paginator(self):
+        # The lean listing pages with a cursor; the full one keeps page numbers for existing clients
+        if not hasattr(self, '_paginator'):
+            self._paginator = ApplicationCursorPagination() if self.is_lean_listing() else super().paginator
+        return self._paginator
+
+    def get_serializer_class(self):
+        if self.is_lean_listing():
+            return ApplicationListSerializer
+        return ApplicationSerializer
+
     def get_queryset(self):
         user = self.request.user
         if user.is_admin:
-            return Application.objects.all()
-        if user.is_recruiter:
-            return Application.objects.filter(job__company__recruiters=user)
+            queryset = Application.objects.all()
+        elif user.is_recruiter:
+            queryset = Application.objects.filter(job__company__recruiters=user)
+        else:
+            queryset = Application.objects.filter(applicant=user)
+
+        # Both serializers read the job, its company, the applicant and the resume
+        queryset = queryset.select_related('applicant', 'resume', 'job__company')
+        if self.is_lean_listing():
+            queryset = queryset.only(*ApplicationListSerializer.QUERYSET_FIELDS)
+        return queryset
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='view', type=OpenApiTypes.STR, enum=['full', 'lean'],
+                             description='lean: flat rows with cursor pagination'),
+            OpenApiParameter(name='fields', type=OpenApiTypes.STR,
+                             description='Comma-separated fields to return (lean view only)'),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @staticmethod
+    def can_manage(user, application):
+        """
+        Admins and recruiters of the job's company may approve or reject an application.
+        """
+        return user.is_admin or application.job.company.recruiters.filter(id=user.id).exists()
 
-        return Application.objects.filter(applicant=user)
+    def perform_destroy(self, instance):
+        job = instance.job
+        instance.delete()
+        RecruiterAccessService.invalidate_for_job(job)
 
     @extend_schema(
         request=None,
@@ -225,8 +420,8 @@ class ApplicationViewSet(BaseResponseMixin, viewsets.ModelViewSet):
     def approve_application(self, request, pk=None):
         application = self.get_object()
 
-        if request.user != application.job.user and not request.user.is_admin:
-            return self.error("Permission denied.", status.HTTP_403_FORBIDDEN)
+        if not self.can_manage(request.user, application):
+            return self.error("Permission denied.", status_code=status.HTTP_403_FORBIDDEN)
 
         application.is_approved = True
         application.save()
@@ -241,8 +436,9 @@ class ApplicationViewSet(BaseResponseMixin, viewsets.ModelViewSet):
     def reject_application(self, request, pk=None):
         application = self.get_object()
 
-        if request.user != application.job.user and not request.user.is_admin:
-            return self.error("Permission denied.", status.HTTP_403_FORBIDDEN)
+        if not self.can_manage(request.user, application):
+            return self.error("Permission denied.", status_code=status.HTTP_403_FORBIDDEN)
 
         application.delete()
+        RecruiterAccessService.invalidate_for_job(application.job)
         return self.success({"detail": "Application rejected and deleted."})
\ No newline at end of file
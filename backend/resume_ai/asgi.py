@@ -13,4 +13,24 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'resume_ai.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from core.mongodb import AsyncMongoDBClient  # noqa: E402  (needs configured settings)
+
+
+async def application(scope, receive, send):
+    """
+    Django's ASGI application, plus the lifespan events Django doesn't handle:
+    on server shutdown, the async MongoDB client is closed on the server's loop.
+    """
+    if scope['type'] != 'lifespan':
+        return await django_application(scope, receive, send)
+
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await AsyncMongoDBClient.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
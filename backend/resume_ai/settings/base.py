@@ -204,6 +204,81 @@ CELERY_TASK_ACKS_LATE = True
 CELERY_TASK_REJECT_ON_WORKER_LOST = True
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 100
 
+# MongoDB client pool. Each process creates its own client on first use.
+# MONGODB_COMPRESSORS is a comma-separated list; zstd and snappy need their optional packages.
+MONGODB_MAX_POOL_SIZE = int(os.environ.get('MONGODB_MAX_POOL_SIZE', 100))
+MONGODB_MIN_POOL_SIZE = int(os.environ.get('MONGODB_MIN_POOL_SIZE', 0))
+MONGODB_MAX_IDLE_TIME_MS = int(os.environ.get('MONGODB_MAX_IDLE_TIME_MS', 60000))
+MONGODB_COMPRESSORS = os.environ.get('MONGODB_COMPRESSORS', 'zlib')
+# Documents per round trip of the bulk upserts in resumes.mongo.storage
+MONGODB_BULK_BATCH_SIZE = int(os.environ.get('MONGODB_BULK_BATCH_SIZE', 1000))
+
+# Cache; a separate Redis database from the broker. Redis errors are treated as
+# cache misses, so an outage slows requests down instead of failing them.
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': f"redis://{os.environ.get('REDIS_HOST', 'localhost')}:{os.environ.get('REDIS_PORT', '6379')}/1",
+        'KEY_PREFIX': 'resume_ai',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'IGNORE_EXCEPTIONS': True,
+            'SOCKET_CONNECT_TIMEOUT': 1,
+            'SOCKET_TIMEOUT': 1,
+        },
+    }
+}
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+
+# Seconds cached responses live for; writes through the API invalidate them earlier
+JOB_LIST_CACHE_TIMEOUT = int(os.environ.get('JOB_LIST_CACHE_TIMEOUT', 300))
+COMPANY_CACHE_TIMEOUT = int(os.environ.get('COMPANY_CACHE_TIMEOUT', 300))
+RESUME_ANALYSIS_CACHE_TIMEOUT = int(os.environ.get('RESUME_ANALYSIS_CACHE_TIMEOUT', 3600))
+
+# Run the resume parse -> analyze pipeline inline instead of via the broker.
+# Intended for tests only; uploads must never block on parsing in production.
+RESUME_PROCESSING_SYNC = os.environ.get('RESUME_PROCESSING_SYNC', 'False').lower() == 'true'
+
+# Resume text extraction guards
+RESUME_MAX_BYTES = int(os.environ.get('RESUME_MAX_BYTES', 10 * 1024 * 1024))  # 10 MB
+RESUME_MAX_PAGES = int(os.environ.get('RESUME_MAX_PAGES', 100))
+
+# PDFs with at least this many pages are extracted by a pool of worker processes
+RESUME_PDF_PARALLEL_PAGE_THRESHOLD = int(os.environ.get('RESUME_PDF_PARALLEL_PAGE_THRESHOLD', 20))
+RESUME_PDF_PARALLEL_WORKERS = int(os.environ.get('RESUME_PDF_PARALLEL_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Time budgets (seconds) for extracting a resume; text read before a budget runs out is kept
+RESUME_EXTRACTION_PAGE_TIMEOUT = float(os.environ.get('RESUME_EXTRACTION_PAGE_TIMEOUT', 10))
+RESUME_EXTRACTION_TIMEOUT = float(os.environ.get('RESUME_EXTRACTION_TIMEOUT', 120))
+# Parses killed mid-extraction this many times in a row are marked failed instead of retried
+RESUME_MAX_EXTRACTION_ATTEMPTS = int(os.environ.get('RESUME_MAX_EXTRACTION_ATTEMPTS', 2))
+
+# Codec for resume text stored in MongoDB: '' (plain), 'zlib' or 'zstd' (needs the zstandard package).
+# Shorter texts stay plain. Existing documents are converted by the compress_resume_texts command.
+RESUME_TEXT_COMPRESSION = os.environ.get('RESUME_TEXT_COMPRESSION', '')
+RESUME_TEXT_COMPRESSION_MIN_LENGTH = int(os.environ.get('RESUME_TEXT_COMPRESSION_MIN_LENGTH', 1024))
+
+# Serve resume content and analysis with async views and the asyncio MongoDB client.
+# Only for ASGI deployments (resume_ai.asgi): the async client is bound to the server's event loop,
+# while under WSGI every async request would run on a loop of its own.
+RESUME_ASYNC_VIEWS = os.environ.get('RESUME_ASYNC_VIEWS', 'False').lower() == 'true'
+
+# Seconds a recruiter's set of applied resume IDs is cached for permission checks
+RECRUITER_ACCESS_CACHE_TIMEOUT = int(os.environ.get('RECRUITER_ACCESS_CACHE_TIMEOUT', 60))
+
+# Analytics log entries are buffered in-process and written in batches once the
+# buffer holds this many entries or the oldest one is this many seconds old
+ANALYTICS_LOG_BUFFER_SIZE = int(os.environ.get('ANALYTICS_LOG_BUFFER_SIZE', 100))
+ANALYTICS_LOG_FLUSH_INTERVAL = float(os.environ.get('ANALYTICS_LOG_FLUSH_INTERVAL', 5))
+
+# Writes log entries synchronously under `manage.py test`
+TEST_RUNNER = 'core.test_runner.DiscoverRunner'
+
+# The log is partitioned by month on MySQL; manage_log_partitions archives and drops
+# months older than the retention period.
+ANALYTICS_LOG_RETENTION_MONTHS = int(os.environ.get('ANALYTICS_LOG_RETENTION_MONTHS', 12))
+ANALYTICS_LOG_ARCHIVE_DIR = os.environ.get('ANALYTICS_LOG_ARCHIVE_DIR') or None
+
 
 
 
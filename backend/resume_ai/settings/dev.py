@@ -40,6 +40,7 @@ MONGODB_DB = env('MONGODB_DB', default='resume_ai_mongodb')
 # Redis configuration
 REDIS_HOST = env('REDIS_HOST')
 REDIS_PORT = env('REDIS_PORT')
+CACHES['default']['LOCATION'] = f"redis://{REDIS_HOST}:{REDIS_PORT}/1"
 
 # Email configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
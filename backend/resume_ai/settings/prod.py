@@ -46,4 +46,7 @@ MONGODB_SSL = env.bool('MONGODB_SSL', default=False)
 REDIS_HOST = env('REDIS_HOST')
 REDIS_PORT = env('REDIS_PORT')
 REDIS_PASSWORD = env('REDIS_PASSWORD', default=None)
-REDIS_SSL = env.bool('REDIS_SSL', default=False)
\ No newline at end of file
+REDIS_SSL = env.bool('REDIS_SSL', default=False)
+CACHES['default']['LOCATION'] = f"{'rediss' if REDIS_SSL else 'redis'}://{REDIS_HOST}:{REDIS_PORT}/1"
+if REDIS_PASSWORD:
+    CACHES['default']['OPTIONS']['PASSWORD'] = REDIS_PASSWORD
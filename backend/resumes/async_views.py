@@ -0,0 +1,106 @@
+"""
+Async versions of the resume content and analysis views, for ASGI deployments.
+
+Routed in place of ResumeContentView and ResumeAnalysisView when RESUME_ASYNC_VIEWS
+is enabled, so polling clients wait on MongoDB without holding a worker thread.
+"""
+
+from asgiref.sync import sync_to_async
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+
+from core.async_views import AsyncAPIView
+from core.mixins.conditional import ConditionalGetMixin
+from core.permissions import IsResumeOwnerOrRecruiterOrAdmin
+from core.serializers.response import SuccessResponseSerializer, ErrorResponseSerializer
+from resumes.models import Resume
+from resumes.mongo.async_storage import get_resume_analysis_by_resume_id, get_resume_content_by_resume_id
+from resumes.serializers import ResumeContentSerializer
+from resumes.services.analyzer import ResumeAnalysisService
+
+common_tags = ['Resumes']
+
+
+class AsyncResumeView(ConditionalGetMixin, AsyncAPIView):
+    permission_classes = [permissions.IsAuthenticated, IsResumeOwnerOrRecruiterOrAdmin]
+
+    async def get_resume(self, request, resume_id):
+        """
+        The resume, after checking the user may see it; None if it does not exist.
+        """
+        try:
+            resume = await Resume.objects.aget(id=resume_id)
+        except Resume.DoesNotExist:
+            return None
+
+        await self.acheck_object_permissions(request, resume)
+        return resume
+
+
+@extend_schema(
+    tags=common_tags,
+    responses={
+        200: SuccessResponseSerializer,
+        400: ErrorResponseSerializer,
+        401: ErrorResponseSerializer,
+        403: ErrorResponseSerializer,
+        404: ErrorResponseSerializer,
+        500: ErrorResponseSerializer,
+    }
+)
+class AsyncResumeContentView(AsyncResumeView):
+
+    async def get(self, request, resume_id, *args, **kwargs):
+        resume = await self.get_resume(request, resume_id)
+        if resume is None:
+            return Response({"detail": "Resume not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # Check the client's copy against the stamp alone before reading the full text
+        stamp = await get_resume_content_by_resume_id(str(resume.id), projection={"updated_at": 1})
+        if not_modified := self.not_modified(request, stamp):
+            return not_modified
+
+        content_doc = await get_resume_content_by_resume_id(str(resume.id))
+        if not content_doc:
+            return Response({"detail": "Parsed resume content not available."}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = ResumeContentSerializer(content_doc)
+        return self.add_validators(Response(serializer.data), content_doc)
+
+
+@extend_schema(
+    tags=common_tags,
+    responses={
+        200: SuccessResponseSerializer,
+        400: ErrorResponseSerializer,
+        401: ErrorResponseSerializer,
+        403: ErrorResponseSerializer,
+        404: ErrorResponseSerializer,
+        500: ErrorResponseSerializer,
+    }
+)
+class AsyncResumeAnalysisView(AsyncResumeView):
+
+    async def get(self, request, resume_id, *args, **kwargs):
+        resume = await self.get_resume(request, resume_id)
+        if resume is None:
+            return Response({"detail": "Resume not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        analysis_doc = await get_resume_analysis_by_resume_id(str(resume.id))
+        if not analysis_doc:
+            return Response({"detail": "Resume analysis not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if not_modified := self.not_modified(request, analysis_doc):
+            return not_modified
+
+        return self.add_validators(Response(analysis_doc), analysis_doc)
+
+    async def post(self, request, resume_id, *args, **kwargs):
+        resume = await self.get_resume(request, resume_id)
+        if resume is None:
+            return Response({"detail": "Resume not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # The analysis itself is sync (ORM, log buffer, sync storage), as in ResumeAnalysisView
+        await sync_to_async(ResumeAnalysisService.analyze_resume)(resume_id)
+        return Response({"detail": "Resume analysis started."})
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from resumes.mongo.compression import available_codecs
+from resumes.mongo.storage import recompress_resume_cache, recompress_resume_contents
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite the resume texts stored in MongoDB, both parsed contents and the content-hash "
+        "cache, with the configured compression (RESUME_TEXT_COMPRESSION), e.g. after enabling or changing it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--codec', default=getattr(settings, 'RESUME_TEXT_COMPRESSION', ''),
+                            help=f"Codec to store texts with: {', '.join(available_codecs())}, or '' for plain text.")
+        parser.add_argument('--batch-size', type=int, default=getattr(settings, 'MONGODB_BULK_BATCH_SIZE', 1000),
+                            help="Number of documents rewritten per bulk write.")
+
+    def handle(self, *args, **options):
+        if options['codec'] and options['codec'] not in available_codecs():
+            raise CommandError(f"Codec {options['codec']} is not available; use one of {', '.join(available_codecs())}.")
+
+        for label, recompress in (("resume texts", recompress_resume_contents),
+                                  ("cached resume texts", recompress_resume_cache)):
+            rewritten = 0
+            for count in recompress(options['codec'], batch_size=options['batch_size']):
+                rewritten += count
+                self.stdout.write(f"Rewrote {rewritten} {label}")
+
+            self.stdout.write(self.style.SUCCESS(f"Recompressed {rewritten} {label}"))
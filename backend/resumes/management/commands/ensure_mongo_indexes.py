@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from resumes.mongo.indexes import ensure_indexes
+
+
+class Command(BaseCommand):
+    help = "Create the MongoDB indexes declared in resumes.mongo.indexes. Safe to run on every deploy."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--drop-unknown', action='store_true',
+                            help="Drop indexes that are not declared. Without this flag they are only listed.")
+
+    def handle(self, *args, **options):
+        for report in ensure_indexes(drop_unknown=options['drop_unknown']):
+            if report.created:
+                self.stdout.write(f"{report.collection}: created {', '.join(report.created)}")
+            if report.dropped:
+                self.stdout.write(f"{report.collection}: dropped {', '.join(report.dropped)}")
+            elif report.unknown:
+                self.stdout.write(f"{report.collection}: undeclared {', '.join(report.unknown)}")
+
+        self.stdout.write(self.style.SUCCESS("MongoDB indexes are up to date"))
@@ -0,0 +1,35 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from resumes.services.bulk_analyzer import BulkAnalysisService
+from resumes.tasks import bulk_analyze_resumes
+
+
+class Command(BaseCommand):
+    help = "Re-score every parsed resume using the current analysis rules."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Number of resumes read, analyzed and written per batch.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help="Size of the analysis process pool (1 analyzes in-process).")
+        parser.add_argument('--after', dest='after_id', default=None,
+                            help="Resume a previous run after this resume ID.")
+        parser.add_argument('--async', dest='use_celery', action='store_true',
+                            help="Fan the work out to Celery workers instead of running it here.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        if options['use_celery']:
+            result = bulk_analyze_resumes.delay(batch_size=batch_size, after_id=options['after_id'])
+            self.stdout.write(self.style.SUCCESS(f"Queued bulk analysis as task {result.id}"))
+            return
+
+        total = BulkAnalysisService.analyze_all(
+            batch_size=batch_size,
+            workers=max(1, options['workers']),
+            after_id=options['after_id'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Re-analyzed {total} resumes"))
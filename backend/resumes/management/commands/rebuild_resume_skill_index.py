@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from resumes.models import Resume
+from resumes.mongo.storage import iter_resume_content_batches
+from resumes.services.document import ResumeDocument
+from resumes.services.skill_index import ResumeSkillIndexService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the inverted skill index from the parsed resume contents in MongoDB."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Number of resume contents read per batch.")
+
+    def handle(self, *args, **options):
+        indexed = 0
+
+        for batch in iter_resume_content_batches(options['batch_size'], {"raw_text": 1}):
+            # Skip content documents whose Resume row no longer exists
+            existing = {
+                str(resume_id) for resume_id in
+                Resume.objects.filter(id__in=[doc["_id"] for doc in batch]).values_list('id', flat=True)
+            }
+
+            for doc in batch:
+                if doc["_id"] in existing:
+                    ResumeSkillIndexService.index_resume(doc["_id"], ResumeDocument(doc.get("raw_text") or ""))
+                    indexed += 1
+
+            self.stdout.write(f"Indexed {indexed} resumes")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt skill index for {indexed} resumes"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-17 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0004_resume_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='extraction_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='is_truncated',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -41,6 +41,9 @@ class Resume(models.Model):
         default=Visibility.PRIVATE
     )
     original_filename = models.CharField(max_length=255, blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)  # SHA-256 of the file
+    is_truncated = models.BooleanField(default=False)  # Text was cut short by an extraction limit
+    extraction_attempts = models.PositiveSmallIntegerField(default=0)  # Started but unfinished parses
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -57,4 +60,24 @@ class Resume(models.Model):
         
     @property
     def is_public(self):
-        return self.visibility == self.Visibility.PUBLIC
\ No newline at end of file
+        return self.visibility == self.Visibility.PUBLIC
+
+class ResumeSkill(models.Model):
+    """
+    Inverted index entry mapping a normalized skill token to a resume.
+    Rebuilt whenever a resume is parsed; used to rank resumes against jobs
+    without tokenizing every resume's raw text.
+    """
+    resume = models.ForeignKey(
+        Resume,
+        on_delete=models.CASCADE,
+        related_name='skills'
+    )
+    skill = models.CharField(max_length=100)
+
+    class Meta:
+        # Leading on skill so posting-list lookups are served by the index
+        unique_together = ('skill', 'resume')
+
+    def __str__(self):
+        return f"{self.skill} -> {self.resume_id}"
@@ -0,0 +1,131 @@
+"""
+Asyncio MongoDB storage layer for resumes, for async views served under ASGI.
+
+Async twins of the per-resume operations in resumes.mongo.storage. Documents are
+prepared, compressed, stamped and cached exactly as there, so both layers can
+read and write the same documents. Batch operations stay in the sync module,
+since they run in Celery workers and management commands.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.mongodb import AsyncMongoDBClient
+from resumes.mongo.compression import decode_document, expand_projection
+from resumes.mongo.storage import (
+    RESUME_ANALYSIS,
+    RESUME_CACHE,
+    RESUME_CONTENTS,
+    content_update,
+    encode_resume_text,
+    prepare_document,
+    prepare_updates,
+    resume_analysis_cache_key,
+)
+
+
+def resume_content_collection():
+    return AsyncMongoDBClient.get_collection(RESUME_CONTENTS)
+
+
+def resume_analysis_collection():
+    return AsyncMongoDBClient.get_collection(RESUME_ANALYSIS)
+
+
+def resume_cache_collection():
+    return AsyncMongoDBClient.get_collection(RESUME_CACHE)
+
+
+# ========== Resume Content Operations ==========
+
+async def insert_resume_content(data: dict) -> UUID:
+    """
+    Insert parsed resume content, replacing any previous document of the resume.
+    """
+    resume_id = prepare_document(data, datetime.now(timezone.utc))
+    await resume_content_collection().replace_one({"_id": resume_id}, encode_resume_text({**data}), upsert=True)
+    return UUID(resume_id)
+
+
+async def get_resume_content_by_resume_id(resume_id: str, projection: Optional[dict] = None) -> Optional[Dict]:
+    """
+    Retrieve parsed resume content by associated Resume ID, with raw_text decompressed.
+    """
+    document = await resume_content_collection().find_one({"_id": str(resume_id)}, expand_projection(projection))
+    return decode_document(document)
+
+
+async def get_resume_contents_by_resume_ids(
+        resume_ids: Iterable[str],
+        projection: Optional[dict] = None
+) -> List[Dict]:
+    """
+    Retrieve parsed resume contents for many resumes in a single query.
+    """
+    ids = [str(resume_id) for resume_id in resume_ids]
+    if not ids:
+        return []
+    cursor = resume_content_collection().find({"_id": {"$in": ids}}, expand_projection(projection))
+    return [decode_document(document) async for document in cursor]
+
+
+async def update_resume_content(resume_id: str, updates: dict) -> None:
+    await resume_content_collection().update_one({"_id": str(resume_id)}, content_update(updates))
+
+
+# ========== Resume Analysis Operations ==========
+
+async def insert_resume_analysis(data: dict) -> UUID:
+    """
+    Insert resume analysis results, replacing any previous analysis of the resume.
+    """
+    resume_id = prepare_document(data, datetime.now(timezone.utc))
+    await resume_analysis_collection().replace_one({"_id": resume_id}, data, upsert=True)
+    await cache.adelete(resume_analysis_cache_key(resume_id))
+    return UUID(resume_id)
+
+
+async def get_resume_analysis_by_resume_id(resume_id: str, projection: Optional[dict] = None) -> Optional[Dict]:
+    """
+    Retrieve resume analysis results by associated Resume ID, through the same cache as the sync getter.
+    """
+    resume_id = str(resume_id)
+    key = resume_analysis_cache_key(resume_id)
+
+    document = await cache.aget(key)
+    if document is None:
+        document = await resume_analysis_collection().find_one({"_id": resume_id}, projection)
+        # Partial documents are never cached
+        if document is not None and projection is None:
+            await cache.aset(key, document, getattr(settings, 'RESUME_ANALYSIS_CACHE_TIMEOUT', 3600))
+    return document
+
+
+async def get_resume_analyses_by_resume_ids(
+        resume_ids: Iterable[str],
+        projection: Optional[dict] = None
+) -> Dict[str, Dict]:
+    """
+    Retrieve resume analysis results for many resumes in a single $in query, keyed by resume ID.
+    """
+    ids = [str(resume_id) for resume_id in resume_ids]
+    if not ids:
+        return {}
+    cursor = resume_analysis_collection().find({"_id": {"$in": ids}}, projection)
+    return {document["_id"]: document async for document in cursor}
+
+
+async def update_resume_analysis(resume_id: str, updates: dict) -> None:
+    await resume_analysis_collection().update_one({"_id": str(resume_id)}, {"$set": prepare_updates(updates)})
+    await cache.adelete(resume_analysis_cache_key(resume_id))
+
+
+# ========== Content-Addressed Cache Operations ==========
+
+async def get_resume_cache_entry(content_hash: str, projection: Optional[dict] = None) -> Optional[Dict]:
+    document = await resume_cache_collection().find_one({"_id": content_hash}, expand_projection(projection))
+    return decode_document(document)
@@ -0,0 +1,100 @@
+"""
+Compressed storage of resume text in MongoDB documents.
+
+A compressed document keeps its text in raw_text_compressed (bytes) with the codec
+name in raw_text_codec, and has no raw_text field. Plain documents are left as they
+are, so both representations can coexist while existing documents are recompressed.
+"""
+
+import logging
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+TEXT_FIELD = "raw_text"
+COMPRESSED_FIELD = "raw_text_compressed"
+CODEC_FIELD = "raw_text_codec"
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+
+def available_codecs():
+    return [ZLIB, ZSTD] if zstandard is not None else [ZLIB]
+
+
+def resolve_codec(codec: Optional[str]) -> Optional[str]:
+    """
+    The codec to write with: None for plain text, zlib when zstd is configured but not installed.
+    """
+    if not codec:
+        return None
+    if codec == ZSTD and zstandard is None:
+        logger.warning("zstandard is not installed, compressing resume text with zlib instead")
+        return ZLIB
+    if codec not in (ZLIB, ZSTD):
+        raise ValueError(f"Unknown resume text codec: {codec}")
+    return codec
+
+
+def compress_text(text: str, codec: str) -> bytes:
+    data = text.encode("utf-8")
+    if codec == ZSTD:
+        return zstandard.ZstdCompressor().compress(data)
+    return zlib.compress(data)
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    if codec == ZSTD:
+        if zstandard is None:
+            raise ImportError("zstandard must be installed to read zstd-compressed resume text.")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == ZLIB:
+        data = zlib.decompress(data)
+    else:
+        raise ValueError(f"Unknown resume text codec: {codec}")
+    return data.decode("utf-8")
+
+
+def encode_document(document: dict, codec: Optional[str], min_length: int = 0) -> dict:
+    """
+    Compress the raw_text of a document in place, if it is long enough to be worth it.
+
+    Returns:
+        dict: The same document.
+    """
+    text = document.get(TEXT_FIELD)
+    if codec is None or not isinstance(text, str) or len(text) < min_length:
+        return document
+
+    document[COMPRESSED_FIELD] = compress_text(text, codec)
+    document[CODEC_FIELD] = codec
+    del document[TEXT_FIELD]
+    return document
+
+
+def decode_document(document: Optional[dict]) -> Optional[dict]:
+    """
+    Restore raw_text of a compressed document in place, dropping the compressed fields.
+
+    Returns:
+        Optional[dict]: The same document.
+    """
+    if document is not None and COMPRESSED_FIELD in document:
+        document[TEXT_FIELD] = decompress_text(document.pop(COMPRESSED_FIELD), document.pop(CODEC_FIELD, ZLIB))
+    return document
+
+
+def expand_projection(projection: Optional[dict]) -> Optional[dict]:
+    """
+    A projection naming raw_text also has to name the compressed fields it may be stored in.
+    """
+    if not projection or TEXT_FIELD not in projection:
+        return projection
+    return {**projection, COMPRESSED_FIELD: projection[TEXT_FIELD], CODEC_FIELD: projection[TEXT_FIELD]}
@@ -0,0 +1,71 @@
+"""
+Declared MongoDB indexes of the resume collections.
+
+The storage layer's queries are served by these indexes; they are created by the
+ensure_mongo_indexes management command rather than at import or request time.
+"""
+
+import logging
+from typing import Dict, List, NamedTuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from core.mongodb import MongoDBClient
+from resumes.mongo.storage import RESUME_ANALYSIS, RESUME_CONTENTS
+
+logger = logging.getLogger(__name__)
+
+# Lookups by resume go through _id, which is always indexed
+INDEXES: Dict[str, List[IndexModel]] = {
+    RESUME_CONTENTS: [
+        IndexModel([("user_id", ASCENDING)], name="user_id"),
+    ],
+    RESUME_ANALYSIS: [
+        # A user's analyses, best first (get_resume_analyses_by_user_id)
+        IndexModel([("user_id", ASCENDING), ("overall_score", DESCENDING)], name="user_id_overall_score"),
+        # Top-scored resumes across all users
+        IndexModel([("overall_score", DESCENDING)], name="overall_score"),
+        # Recently (re)analysed resumes
+        IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+    ],
+}
+
+
+class IndexReport(NamedTuple):
+    collection: str
+    created: List[str]
+    unknown: List[str]  # Present on the collection but not declared here
+    dropped: List[str]
+
+
+def ensure_indexes(drop_unknown: bool = False) -> List[IndexReport]:
+    """
+    Create the declared indexes that are missing; existing ones are left untouched.
+
+    Args:
+        drop_unknown (bool): Also drop indexes that are not declared (except _id).
+
+    Returns:
+        List[IndexReport]: What was found and changed, per collection.
+    """
+    reports = []
+    for name, indexes in INDEXES.items():
+        collection = MongoDBClient.get_collection(name)
+        existing = set(collection.index_information())
+        declared = [index.document["name"] for index in indexes]
+
+        created = [index_name for index_name in declared if index_name not in existing]
+        if created:
+            collection.create_indexes([index for index in indexes if index.document["name"] in created])
+            logger.info(f"Created indexes {', '.join(created)} on {name}")
+
+        unknown = sorted(existing - set(declared) - {"_id_"})
+        dropped = []
+        if drop_unknown:
+            for index_name in unknown:
+                collection.drop_index(index_name)
+                dropped.append(index_name)
+                logger.info(f"Dropped index {index_name} from {name}")
+
+        reports.append(IndexReport(name, created, unknown, dropped))
+    return reports
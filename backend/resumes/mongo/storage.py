@@ -3,17 +3,136 @@ MongoDB storage layer for resumes.
 Handles CRUD operations for resume contents and resume analysis.
 """
 
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.cache import get_or_set
 from core.mongodb import MongoDBClient
+from resumes.mongo.compression import (
+    COMPRESSED_FIELD,
+    CODEC_FIELD,
+    TEXT_FIELD,
+    decode_document,
+    encode_document,
+    expand_projection,
+    resolve_codec,
+)
+from pymongo import DESCENDING, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from datetime import datetime, timezone
+from itertools import batched
 from uuid import UUID
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, Iterator, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+RESUME_CONTENTS = "resume_contents"
+RESUME_ANALYSIS = "resume_analysis"
+RESUME_CACHE = "resume_cache"
+
+# Collections are looked up on use, so importing this module never creates a client
+
+
+def resume_content_collection():
+    return MongoDBClient.get_collection(RESUME_CONTENTS)
+
+
+def resume_analysis_collection():
+    return MongoDBClient.get_collection(RESUME_ANALYSIS)
+
 
-# Initialize collections
-resume_content_collection = MongoDBClient.get_collection("resume_contents")
-resume_analysis_collection = MongoDBClient.get_collection("resume_analysis")
+def resume_cache_collection():
+    return MongoDBClient.get_collection(RESUME_CACHE)
+
+
+class BulkUpsertResult(NamedTuple):
+    """
+    Outcome of a batched upsert: documents inserted or replaced, and the error of
+    every document the server rejected, keyed by resume ID.
+    """
+    written: int
+    errors: Dict[str, str]
+
+
+def prepare_document(data: dict, updated_at: datetime) -> str:
+    """
+    Normalize a document for an upsert in place, like the single inserts do.
+
+    Returns:
+        str: The resume ID, also set as _id.
+    """
+    if "resume_id" not in data:
+        raise ValueError("resume_id is required")
+
+    resume_id = str(data["resume_id"])
+    data["_id"] = resume_id
+    data["updated_at"] = updated_at
+
+    if data.get("user_id") is not None:
+        data["user_id"] = int(data["user_id"])
+    return resume_id
+
+
+def bulk_upsert(collection, documents: Iterable[dict], batch_size: Optional[int] = None) -> BulkUpsertResult:
+    """
+    Replace or insert documents by _id with one unordered bulk write per batch.
+
+    Unordered writes keep going past a failed document, so one bad document only
+    costs itself; its error is reported instead of aborting the batch or the run.
+
+    Args:
+        collection: Target collection.
+        documents (Iterable[dict]): Prepared documents, each with an _id. Consumed lazily.
+        batch_size (int, optional): Documents per round trip; defaults to MONGODB_BULK_BATCH_SIZE.
+    """
+    batch_size = batch_size or getattr(settings, 'MONGODB_BULK_BATCH_SIZE', 1000)
+    written = 0
+    errors = {}
+
+    for batch in batched(documents, batch_size):
+        operations = [ReplaceOne({"_id": document["_id"]}, document, upsert=True) for document in batch]
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            written += result.upserted_count + result.matched_count
+        except BulkWriteError as e:
+            # The rest of the batch was still applied; writeErrors index into this batch's operations
+            written += e.details.get("nUpserted", 0) + e.details.get("nMatched", 0)
+            for error in e.details.get("writeErrors", []):
+                errors[batch[error["index"]]["_id"]] = error.get("errmsg", "Write failed")
+
+    if errors:
+        logger.error(f"Bulk write to {collection.name} rejected {len(errors)} documents")
+    return BulkUpsertResult(written, errors)
+
+
+def prepare_updates(updates: dict) -> dict:
+    """
+    Normalize the fields of a partial update in place and stamp updated_at.
+    """
+    updates.pop("_id", None)  # Safely remove _id if present
+    updates["updated_at"] = datetime.now(timezone.utc)
+
+    # If user_id is in updates, ensure it's an integer
+    if updates.get("user_id") is not None:
+        updates["user_id"] = int(updates["user_id"])
+    return updates
 
 
 # ========== Resume Content Operations ==========
 
+def encode_resume_text(document: dict) -> dict:
+    """
+    Compress raw_text of a content document as configured by RESUME_TEXT_COMPRESSION.
+    """
+    return encode_document(
+        document,
+        resolve_codec(getattr(settings, 'RESUME_TEXT_COMPRESSION', None)),
+        getattr(settings, 'RESUME_TEXT_COMPRESSION_MIN_LENGTH', 0),
+    )
+
+
 def insert_resume_content(data: dict) -> UUID:
     """
     Insert parsed resume content into MongoDB.
@@ -31,31 +150,130 @@ def insert_resume_content(data: dict) -> UUID:
     # Ensure resume_id is a string UUID
     resume_id = str(data["resume_id"])
     data["_id"] = resume_id  # MongoDB requires string for _id
+    data["updated_at"] = datetime.now(timezone.utc)  # Validator for conditional GETs
     
     # If user_id is present, ensure it's stored as an integer
     if "user_id" in data:
         data["user_id"] = int(data["user_id"])
 
-    resume_content_collection.replace_one(
+    resume_content_collection().replace_one(
         {"_id": resume_id},
-        data,
+        encode_resume_text({**data}),
         upsert=True
     )
 
     return UUID(resume_id)
 
 
-def get_resume_content_by_resume_id(resume_id: str) -> Optional[Dict]:
+def insert_resume_contents_bulk(documents: Iterable[dict], batch_size: Optional[int] = None) -> BulkUpsertResult:
+    """
+    Upsert many parsed resume contents, one unordered bulk write per batch.
+
+    Args:
+        documents (Iterable[dict]): Resume content data, each with a resume_id.
+        batch_size (int, optional): Documents per round trip; defaults to MONGODB_BULK_BATCH_SIZE.
+
+    Returns:
+        BulkUpsertResult: Number of documents written and per-resume errors.
+    """
+    updated_at = datetime.now(timezone.utc)
+
+    def prepared():
+        for data in documents:
+            prepare_document(data, updated_at)
+            yield encode_resume_text({**data})
+
+    return bulk_upsert(resume_content_collection(), prepared(), batch_size)
+
+
+def get_resume_content_by_resume_id(resume_id: str, projection: Optional[dict] = None) -> Optional[Dict]:
     """
     Retrieve parsed resume content by associated Resume ID.
+    Compressed text is returned decompressed, in raw_text.
 
     Args:
         resume_id (str): ID of the related resume.
+        projection (dict, optional): Fields to return, e.g. {"updated_at": 1} to check
+            whether a client's copy is current without reading raw_text.
 
     Returns:
         Optional[dict]: Resume content document, or None if not found.
     """
-    return resume_content_collection.find_one({"_id": str(resume_id)})
+    document = resume_content_collection().find_one({"_id": str(resume_id)}, expand_projection(projection))
+    return decode_document(document)
+
+
+def get_resume_contents_by_resume_ids(resume_ids: Iterable[str], projection: Optional[dict] = None) -> List[Dict]:
+    """
+    Retrieve parsed resume contents for many resumes in a single query.
+
+    Args:
+        resume_ids (Iterable[str]): IDs of the related resumes.
+        projection (dict, optional): Fields to return.
+
+    Returns:
+        List[dict]: Resume content documents that exist, in no particular order.
+    """
+    ids = [str(resume_id) for resume_id in resume_ids]
+    if not ids:
+        return []
+    cursor = resume_content_collection().find({"_id": {"$in": ids}}, expand_projection(projection))
+    return [decode_document(document) for document in cursor]
+
+
+def iter_resume_content_batches(
+        batch_size: int = 500,
+        projection: Optional[dict] = None,
+        after_id: Optional[str] = None
+) -> Iterator[List[Dict]]:
+    """
+    Stream all resume content documents in _id order, one batch at a time.
+
+    A single cursor is kept open for the whole scan, so memory use is bounded by
+    the batch size regardless of the collection size.
+
+    Args:
+        batch_size (int): Number of documents per yielded batch.
+        projection (dict, optional): Fields to return.
+        after_id (str, optional): Resume the scan after this resume ID.
+
+    Yields:
+        List[dict]: Batches of resume content documents.
+    """
+    query = {"_id": {"$gt": str(after_id)}} if after_id else {}
+    cursor = resume_content_collection().find(query, expand_projection(projection), batch_size=batch_size).sort("_id", 1)
+
+    batch = []
+    try:
+        for document in cursor:
+            batch.append(decode_document(document))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        cursor.close()
+
+
+def text_update(fields: dict) -> dict:
+    """
+    The update document setting fields whose text is already encoded.
+
+    Replacing the text also drops whichever representation it was stored in before.
+    """
+    if TEXT_FIELD not in fields and COMPRESSED_FIELD not in fields:
+        return {"$set": fields}
+
+    stale = (TEXT_FIELD,) if COMPRESSED_FIELD in fields else (COMPRESSED_FIELD, CODEC_FIELD)
+    return {"$set": fields, "$unset": {field: "" for field in stale}}
+
+
+def content_update(updates: dict) -> dict:
+    """
+    The update document for a partial update of resume content.
+    """
+    return text_update(encode_resume_text(prepare_updates(updates)))
 
 
 def update_resume_content(resume_id: str, updates: dict) -> None:
@@ -66,20 +284,79 @@ def update_resume_content(resume_id: str, updates: dict) -> None:
         resume_id (str): ID of the related resume.
         updates (dict): Fields to update.
     """
-    updates.pop("_id", None)  # Safely remove _id if present
-    
-    # If user_id is in updates, ensure it's an integer
-    if "user_id" in updates:
-        updates["user_id"] = int(updates["user_id"])
-
-    resume_content_collection.update_one(
+    resume_content_collection().update_one(
         {"_id": str(resume_id)},
-        {"$set": updates}
+        content_update(updates)
     )
 
 
+def recompress_texts(
+        collection,
+        codec: Optional[str] = None,
+        min_length: Optional[int] = None,
+        batch_size: Optional[int] = None
+) -> Iterator[int]:
+    """
+    Rewrite the texts stored in a collection in the representation given by codec and
+    min_length, which default to the RESUME_TEXT_COMPRESSION settings. Setting codec
+    to '' decompresses.
+
+    Only documents whose representation changes are read back and rewritten. updated_at
+    is kept, since the decoded document is the same; a document replaced since it was
+    read no longer matches its updated_at and is left alone.
+
+    Yields:
+        int: Number of documents rewritten, per batch.
+    """
+    if codec is None:
+        codec = getattr(settings, 'RESUME_TEXT_COMPRESSION', None)
+    codec = resolve_codec(codec)
+    if min_length is None:
+        min_length = getattr(settings, 'RESUME_TEXT_COMPRESSION_MIN_LENGTH', 0)
+    batch_size = batch_size or getattr(settings, 'MONGODB_BULK_BATCH_SIZE', 1000)
+
+    if codec is None:
+        query = {COMPRESSED_FIELD: {"$exists": True}}
+    else:
+        query = {"$or": [
+            {COMPRESSED_FIELD: {"$exists": True}, CODEC_FIELD: {"$ne": codec}},
+            {TEXT_FIELD: {"$type": "string"}, "$expr": {"$gte": [{"$strLenCP": f"${TEXT_FIELD}"}, min_length]}},
+        ]}
+
+    projection = {TEXT_FIELD: 1, COMPRESSED_FIELD: 1, CODEC_FIELD: 1, "updated_at": 1}
+    cursor = collection.find(query, projection, batch_size=batch_size).sort("_id", 1)
+    try:
+        for documents in batched(cursor, batch_size):
+            operations = []
+            for document in documents:
+                encoded = encode_document(decode_document(document), codec, min_length)
+                operations.append(UpdateOne(
+                    {"_id": encoded.pop("_id"), "updated_at": encoded.pop("updated_at", None)},
+                    text_update(encoded),
+                ))
+
+            yield collection.bulk_write(operations, ordered=False).modified_count
+    finally:
+        cursor.close()
+
+
+def recompress_resume_contents(
+        codec: Optional[str] = None,
+        min_length: Optional[int] = None,
+        batch_size: Optional[int] = None
+) -> Iterator[int]:
+    """
+    Rewrite the parsed resume texts; see recompress_texts.
+    """
+    return recompress_texts(resume_content_collection(), codec, min_length, batch_size)
+
+
 # ========== Resume Analysis Operations ==========
 
+def resume_analysis_cache_key(resume_id: str) -> str:
+    return f"resume_analysis:{resume_id}"
+
+
 def insert_resume_analysis(data: dict) -> UUID:
     """
     Insert resume analysis results into MongoDB.
@@ -97,31 +374,113 @@ def insert_resume_analysis(data: dict) -> UUID:
     # Ensure resume_id is a string UUID
     resume_id = str(data["resume_id"])
     data["_id"] = resume_id
+    data["updated_at"] = datetime.now(timezone.utc)
     
     # If user_id is present, ensure it's stored as an integer
     if "user_id" in data:
         data["user_id"] = int(data["user_id"])
 
-    resume_analysis_collection.replace_one(
+    resume_analysis_collection().replace_one(
         {"_id": resume_id},
         data,
         upsert=True
     )
+    cache.delete(resume_analysis_cache_key(resume_id))
 
     return UUID(resume_id)
 
 
-def get_resume_analysis_by_resume_id(resume_id: str) -> Optional[Dict]:
+def insert_resume_analyses_bulk(documents: Iterable[dict], batch_size: Optional[int] = None) -> BulkUpsertResult:
+    """
+    Upsert many resume analysis documents, one unordered bulk write per batch.
+
+    Args:
+        documents (Iterable[dict]): Resume analysis data, each with a resume_id.
+        batch_size (int, optional): Documents per round trip; defaults to MONGODB_BULK_BATCH_SIZE.
+
+    Returns:
+        BulkUpsertResult: Number of documents written and per-resume errors.
+    """
+    updated_at = datetime.now(timezone.utc)
+    resume_ids = []
+
+    def prepared():
+        for data in documents:
+            resume_ids.append(prepare_document(data, updated_at))
+            yield data
+
+    result = bulk_upsert(resume_analysis_collection(), prepared(), batch_size)
+    cache.delete_many([resume_analysis_cache_key(resume_id) for resume_id in resume_ids])
+    return result
+
+
+def get_resume_analysis_by_resume_id(resume_id: str, projection: Optional[dict] = None) -> Optional[Dict]:
     """
     Retrieve resume analysis results by associated Resume ID.
 
+    Documents are served from the cache for RESUME_ANALYSIS_CACHE_TIMEOUT seconds;
+    writes through this module invalidate them. Missing analyses are not cached.
+
     Args:
         resume_id (str): ID of the related resume.
+        projection (dict, optional): Fields to return. Partial documents are not cached,
+            and a cached full document may be returned in their place.
 
     Returns:
         Optional[dict]: Resume analysis document, or None if not found.
     """
-    return resume_analysis_collection.find_one({"_id": str(resume_id)})
+    resume_id = str(resume_id)
+    if projection is not None:
+        return (
+            cache.get(resume_analysis_cache_key(resume_id))
+            or resume_analysis_collection().find_one({"_id": resume_id}, projection)
+        )
+
+    return get_or_set(
+        resume_analysis_cache_key(resume_id),
+        lambda: resume_analysis_collection().find_one({"_id": resume_id}),
+        getattr(settings, 'RESUME_ANALYSIS_CACHE_TIMEOUT', 3600),
+    )
+
+
+def get_resume_analyses_by_resume_ids(resume_ids: Iterable[str], projection: Optional[dict] = None) -> Dict[str, Dict]:
+    """
+    Retrieve resume analysis results for many resumes in a single $in query.
+
+    Args:
+        resume_ids (Iterable[str]): IDs of the related resumes.
+        projection (dict, optional): Fields to return, e.g. {"overall_score": 1}.
+
+    Returns:
+        Dict[str, dict]: Analysis documents keyed by resume ID; missing resumes are omitted.
+    """
+    ids = [str(resume_id) for resume_id in resume_ids]
+    if not ids:
+        return {}
+    cursor = resume_analysis_collection().find({"_id": {"$in": ids}}, projection)
+    return {document["_id"]: document for document in cursor}
+
+
+def get_resume_analyses_by_user_id(
+        user_id: int,
+        projection: Optional[dict] = None,
+        limit: int = 0
+) -> List[Dict]:
+    """
+    Retrieve the analyses of a user's resumes, best scored first.
+
+    Served by the (user_id, overall_score) index declared in resumes.mongo.indexes.
+
+    Args:
+        user_id (int): ID of the resume owner.
+        projection (dict, optional): Fields to return.
+        limit (int): Maximum number of documents; 0 for all.
+
+    Returns:
+        List[dict]: Resume analysis documents.
+    """
+    cursor = resume_analysis_collection().find({"user_id": int(user_id)}, projection)
+    return list(cursor.sort("overall_score", DESCENDING).limit(limit))
 
 
 def update_resume_analysis(resume_id: str, updates: dict) -> None:
@@ -132,13 +491,75 @@ def update_resume_analysis(resume_id: str, updates: dict) -> None:
         resume_id (str): ID of the related resume.
         updates (dict): Fields to update.
     """
-    updates.pop("_id", None)
-    
-    # If user_id is in updates, ensure it's an integer
-    if "user_id" in updates:
-        updates["user_id"] = int(updates["user_id"])
-
-    resume_analysis_collection.update_one(
+    resume_analysis_collection().update_one(
         {"_id": str(resume_id)},
-        {"$set": updates}
-    )
\ No newline at end of file
+        {"$set": prepare_updates(updates)}
+    )
+    cache.delete(resume_analysis_cache_key(resume_id))
+
+
+# ========== Content-Addressed Cache Operations ==========
+
+def get_resume_cache_entry(content_hash: str, projection: Optional[dict] = None) -> Optional[Dict]:
+    """
+    Retrieve cached parse/analysis results for a file by its content hash.
+
+    Args:
+        content_hash (str): SHA-256 hex digest of the uploaded file.
+        projection (dict, optional): Fields to return, e.g. only the analysis.
+
+    Returns:
+        Optional[dict]: Cache entry with raw_text (decompressed), skills and analysis, or None if not cached.
+    """
+    return decode_document(resume_cache_collection().find_one({"_id": content_hash}, expand_projection(projection)))
+
+
+def cache_resume_text(content_hash: str, raw_text: str, skills: Iterable[str]) -> None:
+    """
+    Store the extracted text and indexed skill tokens of a file under its content hash.
+
+    Only complete text is cached; text cut short by an extraction limit is not. The
+    text is compressed like resume contents are.
+
+    Args:
+        content_hash (str): SHA-256 hex digest of the uploaded file.
+        raw_text (str): Extracted resume text.
+        skills (Iterable[str]): Normalized skill tokens of the text.
+    """
+    resume_cache_collection().update_one(
+        {"_id": content_hash},
+        text_update(encode_resume_text({
+            TEXT_FIELD: raw_text,
+            "skills": sorted(skills),
+            "truncated": False,
+            "updated_at": datetime.now(timezone.utc),  # Guards recompression against concurrent rewrites
+        })),
+        upsert=True
+    )
+
+
+def recompress_resume_cache(
+        codec: Optional[str] = None,
+        min_length: Optional[int] = None,
+        batch_size: Optional[int] = None
+) -> Iterator[int]:
+    """
+    Rewrite the texts cached by content hash; see recompress_texts.
+    """
+    return recompress_texts(resume_cache_collection(), codec, min_length, batch_size)
+
+
+def cache_resume_analysis(content_hash: str, analysis: dict, version: int) -> None:
+    """
+    Store the analysis of a file under its content hash.
+
+    Args:
+        content_hash (str): SHA-256 hex digest of the uploaded file.
+        analysis (dict): Scores and feedback, without resume or user identifiers.
+        version (int): Version of the scoring rules that produced the analysis.
+    """
+    resume_cache_collection().update_one(
+        {"_id": content_hash},
+        {"$set": {"analysis": analysis, "analysis_version": version}},
+        upsert=True
+    )
@@ -9,6 +9,7 @@ class ResumeContent(BaseModel):
     resume_id: UUID
     user_id: Optional[int] = None
     raw_text: Optional[str] = None
+    truncated: bool = False  # Extraction stopped at a page or time limit
 
     full_name: Optional[str] = None
     email: Optional[EmailStr] = None
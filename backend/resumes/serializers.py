@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from resumes.models import Resume
 
@@ -9,8 +10,13 @@ class ResumeListSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'file_type', 'status', 'visibility', 'created_at', 'updated_at', 'overall_score']
 
     def get_overall_score(self, obj) -> float | None:
-        from resumes.mongo.storage import get_resume_analysis_by_resume_id
-        analysis = get_resume_analysis_by_resume_id(str(obj.id))
+        # Prefetched for the whole page by ResumeListView when available
+        analyses = self.context.get('analyses')
+        if analyses is not None:
+            analysis = analyses.get(str(obj.id))
+        else:
+            from resumes.mongo.storage import get_resume_analysis_by_resume_id
+            analysis = get_resume_analysis_by_resume_id(str(obj.id), projection={"overall_score": 1})
         if analysis:
             return analysis.get('overall_score')
         return None
@@ -18,8 +24,11 @@ class ResumeListSerializer(serializers.ModelSerializer):
 class ResumeDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resume
-        fields = ['id', 'title', 'file_type', 'status', 'visibility', 'original_filename', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'file_type', 'status', 'original_filename', 'created_at', 'updated_at']
+        fields = [
+            'id', 'title', 'file_type', 'status', 'visibility', 'original_filename', 'is_truncated',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'file_type', 'status', 'original_filename', 'is_truncated', 'created_at', 'updated_at']
 
 class ResumeUploadSerializer(serializers.Serializer):
     """
@@ -32,6 +41,12 @@ class ResumeUploadSerializer(serializers.Serializer):
         default=Resume.Visibility.PRIVATE
     )
 
+    def validate_file(self, value):
+        max_bytes = getattr(settings, 'RESUME_MAX_BYTES', None)
+        if max_bytes and value.size > max_bytes:
+            raise serializers.ValidationError(f"File is too large. The limit is {max_bytes // (1024 * 1024)} MB.")
+        return value
+
 
 class ResumeActionResponseSerializer(serializers.Serializer):
     """
@@ -51,6 +66,7 @@ class ResumeContentSerializer(serializers.Serializer):
     linkedin_url = serializers.URLField(allow_blank=True, required=False)
     summary = serializers.CharField(allow_blank=True, required=False)
     raw_text = serializers.CharField(allow_blank=True, required=False)
+    truncated = serializers.BooleanField(required=False)
     created_at = serializers.DateTimeField(required=False)
     updated_at = serializers.DateTimeField(required=False)
 
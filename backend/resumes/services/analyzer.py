@@ -7,23 +7,37 @@ import re
 from typing import List, Tuple, Optional
 from uuid import UUID
 
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.probability import FreqDist
-
-import os
-
-nltk_data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'nltk_data')
-nltk.data.path.append(os.path.abspath(nltk_data_path))
-
 from resumes.models import Resume
-from resumes.mongo.storage import insert_resume_analysis, get_resume_content_by_resume_id
+from resumes.mongo.storage import (
+    insert_resume_analysis,
+    get_resume_content_by_resume_id,
+    get_resume_cache_entry,
+    cache_resume_analysis,
+)
 from resumes.schemas.resume import ResumeAnalysis
+from resumes.services.document import ResumeDocument
 from analytics.utils import log_action
 from analytics.models import LogEntry
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the scoring rules change so cached analyses are recomputed
+ANALYSIS_VERSION = 1
+
+# Fields of an analysis that depend only on the resume text
+CACHED_ANALYSIS_FIELDS = (
+    'overall_score',
+    'content_score',
+    'formatting_score',
+    'ats_compatibility_score',
+    'strengths',
+    'weaknesses',
+    'improvement_suggestions',
+)
+
+# Fields of a content document the analysis reads
+CONTENT_PROJECTION = {"raw_text": 1, "user_id": 1}
+
 def fix_resume_content_data(data: dict) -> dict:
     if "resume_id" in data and not isinstance(data["resume_id"], UUID):
         try:
@@ -44,26 +58,23 @@ class ResumeAnalysisService:
     """
 
     @staticmethod
-    def extract_keywords(raw_text: str) -> List[str]:
-        tokens = word_tokenize(raw_text.lower())
-        freq = FreqDist(tokens)
-        keywords = [word for word, count in freq.most_common(20) if len(word) > 2]
+    def extract_keywords(doc: ResumeDocument) -> List[str]:
+        keywords = [word for word, count in doc.frequencies.most_common(20) if len(word) > 2]
         return keywords
 
     @staticmethod
-    def analyze_content_quality(raw_text: str) -> Tuple[float, List[str], List[str]]:
+    def analyze_content_quality(doc: ResumeDocument) -> Tuple[float, List[str], List[str]]:
         strengths = []
         weaknesses = []
 
-        tokens = word_tokenize(raw_text)
-        word_count = len(tokens)
+        word_count = doc.word_count
 
         if word_count >= 300:
             strengths.append("Resume has sufficient length.")
         else:
             weaknesses.append("Resume is too short. Aim for at least 300 words.")
 
-        keywords = ResumeAnalysisService.extract_keywords(raw_text)
+        keywords = ResumeAnalysisService.extract_keywords(doc)
         if any(word in keywords for word in ["summary", "objective"]):
             strengths.append("Resume includes a summary or objective section.")
         else:
@@ -74,11 +85,11 @@ class ResumeAnalysisService:
         return score, strengths, weaknesses
 
     @staticmethod
-    def analyze_formatting(raw_text: str) -> Tuple[float, List[str], List[str]]:
+    def analyze_formatting(doc: ResumeDocument) -> Tuple[float, List[str], List[str]]:
         strengths = []
         weaknesses = []
 
-        lines = raw_text.splitlines()
+        lines = doc.lines
         empty_lines = sum(1 for line in lines if not line.strip())
 
         if empty_lines > 5:
@@ -100,17 +111,17 @@ class ResumeAnalysisService:
         return min(score, 10.0), strengths, weaknesses
 
     @staticmethod
-    def analyze_ats_compatibility(raw_text: str) -> Tuple[float, List[str], List[str]]:
+    def analyze_ats_compatibility(doc: ResumeDocument) -> Tuple[float, List[str], List[str]]:
         strengths = []
         weaknesses = []
 
-        if '\t' not in raw_text:
+        if '\t' not in doc.raw_text:
             strengths.append("No tables detected, good for ATS parsing.")
         else:
             weaknesses.append("Avoid using tables; they can confuse ATS.")
 
         sections = ["experience", "education", "skills", "projects"]
-        detected_sections = [section for section in sections if re.search(rf'\b{section}\b', raw_text.lower())]
+        detected_sections = [section for section in sections if re.search(rf'\b{section}\b', doc.lowered)]
 
         if len(detected_sections) >= 3:
             strengths.append("Resume contains standard sections recognizable by ATS.")
@@ -118,46 +129,80 @@ class ResumeAnalysisService:
             weaknesses.append("Include standard sections like Experience, Education, Skills.")
 
         score = 5.0
-        score += 2.0 if '\t' not in raw_text else -2.0
+        score += 2.0 if '\t' not in doc.raw_text else -2.0
         score += len(detected_sections)
 
         return min(score, 10.0), strengths, weaknesses
 
+    @classmethod
+    def build_analysis(cls, resume_id, user_id: Optional[int], raw_text: str) -> ResumeAnalysis:
+        """
+        Score resume text without touching any database, so it can run in worker processes.
+        """
+        doc = ResumeDocument(raw_text)
+
+        content_score, content_strengths, content_weaknesses = cls.analyze_content_quality(doc)
+        formatting_score, formatting_strengths, formatting_weaknesses = cls.analyze_formatting(doc)
+        ats_score, ats_strengths, ats_weaknesses = cls.analyze_ats_compatibility(doc)
+
+        overall_score = round((content_score * 0.4 + formatting_score * 0.3 + ats_score * 0.3), 2)
+
+        strengths = content_strengths + formatting_strengths + ats_strengths
+        weaknesses = content_weaknesses + formatting_weaknesses + ats_weaknesses
+
+        improvement_suggestions = [f"Improve: {weak}" for weak in weaknesses[:5]]
+
+        return ResumeAnalysis(
+            resume_id=resume_id,
+            user_id=user_id,
+            overall_score=overall_score,
+            content_score=content_score,
+            formatting_score=formatting_score,
+            ats_compatibility_score=ats_score,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            improvement_suggestions=improvement_suggestions,
+        )
+
+    @staticmethod
+    def get_cached_analysis(resume: Resume) -> Optional[ResumeAnalysis]:
+        """
+        Reuse the analysis of an identical file scored with the current rules, if any.
+
+        Resumes with truncated text neither reuse nor store cached analyses, which
+        describe the complete text of the file.
+        """
+        if not resume.content_hash or resume.is_truncated:
+            return None
+
+        cached = get_resume_cache_entry(resume.content_hash, {"analysis": 1, "analysis_version": 1})
+        if not cached or cached.get('analysis_version') != ANALYSIS_VERSION or not cached.get('analysis'):
+            return None
+
+        logger.info(f"Reusing cached analysis for resume {resume.id} ({resume.content_hash})")
+        return ResumeAnalysis(resume_id=resume.id, user_id=resume.user.id, **cached['analysis'])
+
     @classmethod
     def analyze_resume(cls, resume_id: str) -> Optional[str]:
         try:
             resume = Resume.objects.get(id=resume_id)
 
-            content_doc = get_resume_content_by_resume_id(str(resume.id))
+            content_doc = get_resume_content_by_resume_id(str(resume.id), CONTENT_PROJECTION)
             if not content_doc:
                 logger.error(f"No parsed content found for resume {resume_id}.")
                 return None
 
             content_doc = fix_resume_content_data(content_doc)
-            raw_text = content_doc.get('raw_text', '')
-
-            content_score, content_strengths, content_weaknesses = cls.analyze_content_quality(raw_text)
-            formatting_score, formatting_strengths, formatting_weaknesses = cls.analyze_formatting(raw_text)
-            ats_score, ats_strengths, ats_weaknesses = cls.analyze_ats_compatibility(raw_text)
 
-            overall_score = round((content_score * 0.4 + formatting_score * 0.3 + ats_score * 0.3), 2)
-
-            strengths = content_strengths + formatting_strengths + ats_strengths
-            weaknesses = content_weaknesses + formatting_weaknesses + ats_weaknesses
-
-            improvement_suggestions = [f"Improve: {weak}" for weak in weaknesses[:5]]
-
-            analysis = ResumeAnalysis(
-                resume_id=resume.id,
-                user_id=resume.user.id,
-                overall_score=overall_score,
-                content_score=content_score,
-                formatting_score=formatting_score,
-                ats_compatibility_score=ats_score,
-                strengths=strengths,
-                weaknesses=weaknesses,
-                improvement_suggestions=improvement_suggestions,
-            )
+            analysis = cls.get_cached_analysis(resume)
+            if analysis is None:
+                analysis = cls.build_analysis(resume.id, resume.user.id, content_doc.get('raw_text', ''))
+                if resume.content_hash and not resume.is_truncated:
+                    cache_resume_analysis(
+                        resume.content_hash,
+                        {field: getattr(analysis, field) for field in CACHED_ANALYSIS_FIELDS},
+                        ANALYSIS_VERSION,
+                    )
             insert_resume_analysis(analysis.dict())
 
             log_action(
@@ -0,0 +1,102 @@
+"""
+Service for re-scoring the whole resume corpus in batches.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Iterable, List, Optional
+
+from resumes.mongo.storage import (
+    iter_resume_content_batches,
+    get_resume_contents_by_resume_ids,
+    insert_resume_analyses_bulk,
+)
+from resumes.services.analyzer import ResumeAnalysisService
+from analytics.utils import log_actions
+from analytics.models import LogEntry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_PROJECTION = {"raw_text": 1, "user_id": 1}
+
+
+def analyze_content_document(content_doc: dict) -> Optional[dict]:
+    """
+    Build the analysis document for one resume content document.
+
+    Runs inside pool worker processes, so it must stay free of database access.
+    """
+    try:
+        analysis = ResumeAnalysisService.build_analysis(
+            content_doc["_id"],
+            content_doc.get("user_id"),
+            content_doc.get("raw_text") or "",
+        )
+        return analysis.dict()
+    except Exception as e:
+        logger.error(f"Failed to analyze resume {content_doc.get('_id')}: {e}")
+        return None
+
+
+class BulkAnalysisService:
+    """
+    Service for analyzing many resumes per database round trip.
+    """
+
+    @staticmethod
+    def analyze_batch(content_docs: List[dict], executor=None, chunksize: int = 1) -> List[dict]:
+        if executor is None:
+            results = [analyze_content_document(doc) for doc in content_docs]
+        else:
+            results = list(executor.map(analyze_content_document, content_docs, chunksize=chunksize))
+        return [analysis for analysis in results if analysis is not None]
+
+    @staticmethod
+    def store_batch(analyses: List[dict]) -> int:
+        result = insert_resume_analyses_bulk(analyses)
+
+        entries = []
+        for analysis in analyses:
+            error = result.errors.get(str(analysis["resume_id"]))
+            entries.append({
+                "user_id": analysis.get("user_id"),
+                "object_type": "resume",
+                "object_id": analysis["resume_id"],
+                "action": LogEntry.ActionType.ERROR if error else LogEntry.ActionType.ANALYZE,
+                "message": f"Failed to store analysis: {error}" if error else "Resume analyzed successfully (bulk).",
+            })
+        log_actions(entries)
+        return result.written
+
+    @classmethod
+    def analyze_resumes(cls, resume_ids: Iterable[str]) -> int:
+        """
+        Re-score the given resumes in the current process.
+        """
+        content_docs = get_resume_contents_by_resume_ids(resume_ids, CONTENT_PROJECTION)
+        analyses = cls.analyze_batch(content_docs)
+        return cls.store_batch(analyses)
+
+    @classmethod
+    def analyze_all(cls, batch_size: int = 500, workers: int = 1, after_id: Optional[str] = None) -> int:
+        """
+        Stream every parsed resume from MongoDB and re-score it.
+
+        Batches are analyzed in a process pool when workers > 1, then written
+        back with one bulk write and one batched log insert per batch.
+
+        Returns:
+            int: Number of analysis documents written.
+        """
+        total = 0
+        chunksize = max(1, batch_size // (workers * 4))
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+        with pool as executor:
+            for content_docs in iter_resume_content_batches(batch_size, CONTENT_PROJECTION, after_id):
+                analyses = cls.analyze_batch(content_docs, executor, chunksize)
+                total += cls.store_batch(analyses)
+                logger.info(f"Bulk analysis wrote {total} resumes (last id {content_docs[-1]['_id']})")
+
+        return total
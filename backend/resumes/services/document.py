@@ -0,0 +1,63 @@
+"""
+Pre-processed resume text shared by the resume analyzers.
+"""
+
+import os
+from functools import cached_property
+from typing import List, Set
+
+import nltk
+from nltk.tokenize import word_tokenize
+from nltk.probability import FreqDist
+
+nltk_data_path = os.path.join(os.path.dirname(__file__), '..', '..', 'nltk_data')
+if os.path.abspath(nltk_data_path) not in nltk.data.path:
+    nltk.data.path.append(os.path.abspath(nltk_data_path))
+
+
+class ResumeDocument:
+    """
+    Resume text tokenized once and shared by every analyzer.
+
+    Each view of the text (tokens, lowercased text, lines, frequency table) is
+    computed on first access and cached on the instance, so adding an analyzer
+    does not add another full pass over the raw text.
+    """
+
+    def __init__(self, raw_text: str):
+        self.raw_text = raw_text or ''
+
+    @cached_property
+    def lowered(self) -> str:
+        return self.raw_text.lower()
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.raw_text.splitlines()
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        return word_tokenize(self.raw_text)
+
+    @cached_property
+    def lowered_tokens(self) -> List[str]:
+        """
+        The tokens of the original text, lowercased.
+
+        Usually the same as word_tokenize(raw_text.lower()). Sentence splitting is
+        case-sensitive though, so an abbreviation followed by a capitalized word
+        ("Acme Inc. Built") yields "inc", "." here where the lowercased text keeps "inc.".
+        """
+        return [token.lower() for token in self.tokens]
+
+    @cached_property
+    def token_set(self) -> Set[str]:
+        return set(self.lowered_tokens)
+
+    @cached_property
+    def frequencies(self) -> FreqDist:
+        return FreqDist(self.lowered_tokens)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
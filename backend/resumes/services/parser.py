@@ -2,11 +2,13 @@
 Service for parsing uploaded resumes and storing the parsed content.
 """
 
-import io
 import logging
-from typing import Optional
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional
 
 import docx2txt
+from django.conf import settings
 
 try:
     import PyPDF2
@@ -14,60 +16,158 @@ except ImportError:
     PyPDF2 = None
 
 from resumes.models import Resume
-from resumes.mongo.storage import insert_resume_content
+from resumes.mongo.storage import insert_resume_content, get_resume_cache_entry, cache_resume_text
 from resumes.schemas.resume import ResumeContent
+from resumes.services.document import ResumeDocument
+from resumes.services.pdf_extraction import (
+    ExtractionTimeout,
+    can_fork_workers,
+    extract_pages,
+    extract_pages_parallel,
+    log_page_timings,
+    time_limit,
+)
+from resumes.services.skill_index import ResumeSkillIndexService
 from analytics.utils import log_action
 from analytics.models import LogEntry
 
 logger = logging.getLogger(__name__)
 
 
+class ExtractedText(NamedTuple):
+    """
+    Text extracted from a resume file, and whether a page or time limit cut it short.
+    """
+    text: str
+    truncated: bool = False
+
+
 class ResumeParserService:
     """
     Service for extracting text content from resume files and saving parsed data.
     """
 
     @staticmethod
-    def extract_text_from_pdf(file) -> str:
+    def use_parallel_extraction(path: Optional[str], page_count: int) -> bool:
+        """
+        Large PDFs stored on the local filesystem are split across a process pool,
+        unless the current process is not allowed to start one.
+        """
+        threshold = getattr(settings, 'RESUME_PDF_PARALLEL_PAGE_THRESHOLD', None)
+        workers = getattr(settings, 'RESUME_PDF_PARALLEL_WORKERS', 1)
+
+        return bool(
+            path and threshold and workers > 1
+            and page_count >= threshold
+            and can_fork_workers()
+        )
+
+    @classmethod
+    def extract_text_from_pdf(
+        cls,
+        file,
+        max_pages: Optional[int] = None,
+        path: Optional[str] = None,
+        page_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> ExtractedText:
+        """
+        Extract the text of a PDF, page by page and in page order.
+
+        Extraction stops early, keeping the pages read so far, when a page takes
+        longer than page_timeout or the document runs past its deadline.
+
+        Args:
+            file: Open binary handle of the PDF.
+            max_pages: Pages past this limit are ignored.
+            path: Local path of the same file. Required for the page-parallel mode,
+                since pool workers open the document themselves.
+            page_timeout: Seconds a single page may take.
+            deadline: time.time() value by which the whole document must be done.
+        """
         if PyPDF2 is None:
             raise ImportError("PyPDF2 must be installed to parse PDF files.")
 
-        pdf_text = ""
         try:
-            file_obj = io.BytesIO(file.read())
-            file.seek(0)
-
-            reader = PyPDF2.PdfReader(file_obj)
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    pdf_text += text
+            reader = PyPDF2.PdfReader(file)
+            page_count = len(reader.pages)
+            truncated = False
+
+            if max_pages is not None and page_count > max_pages:
+                logger.warning(f"PDF has {page_count} pages, extracting only the first {max_pages}")
+                page_count = max_pages
+                truncated = True
+
+            result = None
+            if cls.use_parallel_extraction(path, page_count):
+                try:
+                    result = extract_pages_parallel(
+                        path, page_count, settings.RESUME_PDF_PARALLEL_WORKERS, page_timeout, deadline
+                    )
+                except (OSError, AssertionError, BrokenProcessPool) as e:
+                    # The pool itself could not run (e.g. no fork in this process); the PDF may still be fine
+                    logger.warning(f"Parallel PDF extraction unavailable, falling back to serial: {e}")
+
+            if result is None:
+                result = extract_pages(reader, 0, page_count, page_timeout, deadline)
         except Exception as e:
             logger.error(f"Error reading PDF: {e}")
             raise ValueError("Unable to parse PDF file.")
 
-        return pdf_text.strip()
+        pages, timed_out = result
+        log_page_timings(pages, path or "PDF")
+        return ExtractedText("".join(page.text for page in pages).strip(), truncated or timed_out)
 
     @staticmethod
-    def extract_text_from_docx(file) -> str:
+    def extract_text_from_docx(file, timeout: Optional[float] = None) -> ExtractedText:
         try:
-            file_obj = io.BytesIO(file.read())
-            file.seek(0)
-            text = docx2txt.process(file_obj)
-            return text.strip()
+            # docx2txt opens the handle as a zip archive and inflates one member at a time
+            with time_limit(timeout):
+                text = docx2txt.process(file)
+            return ExtractedText(text.strip())
+        except ExtractionTimeout:
+            # docx2txt returns the document as a whole, so there is no partial text to keep
+            logger.error(f"DOCX extraction exceeded {timeout}s")
+            raise ValueError("DOCX file took too long to parse.")
         except Exception as e:
             logger.error(f"Error reading DOCX: {e}")
             raise ValueError("Unable to parse DOCX file.")
 
     @classmethod
-    def extract_text(cls, resume: Resume) -> str:
-        if resume.file_type.lower() == 'pdf':
-            return cls.extract_text_from_pdf(resume.file)
-        elif resume.file_type.lower() == 'docx':
-            return cls.extract_text_from_docx(resume.file)
-        else:
+    def extract_text(cls, resume: Resume) -> ExtractedText:
+        file_type = resume.file_type.lower()
+        if file_type not in ('pdf', 'docx'):
             raise ValueError(f"Unsupported file type: {resume.file_type}")
 
+        max_bytes = getattr(settings, 'RESUME_MAX_BYTES', None)
+        if max_bytes and resume.file.size > max_bytes:
+            raise ValueError(f"Resume file is {resume.file.size} bytes, the limit is {max_bytes}.")
+
+        timeout = getattr(settings, 'RESUME_EXTRACTION_TIMEOUT', None)
+        deadline = time.time() + timeout if timeout else None
+
+        # Read straight from the stored file instead of buffering it in memory
+        with resume.file.open('rb') as file:
+            if file_type == 'pdf':
+                return cls.extract_text_from_pdf(
+                    file,
+                    getattr(settings, 'RESUME_MAX_PAGES', None),
+                    cls.get_local_path(resume),
+                    getattr(settings, 'RESUME_EXTRACTION_PAGE_TIMEOUT', None),
+                    deadline,
+                )
+            return cls.extract_text_from_docx(file, timeout)
+
+    @staticmethod
+    def get_local_path(resume: Resume) -> Optional[str]:
+        """
+        Filesystem path of the resume file, or None for remote storages.
+        """
+        try:
+            return resume.file.path
+        except NotImplementedError:
+            return None
+
     @classmethod
     def parse_resume(cls, resume_id: str) -> Optional[str]:
         """
@@ -76,11 +176,33 @@ class ResumeParserService:
         try:
             resume = Resume.objects.get(id=resume_id)
 
-            # Update status to processing
+            # Attempts that never finished were killed mid-extraction (e.g. by the task
+            # time limit); don't keep feeding the same file to the workers
+            max_attempts = getattr(settings, 'RESUME_MAX_EXTRACTION_ATTEMPTS', None)
+            if max_attempts and resume.extraction_attempts >= max_attempts:
+                raise ValueError(f"Giving up after {resume.extraction_attempts} unfinished extraction attempts.")
+
+            # Update status to processing; saved before extracting so a killed worker leaves a trace
             resume.status = Resume.Status.PROCESSING
+            resume.extraction_attempts += 1
             resume.save()
 
-            text = cls.extract_text(resume)
+            # Identical files were already extracted and tokenized once; reuse that work.
+            # Entries cut short by a limit (cached before they were excluded) are extracted again
+            cached = get_resume_cache_entry(
+                resume.content_hash, {"raw_text": 1, "skills": 1, "truncated": 1}
+            ) if resume.content_hash else None
+            if cached and cached.get('raw_text') is not None and not cached.get('truncated'):
+                logger.info(f"Reusing cached text for resume {resume_id} ({resume.content_hash})")
+                extracted = ExtractedText(cached['raw_text'])
+                skills = cached.get('skills')
+            else:
+                extracted = cls.extract_text(resume)
+                skills = None
+
+            text = extracted.text
+            if extracted.truncated:
+                logger.warning(f"Text of resume {resume_id} was truncated by an extraction limit")
 
             logger.info(f"Parsing resume {resume_id}")
             # Save parsed content to MongoDB
@@ -88,6 +210,7 @@ class ResumeParserService:
                 resume_id=resume.id,  # This is a UUID object
                 user_id=resume.user.id,  # This is an integer
                 raw_text=text,
+                truncated=extracted.truncated,
                 full_name=None,
                 email=None,
                 phone=None,
@@ -99,8 +222,21 @@ class ResumeParserService:
             logger.info(f"Inserting content of resume {resume_id}")
             insert_resume_content(content.dict())
 
-            # Update status to completed
+            # The skill index and cache are derived data and can be rebuilt, so don't fail the parse over them
+            try:
+                if skills is None:
+                    skills = ResumeSkillIndexService.extract_skill_tokens(ResumeDocument(text))
+                    # Partial text may come from one slow run; later uploads of the file get a full attempt
+                    if resume.content_hash and not extracted.truncated:
+                        cache_resume_text(resume.content_hash, text, skills)
+                ResumeSkillIndexService.index_skills(resume.id, skills)
+            except Exception as e:
+                logger.error(f"Failed to index skills of resume {resume_id}: {e}")
+
+            # Update status to completed; partial text is a final result, not a reason to retry
             resume.status = Resume.Status.COMPLETED
+            resume.is_truncated = extracted.truncated
+            resume.extraction_attempts = 0
             resume.save()
 
             # Log successful parse
@@ -109,7 +245,7 @@ class ResumeParserService:
                 object_type='resume',
                 object_id=resume.id,
                 action=LogEntry.ActionType.PARSE,
-                message="Resume parsed successfully."
+                message="Resume parsed with truncated text." if extracted.truncated else "Resume parsed successfully."
             )
 
             return str(resume.id)
@@ -121,7 +257,7 @@ class ResumeParserService:
         except Exception as e:
             logger.error(f"Failed to parse resume {resume_id}: {e}")
 
-            Resume.objects.filter(id=resume_id).update(status=Resume.Status.FAILED)
+            Resume.objects.filter(id=resume_id).update(status=Resume.Status.FAILED, extraction_attempts=0)
 
             if resume := Resume.objects.filter(id=resume_id).first():
                 log_action(
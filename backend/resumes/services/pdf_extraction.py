@@ -0,0 +1,169 @@
+"""
+Page-level PDF text extraction helpers.
+
+This module deliberately has no Django imports: its functions run inside
+process pool workers, which may start without a configured Django project.
+"""
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional, Tuple
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+logger = logging.getLogger(__name__)
+
+
+class PageText(NamedTuple):
+    """
+    Text extracted from one PDF page and how long the extraction took.
+    """
+    number: int
+    text: str
+    seconds: float
+
+
+class ExtractionTimeout(Exception):
+    """
+    Raised inside an extraction step that ran past its time budget.
+    """
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]):
+    """
+    Raise ExtractionTimeout in the managed block once `seconds` of wall time have passed.
+
+    Relies on SIGALRM, so it is only enforced in the main thread on POSIX systems;
+    elsewhere the block runs unbounded and only the between-page deadline checks apply.
+    """
+    if not seconds or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def raise_timeout(signum, frame):
+        raise ExtractionTimeout(f"Extraction exceeded {seconds:.1f}s")
+
+    previous = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def extract_pages(
+    reader, start: int, stop: int, page_timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Tuple[List[PageText], bool]:
+    """
+    Extract pages [start, stop) of an open PdfReader, in page order, within a time budget.
+
+    Args:
+        reader: PdfReader of the document.
+        start: Index of the first page.
+        stop: Index past the last page.
+        page_timeout: Seconds a single page may take.
+        deadline: time.time() value by which the whole document must be done.
+
+    Returns:
+        Tuple[List[PageText], bool]: The extracted pages, and whether extraction
+        stopped early because a budget ran out.
+    """
+    pages = []
+    for index in range(start, stop):
+        budget = page_timeout
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                logger.warning(f"Document time budget ran out before page {index + 1}")
+                return pages, True
+            budget = min(budget, remaining) if budget else remaining
+
+        started = time.perf_counter()
+        try:
+            with time_limit(budget):
+                text = reader.pages[index].extract_text() or ""
+        except ExtractionTimeout:
+            logger.warning(f"Page {index + 1} exceeded its {budget:.1f}s time budget, stopping extraction")
+            return pages, True
+
+        pages.append(PageText(index + 1, text, time.perf_counter() - started))
+
+    return pages, False
+
+
+def extract_page_range(
+    path: str, start: int, stop: int, page_timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Tuple[List[PageText], bool]:
+    """
+    Process pool entry point: extract pages [start, stop) of the PDF stored at path.
+    """
+    with open(path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return extract_pages(reader, start, stop, page_timeout, deadline)
+
+
+def can_fork_workers() -> bool:
+    """
+    Daemonic processes (e.g. some Celery pool children) cannot start a process pool.
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def extract_pages_parallel(
+    path: str, page_count: int, workers: int, page_timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Tuple[List[PageText], bool]:
+    """
+    Split the pages of a PDF into contiguous ranges and extract them in a process pool.
+
+    Ranges are smaller than page_count / workers so a few slow pages don't leave
+    the other workers idle. Results are returned in page order; if a range runs
+    out of time, later ranges are dropped so the text never has gaps. Dropped
+    ranges that are already running are not waited for: they finish in the
+    background, bounded by the same page and document budgets.
+    """
+    chunk_count = min(page_count, workers * 2)
+    chunk_size = -(-page_count // chunk_count)  # ceiling division
+    ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(ranges)))
+    try:
+        futures = [
+            executor.submit(extract_page_range, path, start, stop, page_timeout, deadline)
+            for start, stop in ranges
+        ]
+
+        pages = []
+        for future in futures:
+            chunk, truncated = future.result()
+            pages.extend(chunk)
+            if truncated:
+                return pages, True
+
+        return pages, False
+    finally:
+        # Leaving a `with` block would wait for every running range, even the dropped ones
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def log_page_timings(pages: List[PageText], label: str) -> None:
+    if not pages:
+        return
+
+    total = sum(page.seconds for page in pages)
+    slowest = max(pages, key=lambda page: page.seconds)
+    logger.info(
+        f"Extracted {len(pages)} PDF pages of {label} in {total:.2f}s of page time "
+        f"(slowest: page {slowest.number}, {slowest.seconds:.2f}s)"
+    )
+    for page in pages:
+        logger.debug(f"{label} page {page.number}: {page.seconds:.3f}s, {len(page.text)} chars")
@@ -0,0 +1,101 @@
+"""
+Service for maintaining and querying the inverted skill index of resumes.
+"""
+
+import logging
+from typing import Iterable, List, Dict, Set
+
+from django.db import transaction
+from django.db.models import Count, QuerySet
+
+from resumes.models import ResumeSkill
+from resumes.services.document import ResumeDocument
+from jobs.services.matching_service import MatchingService
+
+logger = logging.getLogger(__name__)
+
+MAX_SKILL_LENGTH = ResumeSkill._meta.get_field('skill').max_length
+
+
+class ResumeSkillIndexService:
+    """
+    Service mapping normalized skill tokens to the resumes that contain them.
+    """
+
+    @staticmethod
+    def extract_skill_tokens(doc: ResumeDocument) -> Set[str]:
+        """
+        Normalized tokens worth indexing: the same tokens MatchingService compares
+        job skills against, minus punctuation and oversized tokens.
+        """
+        return {
+            token for token in doc.token_set
+            if len(token) <= MAX_SKILL_LENGTH and any(char.isalnum() for char in token)
+        }
+
+    @classmethod
+    def index_resume(cls, resume_id, doc: ResumeDocument) -> int:
+        """
+        Replace the index entries of a resume with the tokens of its parsed text.
+
+        Returns:
+            int: Number of skill tokens indexed.
+        """
+        return cls.index_skills(resume_id, cls.extract_skill_tokens(doc))
+
+    @staticmethod
+    @transaction.atomic
+    def index_skills(resume_id, skills: Iterable[str]) -> int:
+        """
+        Replace the index entries of a resume with already extracted skill tokens.
+
+        Returns:
+            int: Number of skill tokens indexed.
+        """
+        skills = set(skills)
+
+        ResumeSkill.objects.filter(resume_id=resume_id).delete()
+        ResumeSkill.objects.bulk_create(
+            [ResumeSkill(resume_id=resume_id, skill=skill) for skill in sorted(skills)],
+            batch_size=1000,
+        )
+
+        logger.info(f"Indexed {len(skills)} skill tokens for resume {resume_id}")
+        return len(skills)
+
+    @staticmethod
+    def rank_resumes(job_skills: Iterable[str], resumes: QuerySet, limit: int = 50) -> List[Dict]:
+        """
+        Rank resumes by how many of the job skills they contain.
+
+        Only the posting lists of the requested skills are read, so the cost
+        grows with the number of matching resumes rather than the corpus size.
+
+        Args:
+            job_skills: Skills required by the job.
+            resumes: Resumes the caller is allowed to see.
+            limit: Maximum number of results.
+
+        Returns:
+            List[dict]: resume_id, matched_skills and match_score (0-100), best first.
+        """
+        skills = {MatchingService.normalize_skill(skill) for skill in job_skills if skill and skill.strip()}
+        if not skills:
+            return []
+
+        rows = (
+            ResumeSkill.objects
+            .filter(skill__in=skills, resume__in=resumes)
+            .values('resume_id')
+            .annotate(matched_skills=Count('id'))
+            .order_by('-matched_skills', 'resume_id')[:limit]
+        )
+
+        return [
+            {
+                'resume_id': row['resume_id'],
+                'matched_skills': row['matched_skills'],
+                'match_score': round(row['matched_skills'] / len(skills) * 100, 2),
+            }
+            for row in rows
+        ]
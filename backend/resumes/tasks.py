@@ -3,9 +3,11 @@ Celery tasks for background processing of resume operations.
 """
 
 import logging
+import uuid
 from celery import shared_task
 from celery.exceptions import MaxRetriesExceededError
 from django.conf import settings
+from django.db import transaction
 
 from resumes.models import Resume
 from resumes.services.parser import ResumeParserService
@@ -15,6 +17,36 @@ from resumes.services.analyzer import ResumeAnalysisService
 logger = logging.getLogger(__name__)
 
 
+def dispatch_resume_processing(resume_id) -> str:
+    """
+    Enqueue the parse -> analyze pipeline for a resume on the Celery broker.
+
+    The task is published only after the surrounding transaction commits so the
+    worker never races the upload request for the Resume row. When
+    RESUME_PROCESSING_SYNC is enabled (tests only) the pipeline runs eagerly in
+    the calling process instead.
+
+    Args:
+        resume_id: The UUID of the uploaded resume
+
+    Returns:
+        str: The Celery task id that can be used as a job handle
+    """
+    resume_id = str(resume_id)
+    task_id = str(uuid.uuid4())
+
+    if getattr(settings, 'RESUME_PROCESSING_SYNC', False):
+        logger.info(f"Processing resume {resume_id} synchronously (task {task_id})")
+        process_resume.apply(args=[resume_id], task_id=task_id)
+        return task_id
+
+    transaction.on_commit(
+        lambda: process_resume.apply_async(args=[resume_id], task_id=task_id)
+    )
+    logger.info(f"Queued processing of resume {resume_id} as task {task_id}")
+    return task_id
+
+
 @shared_task(
     bind=True,
     autoretry_for=(Exception,),
@@ -125,4 +157,59 @@ def analyze_resume(self, resume_id):
         logger.error(f"Error analyzing resume {resume_id}: {e}")
         
         # Retry with exponential backoff
-        raise self.retry(exc=e) 
\ No newline at end of file
+        raise self.retry(exc=e)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=5,
+    retry_backoff_max=300,
+    retry_kwargs={'max_retries': 3},
+    name='resumes.tasks.analyze_resume_batch'
+)
+def analyze_resume_batch(self, resume_ids):
+    """
+    Re-score a batch of parsed resumes with bulk Mongo and log writes.
+    
+    Args:
+        resume_ids (list[str]): UUIDs of the resumes to analyze
+    
+    Returns:
+        int: Number of analysis documents written
+    """
+    from resumes.services.bulk_analyzer import BulkAnalysisService
+
+    try:
+        written = BulkAnalysisService.analyze_resumes(resume_ids)
+        logger.info(f"Bulk analyzed {written} of {len(resume_ids)} resumes")
+        return written
+    except Exception as e:
+        logger.error(f"Error bulk analyzing {len(resume_ids)} resumes: {e}")
+        raise self.retry(exc=e)
+
+
+@shared_task(name='resumes.tasks.bulk_analyze_resumes')
+def bulk_analyze_resumes(batch_size=500, after_id=None):
+    """
+    Re-score the whole resume corpus by fanning batches out to analyze_resume_batch.
+    
+    Only resume IDs are streamed here; the analysis itself runs in parallel
+    across the Celery worker pool.
+    
+    Args:
+        batch_size (int): Number of resumes per analyze_resume_batch task
+        after_id (str, optional): Resume the scan after this resume ID
+    
+    Returns:
+        int: Number of batches dispatched
+    """
+    from resumes.mongo.storage import iter_resume_content_batches
+
+    dispatched = 0
+    for batch in iter_resume_content_batches(batch_size, {"_id": 1}, after_id):
+        analyze_resume_batch.delay([doc["_id"] for doc in batch])
+        dispatched += 1
+
+    logger.info(f"Dispatched {dispatched} bulk analysis batches")
+    return dispatched
@@ -0,0 +1,12 @@
+"""
+URLconf for tests: routes the async resume views regardless of RESUME_ASYNC_VIEWS.
+"""
+
+from django.urls import path
+
+from resumes.async_views import AsyncResumeAnalysisView, AsyncResumeContentView
+
+urlpatterns = [
+    path('resumes/<uuid:resume_id>/content/', AsyncResumeContentView.as_view(), name='async-content'),
+    path('resumes/<uuid:resume_id>/analyze/', AsyncResumeAnalysisView.as_view(), name='async-analyze'),
+]
@@ -1,3 +1,902 @@
-from django.test import TestCase
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from analytics.models import LogEntry
+from resumes.models import Resume
+from users.models import User
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ResumeUploadAPITests(APITestCase):
+    def setUp(self):
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.job_seeker)
+        self.url = reverse('resumes:upload')
+
+    def _upload(self):
+        return self.client.post(self.url, {
+            'title': 'My Resume',
+            'file': SimpleUploadedFile('cv.pdf', b'%PDF-1.4 test', content_type='application/pdf'),
+        }, format='multipart')
+
+    @override_settings(RESUME_PROCESSING_SYNC=False)
+    def test_upload_enqueues_processing_after_commit(self):
+        """Test that upload returns 202 and only publishes the task once the row is committed"""
+        with mock.patch('resumes.tasks.process_resume.apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                response = self._upload()
+
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            apply_async.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+
+        resume_id = response.data['resume_id']
+        self.assertEqual(Resume.objects.get(id=resume_id).status, Resume.Status.PENDING)
+        apply_async.assert_called_once_with(args=[resume_id], task_id=response.data['task_id'])
+
+    @override_settings(RESUME_PROCESSING_SYNC=True)
+    def test_upload_sync_mode_runs_pipeline_inline(self):
+        """Test that the synchronous fallback runs the pipeline in the request"""
+        with mock.patch('resumes.tasks.process_resume.apply') as apply:
+            response = self._upload()
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        apply.assert_called_once_with(args=[response.data['resume_id']], task_id=response.data['task_id'])
+
+    @override_settings(RESUME_MAX_BYTES=8)
+    def test_oversized_upload_rejected(self):
+        """Test that files over RESUME_MAX_BYTES fail validation before anything is stored or queued"""
+        with mock.patch('resumes.tasks.process_resume.apply_async') as apply_async:
+            response = self._upload()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Resume.objects.exists())
+        apply_async.assert_not_called()
+
+
+class ResumeListAPITests(APITestCase):
+    def setUp(self):
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resumes = [
+            Resume.objects.create(user=self.job_seeker, title=f'Resume {i}', file='cv.pdf', file_type='pdf')
+            for i in range(3)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.job_seeker)
+
+    def test_list_prefetches_scores_in_one_query(self):
+        """Test that overall scores for a page come from a single batched Mongo fetch"""
+        scores = {str(self.resumes[0].id): {'_id': str(self.resumes[0].id), 'overall_score': 7.5}}
+
+        with mock.patch('resumes.views.get_resume_analyses_by_resume_ids', return_value=scores) as batched, \
+                mock.patch('resumes.mongo.storage.get_resume_analysis_by_resume_id') as single:
+            response = self.client.get(reverse('resumes:resume-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        batched.assert_called_once()
+        single.assert_not_called()
+
+        by_id = {item['id']: item['overall_score'] for item in response.data['results']}
+        self.assertEqual(by_id[str(self.resumes[0].id)], 7.5)
+        self.assertIsNone(by_id[str(self.resumes[1].id)])
+
+
+class ResumeSkillIndexTests(APITestCase):
+    def setUp(self):
+        from companies.models import Company
+        from jobs.models import Job
+
+        self.recruiter = User.objects.create_user(
+            email='recruiter@example.com',
+            password='password123',
+            role='recruiter',
+            is_email_verified=True
+        )
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        company = Company.objects.create(name='Test Company')
+        company.recruiters.add(self.recruiter)
+        self.job = Job.objects.create(
+            company=company,
+            title='Backend Developer',
+            description='Build APIs',
+            skills_required=['Python', 'Django', 'PostgreSQL'],
+            status=Job.Status.APPROVED,
+        )
+        self.client = APIClient()
+
+    def _indexed_resume(self, title, text, visibility=Resume.Visibility.PUBLIC):
+        from resumes.services.document import ResumeDocument
+        from resumes.services.skill_index import ResumeSkillIndexService
+
+        resume = Resume.objects.create(
+            user=self.job_seeker, title=title, file='cv.pdf', file_type='pdf',
+            visibility=visibility, status=Resume.Status.COMPLETED,
+        )
+        ResumeSkillIndexService.index_resume(resume.id, ResumeDocument(text))
+        return resume
+
+    def test_candidates_ranked_by_match_score(self):
+        """Test that candidates come back best match first and private resumes are hidden"""
+        strong = self._indexed_resume('Strong', 'Python and Django developer, PostgreSQL admin.')
+        weak = self._indexed_resume('Weak', 'I know Python.')
+        self._indexed_resume('Private', 'Python Django PostgreSQL', visibility=Resume.Visibility.PRIVATE)
+        self._indexed_resume('Unrelated', 'Forklift operator.')
+
+        self.client.force_authenticate(user=self.recruiter)
+        response = self.client.get(reverse('job-candidates', args=[self.job.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        candidates = response.data['data']['candidates']
+        self.assertEqual([c['resume_id'] for c in candidates], [str(strong.id), str(weak.id)])
+        self.assertEqual(candidates[0]['match_score'], 100.0)
+        self.assertEqual(candidates[1]['match_score'], 33.33)
+
+    def test_candidates_forbidden_for_job_seekers(self):
+        """Test that job seekers cannot list candidates"""
+        self.client.force_authenticate(user=self.job_seeker)
+        response = self.client.get(reverse('job-candidates', args=[self.job.id]))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ResumeDocumentTests(SimpleTestCase):
+    text = (
+        "Jane Doe\nSenior Python Developer\n\nExperience\n"
+        "- Built REST APIs with Python, Django and PostgreSQL for 5 years.\n"
+        "- Led a team of four developers and mentored junior developers.\n\n"
+        "Education\nBSc Computer Science, University of Lisbon.\n\nSkills\nPython, Django, Docker, AWS"
+    )
+
+    def test_text_tokenized_once(self):
+        """Test that every view of the document shares a single tokenization pass"""
+        from nltk.tokenize import word_tokenize
+        from resumes.services.analyzer import ResumeAnalysisService
+        from resumes.services.document import ResumeDocument
+
+        with mock.patch('resumes.services.document.word_tokenize', wraps=word_tokenize) as tokenize:
+            doc = ResumeDocument(self.text)
+            ResumeAnalysisService.analyze_content_quality(doc)
+            ResumeAnalysisService.analyze_formatting(doc)
+            ResumeAnalysisService.analyze_ats_compatibility(doc)
+            doc.token_set
+
+        tokenize.assert_called_once_with(self.text)
+
+    def test_analysis_matches_separate_tokenization(self):
+        """Test that keywords and word count are those of the former per-analyzer tokenization"""
+        from nltk.probability import FreqDist
+        from nltk.tokenize import word_tokenize
+        from resumes.services.analyzer import ResumeAnalysisService
+        from resumes.services.document import ResumeDocument
+
+        doc = ResumeDocument(self.text)
+        previous_keywords = [
+            word for word, count in FreqDist(word_tokenize(self.text.lower())).most_common(20) if len(word) > 2
+        ]
+
+        self.assertEqual(ResumeAnalysisService.extract_keywords(doc), previous_keywords)
+        self.assertEqual(doc.word_count, len(word_tokenize(self.text)))
+
+
+class ResumeContentCacheTests(APITestCase):
+    databases = {'default', 'mysql'}
+
+    def setUp(self):
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resume = Resume.objects.create(
+            user=self.job_seeker, title='Duplicate', file='cv.pdf', file_type='pdf', content_hash='a' * 64,
+        )
+
+    def test_duplicate_upload_skips_extraction(self):
+        """Test that a cached content hash reuses the stored text and skills"""
+        from resumes.models import ResumeSkill
+        from resumes.services.parser import ResumeParserService
+
+        cached = {'_id': 'a' * 64, 'raw_text': 'Python developer', 'skills': ['python', 'developer']}
+
+        with mock.patch('resumes.services.parser.get_resume_cache_entry', return_value=cached), \
+                mock.patch('resumes.services.parser.insert_resume_content') as insert_content, \
+                mock.patch.object(ResumeParserService, 'extract_text') as extract_text:
+            self.assertEqual(ResumeParserService.parse_resume(str(self.resume.id)), str(self.resume.id))
+
+        extract_text.assert_not_called()
+        self.assertEqual(insert_content.call_args.args[0]['raw_text'], 'Python developer')
+        self.assertEqual(
+            set(ResumeSkill.objects.filter(resume=self.resume).values_list('skill', flat=True)),
+            {'python', 'developer'}
+        )
+
+    def test_truncated_text_not_cached(self):
+        """Test that text cut short by a limit is neither cached nor reused for later uploads"""
+        from resumes.services.parser import ExtractedText, ResumeParserService
+
+        stale = {'_id': 'a' * 64, 'raw_text': 'Python', 'skills': ['python'], 'truncated': True}
+
+        with mock.patch('resumes.services.parser.get_resume_cache_entry', return_value=stale), \
+                mock.patch('resumes.services.parser.insert_resume_content') as insert_content, \
+                mock.patch('resumes.services.parser.cache_resume_text') as cache_text, \
+                mock.patch.object(
+                    ResumeParserService, 'extract_text', return_value=ExtractedText('Python dev', True)
+                ) as extract_text:
+            ResumeParserService.parse_resume(str(self.resume.id))
+
+            extract_text.assert_called_once()
+            cache_text.assert_not_called()
+
+            extract_text.return_value = ExtractedText('Python developer')
+            ResumeParserService.parse_resume(str(self.resume.id))
+
+        cache_text.assert_called_once_with('a' * 64, 'Python developer', mock.ANY)
+        self.assertEqual(insert_content.call_args.args[0]['raw_text'], 'Python developer')
+
+
+class ResumeAnalysisCacheTests(APITestCase):
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resume = Resume.objects.create(user=self.job_seeker, title='CV', file='cv.pdf', file_type='pdf')
+        self.url = reverse('resumes:analyze', args=[self.resume.id])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.job_seeker)
+
+    def _get_score(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['overall_score']
+
+    def test_analysis_cached_until_rewritten(self):
+        """Test that analysis reads skip Mongo until a new analysis is stored"""
+        from resumes.mongo.storage import insert_resume_analysis
+
+        document = {'_id': str(self.resume.id), 'resume_id': str(self.resume.id), 'overall_score': 6.0}
+
+        with mock.patch('resumes.mongo.storage.resume_analysis_collection') as get_collection:
+            collection = get_collection.return_value
+            collection.find_one.return_value = document
+            self.assertEqual(self._get_score(), 6.0)
+            self.assertEqual(self._get_score(), 6.0)
+            self.assertEqual(collection.find_one.call_count, 1)
+
+            insert_resume_analysis({'resume_id': self.resume.id, 'overall_score': 8.0})
+            collection.find_one.return_value = {**document, 'overall_score': 8.0}
+            self.assertEqual(self._get_score(), 8.0)
+            self.assertEqual(collection.find_one.call_count, 2)
+
+
+class ResumeConditionalGetTests(APITestCase):
+    def setUp(self):
+        from datetime import datetime
+
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resume = Resume.objects.create(user=self.job_seeker, title='CV', file='cv.pdf', file_type='pdf')
+        self.document = {
+            '_id': str(self.resume.id), 'raw_text': 'Python developer', 'updated_at': datetime(2026, 1, 2, 3, 4, 5),
+        }
+        self.url = reverse('resumes:content', args=[self.resume.id])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.job_seeker)
+
+    def test_content_revalidation_skips_full_fetch(self):
+        """Test that a current ETag gets a 304 after reading only the updated_at stamp"""
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            collection = get_collection.return_value
+            collection.find_one.return_value = self.document
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['raw_text'], 'Python developer')
+            self.assertIn('no-cache', response['Cache-Control'])
+
+            collection.find_one.reset_mock()
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        collection.find_one.assert_called_once_with({'_id': str(self.resume.id)}, {'updated_at': 1})
+
+    def test_content_rewrite_changes_etag(self):
+        """Test that storing new content stamps a new updated_at, so old ETags no longer match"""
+        from resumes.mongo.storage import insert_resume_content
+
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            collection = get_collection.return_value
+            collection.find_one.return_value = self.document
+            etag = self.client.get(self.url)['ETag']
+
+            insert_resume_content({'resume_id': self.resume.id, 'raw_text': 'Go developer'})
+            collection.find_one.return_value = collection.replace_one.call_args.args[1]
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['raw_text'], 'Go developer')
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class MongoIndexRegistryTests(SimpleTestCase):
+    def test_ensure_indexes_creates_missing_and_reports_unknown(self):
+        """Test that only missing declared indexes are built and undeclared ones are dropped on request"""
+        from resumes.mongo.indexes import INDEXES, ensure_indexes
+        from resumes.mongo.storage import RESUME_ANALYSIS, RESUME_CONTENTS
+
+        collections = {name: mock.MagicMock() for name in INDEXES}
+        collections[RESUME_CONTENTS].index_information.return_value = {'_id_': {}, 'user_id': {}, 'legacy': {}}
+        collections[RESUME_ANALYSIS].index_information.return_value = {'_id_': {}}
+
+        with mock.patch('resumes.mongo.indexes.MongoDBClient.get_collection', side_effect=collections.get):
+            reports = {report.collection: report for report in ensure_indexes(drop_unknown=True)}
+
+        collections[RESUME_CONTENTS].create_indexes.assert_not_called()
+        collections[RESUME_CONTENTS].drop_index.assert_called_once_with('legacy')
+        self.assertEqual(reports[RESUME_CONTENTS].dropped, ['legacy'])
+
+        created = [index.document['name'] for index in collections[RESUME_ANALYSIS].create_indexes.call_args.args[0]]
+        self.assertEqual(created, reports[RESUME_ANALYSIS].created)
+        self.assertEqual(set(created), {'user_id_overall_score', 'overall_score', 'updated_at'})
+
+
+class MongoBulkWriteTests(SimpleTestCase):
+    def test_bulk_upsert_batches_and_reports_rejected_documents(self):
+        """Test that bulk inserts write in batches and map server write errors back to resume IDs"""
+        from pymongo.errors import BulkWriteError
+        from resumes.mongo.storage import insert_resume_contents_bulk
+
+        documents = [{'resume_id': f'00000000-0000-0000-0000-00000000000{i}', 'user_id': '7'} for i in range(5)]
+        rejected = BulkWriteError({
+            'nUpserted': 1, 'nMatched': 0,
+            'writeErrors': [{'index': 1, 'code': 2, 'errmsg': 'document too large'}],
+        })
+
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            collection = get_collection.return_value
+            collection.bulk_write.side_effect = [
+                mock.Mock(upserted_count=2, matched_count=0),
+                rejected,
+                mock.Mock(upserted_count=0, matched_count=1),
+            ]
+            result = insert_resume_contents_bulk(documents, batch_size=2)
+
+        self.assertEqual(collection.bulk_write.call_count, 3)
+        self.assertEqual(result.written, 4)
+        self.assertEqual(result.errors, {documents[3]['_id']: 'document too large'})
+        self.assertEqual(documents[0]['user_id'], 7)
+
+
+class BulkAnalysisTests(SimpleTestCase):
+    def setUp(self):
+        self.docs = [
+            {'_id': f'00000000-0000-0000-0000-00000000000{i}', 'user_id': 7, 'raw_text': text}
+            for i, text in enumerate(['Python developer', 'unparseable', 'Django developer'])
+        ]
+
+    @staticmethod
+    def _build_analysis(resume_id, user_id, raw_text):
+        if raw_text == 'unparseable':
+            raise ValueError('bad text')
+        return mock.Mock(dict=lambda: {'resume_id': resume_id, 'user_id': user_id, 'overall_score': 80})
+
+    def test_content_batches_stream_after_resume_id(self):
+        """Test that the corpus scan resumes after an ID, yields fixed-size batches and closes its cursor"""
+        from resumes.mongo.storage import iter_resume_content_batches
+
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            cursor = get_collection.return_value.find.return_value.sort.return_value
+            cursor.__iter__.return_value = iter(self.docs)
+            batches = list(iter_resume_content_batches(2, {'raw_text': 1}, after_id='abc'))
+
+        self.assertEqual(get_collection.return_value.find.call_args.args[0], {'_id': {'$gt': 'abc'}})
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        cursor.close.assert_called_once()
+
+    def test_analyze_all_in_process_drops_failures_and_logs_per_batch(self):
+        """Test that failed analyses are dropped, rejected writes are logged as errors, one log call per batch"""
+        from pymongo.errors import BulkWriteError
+        from analytics.models import LogEntry
+        from resumes.services.bulk_analyzer import BulkAnalysisService, CONTENT_PROJECTION
+
+        rejected = BulkWriteError({
+            'nUpserted': 0, 'nMatched': 0,
+            'writeErrors': [{'index': 0, 'code': 2, 'errmsg': 'document too large'}],
+        })
+
+        with mock.patch('resumes.services.bulk_analyzer.iter_resume_content_batches',
+                        return_value=iter([self.docs[:2], self.docs[2:]])) as iter_batches, \
+                mock.patch('resumes.services.bulk_analyzer.ResumeAnalysisService.build_analysis',
+                           side_effect=self._build_analysis), \
+                mock.patch('resumes.mongo.storage.resume_analysis_collection') as get_collection, \
+                mock.patch('resumes.services.bulk_analyzer.log_actions') as log_actions, \
+                mock.patch('resumes.services.bulk_analyzer.ProcessPoolExecutor') as pool:
+            get_collection.return_value.bulk_write.side_effect = [
+                mock.Mock(upserted_count=1, matched_count=0),
+                rejected,
+            ]
+            total = BulkAnalysisService.analyze_all(batch_size=2, workers=1, after_id='abc')
+
+        iter_batches.assert_called_once_with(2, CONTENT_PROJECTION, 'abc')
+        pool.assert_not_called()
+        self.assertEqual(total, 1)
+        self.assertEqual(log_actions.call_count, 2)
+
+        first, second = (call.args[0] for call in log_actions.call_args_list)
+        self.assertEqual(
+            [(e['object_id'], e['action']) for e in first], [(self.docs[0]['_id'], LogEntry.ActionType.ANALYZE)]
+        )
+        self.assertEqual(
+            [(e['object_id'], e['action']) for e in second], [(self.docs[2]['_id'], LogEntry.ActionType.ERROR)]
+        )
+        self.assertIn('document too large', second[0]['message'])
+
+    def test_analyze_all_uses_process_pool_for_workers(self):
+        """Test that more than one worker analyzes batches through a process pool"""
+        from resumes.mongo.storage import BulkUpsertResult
+        from resumes.services.bulk_analyzer import BulkAnalysisService, analyze_content_document
+
+        with mock.patch('resumes.services.bulk_analyzer.iter_resume_content_batches',
+                        return_value=iter([self.docs])), \
+                mock.patch('resumes.services.bulk_analyzer.ResumeAnalysisService.build_analysis',
+                           side_effect=self._build_analysis), \
+                mock.patch('resumes.services.bulk_analyzer.insert_resume_analyses_bulk',
+                           side_effect=lambda analyses: BulkUpsertResult(len(analyses), {})) as insert_bulk, \
+                mock.patch('resumes.services.bulk_analyzer.log_actions'), \
+                mock.patch('resumes.services.bulk_analyzer.ProcessPoolExecutor') as pool:
+            executor = pool.return_value.__enter__.return_value
+            executor.map.side_effect = lambda fn, docs, chunksize: map(fn, docs)
+            total = BulkAnalysisService.analyze_all(batch_size=40, workers=2)
+
+        pool.assert_called_once_with(max_workers=2)
+        executor.map.assert_called_once_with(analyze_content_document, self.docs, chunksize=5)
+        self.assertEqual(total, 2)
+        self.assertEqual(len(insert_bulk.call_args.args[0]), 2)
+
+    def test_bulk_task_fans_out_resume_id_batches(self):
+        """Test that the Celery entry point dispatches one batch task per streamed ID batch"""
+        from resumes.tasks import bulk_analyze_resumes
+
+        with mock.patch('resumes.mongo.storage.iter_resume_content_batches',
+                        return_value=iter([self.docs[:2], self.docs[2:]])) as iter_batches, \
+                mock.patch('resumes.tasks.analyze_resume_batch.delay') as delay:
+            self.assertEqual(bulk_analyze_resumes(batch_size=2, after_id='abc'), 2)
+
+        iter_batches.assert_called_once_with(2, {'_id': 1}, 'abc')
+        self.assertEqual(
+            [call.args[0] for call in delay.call_args_list],
+            [[self.docs[0]['_id'], self.docs[1]['_id']], [self.docs[2]['_id']]]
+        )
+
+    def test_batch_task_analyzes_given_resumes(self):
+        """Test that a batch task fetches the contents of its IDs in one query and stores their analyses"""
+        from resumes.tasks import analyze_resume_batch
+
+        with mock.patch('resumes.services.bulk_analyzer.get_resume_contents_by_resume_ids',
+                        return_value=self.docs) as get_contents, \
+                mock.patch('resumes.services.bulk_analyzer.BulkAnalysisService.store_batch',
+                           return_value=2) as store_batch, \
+                mock.patch('resumes.services.bulk_analyzer.ResumeAnalysisService.build_analysis',
+                           side_effect=self._build_analysis):
+            self.assertEqual(analyze_resume_batch([doc['_id'] for doc in self.docs]), 2)
+
+        get_contents.assert_called_once()
+        self.assertEqual(
+            [analysis['resume_id'] for analysis in store_batch.call_args.args[0]],
+            [self.docs[0]['_id'], self.docs[2]['_id']]
+        )
+
+    def test_reanalyze_command_runs_locally_or_queues(self):
+        """Test that the command runs the bulk analysis in-process, or queues it with --async"""
+        from django.core.management import call_command
+
+        with mock.patch('resumes.management.commands.reanalyze_resumes.BulkAnalysisService.analyze_all',
+                        return_value=3) as analyze_all, \
+                mock.patch('resumes.management.commands.reanalyze_resumes.bulk_analyze_resumes.delay') as delay:
+            call_command(
+                'reanalyze_resumes', '--batch-size', '10', '--workers', '0', '--after', 'abc', stdout=mock.Mock()
+            )
+            analyze_all.assert_called_once_with(batch_size=10, workers=1, after_id='abc')
+            delay.assert_not_called()
+
+            call_command('reanalyze_resumes', '--async', stdout=mock.Mock())
+            delay.assert_called_once_with(batch_size=500, after_id=None)
+
+
+@override_settings(RESUME_TEXT_COMPRESSION='zlib', RESUME_TEXT_COMPRESSION_MIN_LENGTH=10)
+class ResumeTextCompressionTests(SimpleTestCase):
+    text = 'Senior Python developer. ' * 40
+
+    def test_content_text_compressed_transparently(self):
+        """Test that long texts are stored compressed and read back as raw_text"""
+        from resumes.mongo.storage import get_resume_content_by_resume_id, insert_resume_content
+
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            collection = get_collection.return_value
+            insert_resume_content({'resume_id': '00000000-0000-0000-0000-000000000001', 'raw_text': self.text})
+
+            stored = collection.replace_one.call_args.args[1]
+            self.assertNotIn('raw_text', stored)
+            self.assertEqual(stored['raw_text_codec'], 'zlib')
+            self.assertLess(len(stored['raw_text_compressed']), len(self.text))
+
+            collection.find_one.return_value = dict(stored)
+            document = get_resume_content_by_resume_id(stored['_id'], projection={'raw_text': 1})
+
+        self.assertEqual(document['raw_text'], self.text)
+        self.assertNotIn('raw_text_compressed', document)
+        self.assertEqual(
+            collection.find_one.call_args.args[1],
+            {'raw_text': 1, 'raw_text_compressed': 1, 'raw_text_codec': 1}
+        )
+
+    def test_recompress_rewrites_plain_documents(self):
+        """Test that recompression converts plain texts in place and keeps updated_at as a guard"""
+        from resumes.mongo.storage import recompress_resume_contents
+
+        plain = {'_id': 'a', 'raw_text': self.text, 'updated_at': 'stamp'}
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_collection:
+            collection = get_collection.return_value
+            collection.find.return_value.sort.return_value = mock.MagicMock(__iter__=lambda _: iter([plain]))
+            collection.bulk_write.return_value.modified_count = 1
+            self.assertEqual(list(recompress_resume_contents()), [1])
+
+        operation = collection.bulk_write.call_args.args[0][0]
+        self.assertEqual(operation._filter, {'_id': 'a', 'updated_at': 'stamp'})
+        self.assertEqual(operation._doc['$unset'], {'raw_text': ''})
+        self.assertEqual(set(operation._doc['$set']), {'raw_text_compressed', 'raw_text_codec'})
+
+    def test_content_hash_cache_text_compressed_transparently(self):
+        """Test that the content-hash cache stores texts compressed and reads them back as raw_text"""
+        from resumes.mongo.storage import cache_resume_text, get_resume_cache_entry
+
+        with mock.patch('resumes.mongo.storage.resume_cache_collection') as get_collection:
+            collection = get_collection.return_value
+            cache_resume_text('a' * 64, self.text, {'python'})
+
+            update = collection.update_one.call_args.args[1]
+            self.assertEqual(update['$unset'], {'raw_text': ''})
+            self.assertEqual(update['$set']['raw_text_codec'], 'zlib')
+
+            collection.find_one.return_value = {'_id': 'a' * 64, **update['$set']}
+            entry = get_resume_cache_entry('a' * 64, {'raw_text': 1, 'skills': 1})
+
+        self.assertEqual(entry['raw_text'], self.text)
+        self.assertEqual(entry['skills'], ['python'])
+        self.assertIn('raw_text_compressed', collection.find_one.call_args.args[1])
+
+    def test_compress_command_covers_contents_and_cache(self):
+        """Test that the recompression command rewrites both collections that store resume text"""
+        from django.core.management import call_command
+
+        with mock.patch('resumes.mongo.storage.resume_content_collection') as get_contents, \
+                mock.patch('resumes.mongo.storage.resume_cache_collection') as get_cache:
+            for get_collection in (get_contents, get_cache):
+                collection = get_collection.return_value
+                plain = {'_id': 'a', 'raw_text': self.text}
+                collection.find.return_value.sort.return_value = mock.MagicMock(
+                    __iter__=lambda _, plain=plain: iter([plain])
+                )
+                collection.bulk_write.return_value.modified_count = 1
+            call_command('compress_resume_texts', stdout=mock.Mock())
+
+        get_contents.return_value.bulk_write.assert_called_once()
+        get_cache.return_value.bulk_write.assert_called_once()
+
+
+@override_settings(ROOT_URLCONF='resumes.test_urls')
+class AsyncResumeViewTests(TestCase):
+    def setUp(self):
+        from datetime import datetime
+
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.other = User.objects.create_user(
+            email='other@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resume = Resume.objects.create(user=self.job_seeker, title='CV', file='cv.pdf', file_type='pdf')
+        self.document = {
+            '_id': str(self.resume.id), 'raw_text': 'Python developer', 'updated_at': datetime(2026, 1, 2, 3, 4, 5),
+        }
+        self.url = reverse('async-content', args=[self.resume.id])
+
+    def _auth(self, user):
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        return {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+    async def _get_content(self, **headers):
+        from django.test import AsyncClient
+
+        return await AsyncClient().get(self.url, headers=headers)
+
+    async def test_async_content_view_serves_and_revalidates(self):
+        """Test that the async content view returns the usual envelope and honors If-None-Match"""
+        with mock.patch('resumes.mongo.async_storage.resume_content_collection') as get_collection:
+            get_collection.return_value.find_one = mock.AsyncMock(return_value=self.document)
+            response = await self._get_content(**self._auth(self.job_seeker))
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            body = response.json()
+            self.assertTrue(body['success'])
+            self.assertEqual(body['data']['raw_text'], 'Python developer')
+
+            response = await self._get_content(**{'If-None-Match': response['ETag']}, **self._auth(self.job_seeker))
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    # Error responses go through DRF's exception handler, which marks the test's transaction
+    # for rollback (async views have no request transaction), so each test makes one of them
+
+    async def test_async_content_view_requires_authentication(self):
+        """Test that the async view answers anonymous users with DRF's 401 and challenge header"""
+        response = await self._get_content()
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('WWW-Authenticate', response)
+        self.assertEqual(response.json()['error']['code'], 'not_authenticated')
+
+    async def test_async_content_view_checks_ownership(self):
+        """Test that the async view rejects other job seekers like the sync one"""
+        response = await self._get_content(**self._auth(self.other))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(response.json()['success'])
+
+    async def test_async_view_runs_drf_throttling(self):
+        """Test that the async view goes through APIView.initial, throttles included"""
+        from rest_framework.throttling import BaseThrottle
+
+        class DenyAll(BaseThrottle):
+            def allow_request(self, request, view):
+                return False
+
+        from resumes.async_views import AsyncResumeContentView
+
+        with mock.patch.object(AsyncResumeContentView, 'throttle_classes', [DenyAll]):
+            response = await self._get_content(**self._auth(self.job_seeker))
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response.json()['error']['code'], 'throttled')
+
+    def test_async_analyze_view_exempt_from_csrf(self):
+        """Test that a JWT-authenticated POST reaches the async view, as it does the CSRF-exempt APIView"""
+        from django.test import Client
+
+        client = Client(enforce_csrf_checks=True)
+        with mock.patch('resumes.async_views.ResumeAnalysisService.analyze_resume') as analyze_resume:
+            response = client.post(
+                reverse('async-analyze', args=[self.resume.id]), headers=self._auth(self.job_seeker)
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        analyze_resume.assert_called_once_with(self.resume.id)
+
+
+class PdfParallelExtractionTests(SimpleTestCase):
+    @staticmethod
+    def _page_range(delays=None, truncate_at=None, blocked=None):
+        """Stand-in for extract_page_range; later ranges finish first unless told otherwise"""
+        import time
+        from resumes.services.pdf_extraction import PageText
+
+        def extract_page_range(path, start, stop, page_timeout=None, deadline=None):
+            if blocked is not None and start in blocked:
+                blocked[start].wait(5)
+            time.sleep((delays or {}).get(start, 0))
+            if truncate_at is not None and start <= truncate_at < stop:
+                return [PageText(number, f'p{number}', 0) for number in range(start + 1, truncate_at + 1)], True
+            return [PageText(number, f'p{number}', 0) for number in range(start + 1, stop + 1)], False
+        return extract_page_range
+
+    def _parallel(self, page_range, page_count=10, workers=2):
+        from concurrent.futures import ThreadPoolExecutor
+        from resumes.services.pdf_extraction import extract_pages_parallel
+
+        # Threads stand in for processes: the stand-in can't be pickled, the pool logic is the same
+        with mock.patch('resumes.services.pdf_extraction.ProcessPoolExecutor', ThreadPoolExecutor), \
+                mock.patch('resumes.services.pdf_extraction.extract_page_range', page_range):
+            return extract_pages_parallel('cv.pdf', page_count, workers)
+
+    def test_pages_returned_in_order_across_ranges(self):
+        """Test that ranges finishing out of order still produce the pages in page order"""
+        pages, truncated = self._parallel(self._page_range(delays={0: 0.05, 3: 0.02}))
+
+        self.assertFalse(truncated)
+        self.assertEqual([page.number for page in pages], list(range(1, 11)))
+
+    def test_truncated_range_drops_later_ranges_without_waiting(self):
+        """Test that a range running out of time keeps earlier pages and doesn't wait for dropped ranges"""
+        import threading
+        import time
+
+        release = threading.Event()
+        started = time.monotonic()
+        pages, truncated = self._parallel(self._page_range(truncate_at=4, blocked={6: release}))
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertTrue(truncated)
+        self.assertEqual([page.text for page in pages], ['p1', 'p2', 'p3', 'p4'])
+        self.assertLess(elapsed, 2)
+
+    @override_settings(RESUME_PDF_PARALLEL_PAGE_THRESHOLD=20, RESUME_PDF_PARALLEL_WORKERS=4)
+    def test_parallel_mode_needs_threshold_local_file_and_fork(self):
+        """Test that only large local PDFs in processes allowed to fork use the pool"""
+        from resumes.services.parser import ResumeParserService
+
+        self.assertTrue(ResumeParserService.use_parallel_extraction('cv.pdf', 20))
+        self.assertFalse(ResumeParserService.use_parallel_extraction('cv.pdf', 19))
+        self.assertFalse(ResumeParserService.use_parallel_extraction(None, 50))
+        with mock.patch('resumes.services.parser.can_fork_workers', return_value=False):
+            self.assertFalse(ResumeParserService.use_parallel_extraction('cv.pdf', 50))
+
+    def _extract_pdf(self, page_count, max_pages=None, can_fork=True, parallel_result=None):
+        from types import SimpleNamespace
+        from resumes.services.parser import ResumeParserService
+
+        reader = SimpleNamespace(pages=[
+            SimpleNamespace(extract_text=lambda number=number: f'p{number} ') for number in range(1, page_count + 1)
+        ])
+        with override_settings(RESUME_PDF_PARALLEL_PAGE_THRESHOLD=20, RESUME_PDF_PARALLEL_WORKERS=4), \
+                mock.patch('resumes.services.parser.PyPDF2') as pypdf, \
+                mock.patch('resumes.services.parser.can_fork_workers', return_value=can_fork), \
+                mock.patch('resumes.services.parser.extract_pages_parallel', **parallel_result) as parallel:
+            pypdf.PdfReader.return_value = reader
+            extracted = ResumeParserService.extract_text_from_pdf(mock.Mock(), max_pages, path='cv.pdf')
+        return extracted, parallel
+
+    def test_daemon_worker_extracts_serially(self):
+        """Test that a process that can't start a pool (daemon Celery child) extracts the pages itself"""
+        extracted, parallel = self._extract_pdf(30, can_fork=False, parallel_result={})
+
+        parallel.assert_not_called()
+        self.assertFalse(extracted.truncated)
+        self.assertTrue(extracted.text.startswith('p1 p2'))
+        self.assertTrue(extracted.text.endswith('p30'))
+
+    def test_pool_failure_falls_back_to_serial(self):
+        """Test that a pool that can't run leaves the PDF to serial extraction"""
+        from concurrent.futures.process import BrokenProcessPool
+
+        extracted, parallel = self._extract_pdf(30, parallel_result={'side_effect': BrokenProcessPool()})
+
+        parallel.assert_called_once()
+        self.assertTrue(extracted.text.endswith('p30'))
+
+    def test_page_limit_applies_to_parallel_extraction(self):
+        """Test that the pool is only given the pages under the limit and the text is flagged truncated"""
+        from resumes.services.pdf_extraction import PageText
+
+        pages = [PageText(number, f'p{number} ', 0) for number in range(1, 26)]
+        extracted, parallel = self._extract_pdf(30, max_pages=25, parallel_result={'return_value': (pages, False)})
+
+        self.assertEqual(parallel.call_args.args[:3], ('cv.pdf', 25, 4))
+        self.assertTrue(extracted.truncated)
+        self.assertTrue(extracted.text.endswith('p25'))
+
+
+class ResumeExtractionLimitTests(APITestCase):
+    databases = {'default', 'mysql'}
+
+    def setUp(self):
+        self.job_seeker = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.resume = Resume.objects.create(
+            user=self.job_seeker, title='Huge', file='cv.pdf', file_type='pdf',
+        )
+
+    def test_slow_page_stops_extraction_with_partial_text(self):
+        """Test that a page running past its budget keeps the earlier pages and flags truncation"""
+        import time
+        from types import SimpleNamespace
+        from resumes.services.pdf_extraction import extract_pages
+
+        def page(text, delay=0):
+            def extract_text():
+                time.sleep(delay)
+                return text
+            return SimpleNamespace(extract_text=extract_text)
+
+        reader = SimpleNamespace(pages=[page('one'), page('two', delay=5), page('three')])
+        pages, truncated = extract_pages(reader, 0, 3, page_timeout=0.2)
+
+        self.assertTrue(truncated)
+        self.assertEqual([p.text for p in pages], ['one'])
+
+    def test_truncated_text_completes_resume(self):
+        """Test that partial text is stored with the truncated flag instead of failing the resume"""
+        from resumes.services.parser import ExtractedText, ResumeParserService
+
+        with mock.patch('resumes.services.parser.insert_resume_content') as insert_content, \
+                mock.patch.object(ResumeParserService, 'extract_text', return_value=ExtractedText('Python', True)):
+            self.assertEqual(ResumeParserService.parse_resume(str(self.resume.id)), str(self.resume.id))
+
+        self.assertTrue(insert_content.call_args.args[0]['truncated'])
+        self.assertTrue(LogEntry.objects.filter(
+            object_id=str(self.resume.id), message='Resume parsed with truncated text.'
+        ).exists())
+        self.resume.refresh_from_db()
+        self.assertEqual(self.resume.status, Resume.Status.COMPLETED)
+        self.assertTrue(self.resume.is_truncated)
+        self.assertEqual(self.resume.extraction_attempts, 0)
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp(), RESUME_PDF_PARALLEL_PAGE_THRESHOLD=None)
+    def test_stored_file_limits_stop_extraction(self):
+        """Test that oversized stored files are refused and pages past RESUME_MAX_PAGES are never read"""
+        from types import SimpleNamespace
+        from resumes.services.parser import ExtractedText, ResumeParserService
+
+        self.resume.file = SimpleUploadedFile('cv.pdf', b'%PDF-1.4 test', content_type='application/pdf')
+        self.resume.save()
+        pages = [mock.Mock(**{'extract_text.return_value': f'p{number} '}) for number in range(1, 6)]
+
+        with mock.patch('resumes.services.parser.PyPDF2') as pypdf:
+            pypdf.PdfReader.return_value = SimpleNamespace(pages=pages)
+
+            with override_settings(RESUME_MAX_BYTES=8), self.assertRaises(ValueError):
+                ResumeParserService.extract_text(self.resume)
+            pypdf.PdfReader.assert_not_called()
+
+            with override_settings(RESUME_MAX_BYTES=1024, RESUME_MAX_PAGES=2):
+                extracted = ResumeParserService.extract_text(self.resume)
+
+        self.assertEqual(extracted, ExtractedText('p1 p2', True))
+        pages[2].extract_text.assert_not_called()
+
+    @override_settings(RESUME_MAX_EXTRACTION_ATTEMPTS=2)
+    def test_gives_up_after_unfinished_attempts(self):
+        """Test that a file that keeps killing the worker is marked failed without re-extracting"""
+        from resumes.services.parser import ResumeParserService
+
+        Resume.objects.filter(id=self.resume.id).update(extraction_attempts=2, status=Resume.Status.PROCESSING)
+
+        with mock.patch.object(ResumeParserService, 'extract_text') as extract_text:
+            self.assertIsNone(ResumeParserService.parse_resume(str(self.resume.id)))
+
+        extract_text.assert_not_called()
+        self.resume.refresh_from_db()
+        self.assertEqual(self.resume.status, Resume.Status.FAILED)
 
-# Create your tests here.
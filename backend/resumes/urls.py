@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 
 from resumes.views import (
@@ -8,6 +9,13 @@ from resumes.views import (
     ResumeDetailView,
 )
 
+if getattr(settings, 'RESUME_ASYNC_VIEWS', False):
+    # Under ASGI, content and analysis polling awaits MongoDB instead of blocking a thread
+    from resumes.async_views import (
+        AsyncResumeContentView as ResumeContentView,
+        AsyncResumeAnalysisView as ResumeAnalysisView,
+    )
+
 app_name = "resumes"
 
 urlpatterns = [
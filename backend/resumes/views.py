@@ -1,3 +1,5 @@
+import hashlib
+
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
@@ -9,9 +11,14 @@ from resumes.serializers import (
     ResumeContentSerializer,
     ResumeActionResponseSerializer,
 )
-from resumes.mongo.storage import get_resume_content_by_resume_id, get_resume_analysis_by_resume_id
+from resumes.mongo.storage import (
+    get_resume_content_by_resume_id,
+    get_resume_analysis_by_resume_id,
+    get_resume_analyses_by_resume_ids,
+)
 from resumes.services.analyzer import ResumeAnalysisService
-from resumes.tasks import process_resume
+from resumes.tasks import dispatch_resume_processing
+from core.mixins.conditional import ConditionalGetMixin
 from core.permissions import IsResumeOwnerOrRecruiterOrAdmin
 from core.serializers.response import SuccessResponseSerializer, ErrorResponseSerializer
 
@@ -41,6 +48,23 @@ class ResumeListView(generics.ListAPIView):
             return Resume.objects.filter(visibility=Resume.Visibility.PUBLIC)
         return Resume.objects.filter(user=user)
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        resumes = page if page is not None else list(queryset)
+
+        # Fetch scores for the whole page in one Mongo query instead of one per row
+        context = self.get_serializer_context()
+        context['analyses'] = get_resume_analyses_by_resume_ids(
+            [resume.id for resume in resumes],
+            projection={"overall_score": 1},
+        )
+        serializer = self.get_serializer(resumes, many=True, context=context)
+
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
 
 @extend_schema(
     tags=common_tags,
@@ -65,7 +89,7 @@ class ResumeDetailView(generics.RetrieveUpdateAPIView):
     tags=common_tags,
     request=ResumeUploadSerializer,
     responses={
-        201: SuccessResponseSerializer,
+        202: SuccessResponseSerializer,
         400: ErrorResponseSerializer,
         401: ErrorResponseSerializer,
         403: ErrorResponseSerializer,
@@ -93,6 +117,12 @@ class ResumeUploadView(generics.CreateAPIView):
             return Response({"detail": "Unsupported file type. Only PDF and DOCX allowed."},
                             status=status.HTTP_400_BAD_REQUEST)
 
+        # Stream the upload through SHA-256 so duplicate files can reuse earlier parse results
+        hasher = hashlib.sha256()
+        for chunk in file.chunks():
+            hasher.update(chunk)
+        file.seek(0)
+
         resume = Resume.objects.create(
             user=request.user,
             title=title,
@@ -100,14 +130,20 @@ class ResumeUploadView(generics.CreateAPIView):
             file_type=extension,
             original_filename=file.name,
             visibility=visibility,
-            status=Resume.Status.PROCESSING,
+            status=Resume.Status.PENDING,
+            content_hash=hasher.hexdigest(),
         )
 
-        process_resume(str(resume.id))
+        task_id = dispatch_resume_processing(resume.id)
 
         return Response(
-            {"resume_id": str(resume.id), "detail": "Resume uploaded and processing started."},
-            status=status.HTTP_201_CREATED
+            {
+                "resume_id": str(resume.id),
+                "task_id": task_id,
+                "status": resume.status,
+                "detail": "Resume uploaded and queued for processing.",
+            },
+            status=status.HTTP_202_ACCEPTED
         )
 
 
@@ -122,7 +158,7 @@ class ResumeUploadView(generics.CreateAPIView):
         500: ErrorResponseSerializer,
     }
 )
-class ResumeContentView(generics.GenericAPIView):
+class ResumeContentView(ConditionalGetMixin, generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated, IsResumeOwnerOrRecruiterOrAdmin]
 
     def get(self, request, resume_id, *args, **kwargs):
@@ -130,12 +166,17 @@ class ResumeContentView(generics.GenericAPIView):
             resume = Resume.objects.get(id=resume_id)
             self.check_object_permissions(request, resume)
 
+            # Check the client's copy against the stamp alone before reading the full text
+            stamp = get_resume_content_by_resume_id(str(resume.id), projection={"updated_at": 1})
+            if not_modified := self.not_modified(request, stamp):
+                return not_modified
+
             content_doc = get_resume_content_by_resume_id(str(resume.id))
             if not content_doc:
                 return Response({"detail": "Parsed resume content not available."}, status=status.HTTP_404_NOT_FOUND)
 
             serializer = ResumeContentSerializer(content_doc)
-            return Response(serializer.data)
+            return self.add_validators(Response(serializer.data), content_doc)
         except Resume.DoesNotExist:
             return Response({"detail": "Resume not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -151,7 +192,7 @@ class ResumeContentView(generics.GenericAPIView):
         500: ErrorResponseSerializer,
     }
 )
-class ResumeAnalysisView(generics.GenericAPIView):
+class ResumeAnalysisView(ConditionalGetMixin, generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated, IsResumeOwnerOrRecruiterOrAdmin]
 
     def get(self, request, resume_id, *args, **kwargs):
@@ -159,11 +200,15 @@ class ResumeAnalysisView(generics.GenericAPIView):
             resume = Resume.objects.get(id=resume_id)
             self.check_object_permissions(request, resume)
 
+            # Analyses are small and usually served from the cache, so no separate stamp lookup
             analysis_doc = get_resume_analysis_by_resume_id(str(resume.id))
             if not analysis_doc:
                 return Response({"detail": "Resume analysis not found."}, status=status.HTTP_404_NOT_FOUND)
 
-            return Response(analysis_doc)
+            if not_modified := self.not_modified(request, analysis_doc):
+                return not_modified
+
+            return self.add_validators(Response(analysis_doc), analysis_doc)
         except Resume.DoesNotExist:
             return Response({"detail": "Resume not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -68,14 +68,35 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
 
-    def save(self, *args, **kwargs):
-        if self.pk:
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored email so save() can detect a change without querying
+        instance._loaded_email = instance.__dict__.get('email')
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or 'email' in fields:
+            self._loaded_email = self.email
 
-            old = User.objects.get(pk=self.pk)
-            if old.email != self.email:
+    def save(self, *args, **kwargs):
+        if self.pk and not self._state.adding:
+            loaded_email = getattr(self, '_loaded_email', None)
+            if loaded_email is None:
+                # Email was deferred when the user was loaded
+                loaded_email = User.objects.filter(pk=self.pk).values_list('email', flat=True).first()
 
+            if loaded_email != self.email:
                 self.is_email_verified = False
+                update_fields = kwargs.get('update_fields')
+                if update_fields is not None and 'email' in update_fields:
+                    kwargs['update_fields'] = {*update_fields, 'is_email_verified'}
+
         super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'email' in update_fields:
+            self._loaded_email = self.email
     
     @property
     def is_job_seeker(self):
@@ -1,3 +1,46 @@
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
 
-# Create your tests here.
+from users.models import User
+
+
+class UserSaveTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='jobseeker@example.com',
+            password='password123',
+            role='job_seeker',
+            is_email_verified=True
+        )
+        self.client = APIClient()
+
+    def test_login_selects_and_updates_once(self):
+        """Test that obtaining a token only loads the user and updates last_login"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('token_obtain_pair'), {
+                'email': 'jobseeker@example.com',
+                'password': 'password123',
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # ATOMIC_REQUESTS adds savepoints around the view; only count statements on users
+        statements = [q['sql'].split()[0] for q in queries if 'users_user' in q['sql']]
+        self.assertEqual(statements, ['SELECT', 'UPDATE'])
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        self.assertTrue(self.user.is_email_verified)
+
+    def test_email_change_resets_verification(self):
+        """Test that changing the email still clears the verified flag, without a lookup query"""
+        user = User.objects.get(pk=self.user.pk)
+        user.email = 'new@example.com'
+
+        with self.assertNumQueries(1):
+            user.save(update_fields=['email'])
+
+        user.refresh_from_db()
+        self.assertEqual(user.email, 'new@example.com')
+        self.assertFalse(user.is_email_verified)